@@ -0,0 +1,647 @@
+"""
+Заміри швидкодії для лабораторних.
+Запуск: python benchmarks.py [назва ...]   (без аргументів - усі)
+"""
+import sys
+import math
+import time
+
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QPainterPath
+
+import numpy as np
+
+from flange_math import FlangeGeometry, generate_batch
+
+
+def timeit(func, repeat=5, min_time=0.2):
+    """Найкращий час одного виклику (с)"""
+    best = float('inf')
+    for _ in range(repeat):
+        count = 0
+        start = time.perf_counter()
+        while True:
+            func()
+            count += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time or elapsed > 5 * best:
+                break
+        best = min(best, elapsed / count)
+        if elapsed > 2.0:
+            break  # Повільний варіант - одного заміру достатньо
+    return best
+
+
+# ==========================================
+# 1. ФЛАНЕЦЬ: БУЛЕВІ ОПЕРАЦІЇ vs АНАЛІТИКА
+# ==========================================
+def boolean_flange_path(center_d, bcd_d, hole_d, corner_r, n_lobes=3):
+    """Стара побудова з lab1 (united/subtracted), узагальнена на N вух"""
+    r_bcd = bcd_d / 2.0
+    centers = []
+    for i in range(n_lobes):
+        rad = math.pi / 2 + 2 * math.pi * i / n_lobes
+        centers.append(QPointF(r_bcd * math.cos(rad), r_bcd * math.sin(rad)))
+
+    body_path = QPainterPath()
+    for c in centers:
+        p = QPainterPath()
+        p.addEllipse(c, corner_r, corner_r)
+        body_path = body_path.united(p)
+
+    for i in range(n_lobes):
+        c1 = centers[i]
+        c2 = centers[(i + 1) % n_lobes]
+        vec = c2 - c1
+        length = math.sqrt(vec.x() ** 2 + vec.y() ** 2)
+        if length == 0: continue
+        norm = QPointF(-vec.y(), vec.x()) / length * corner_r
+        rect_poly = QPainterPath()
+        rect_poly.moveTo(c1 + norm)
+        rect_poly.lineTo(c2 + norm)
+        rect_poly.lineTo(c2 - norm)
+        rect_poly.lineTo(c1 - norm)
+        rect_poly.closeSubpath()
+        body_path = body_path.united(rect_poly)
+
+    poly_path = QPainterPath()
+    poly_path.moveTo(centers[0])
+    for c in centers[1:]:
+        poly_path.lineTo(c)
+    poly_path.closeSubpath()
+    body_path = body_path.united(poly_path)
+
+    holes_path = QPainterPath()
+    holes_path.addEllipse(QPointF(0, 0), center_d / 2, center_d / 2)
+    for c in centers:
+        holes_path.addEllipse(c, hole_d / 2, hole_d / 2)
+
+    final_path = body_path.subtracted(holes_path)
+    final_path.setFillRule(Qt.FillRule.OddEvenFill)
+    return final_path
+
+
+def bench_flange_contour(full=False):
+    """
+    Булевий варіант при N = 1000 рахується ~10 хвилин, тому в цьому рядку
+    він лише з full=True (назва "flange_contour_full"); решта стовпців - завжди.
+    """
+    from lab1 import contour_to_path
+
+    print("Фланець: булеві операції vs аналітичний контур")
+    print(f"{'N':>6} {'boolean, мс':>14} {'analytic path, мс':>18} {'numpy flatten, мс':>18} {'прискорення':>12}")
+    for n in (3, 12, 100, 1000):
+        # BCD росте з N, щоб вуха не злипались
+        bcd = max(200.0, n * 40.0)
+
+        t_path = timeit(lambda: contour_to_path(FlangeGeometry.build(90, bcd, 28, 40, n)))
+        t_flat = timeit(lambda: FlangeGeometry.flatten(FlangeGeometry.build(90, bcd, 28, 40, n), 0.25))
+        if n < 1000 or full:
+            t_bool = timeit(lambda: boolean_flange_path(90, bcd, 28, 40, n), repeat=3)
+            print(f"{n:>6} {t_bool * 1e3:>14.3f} {t_path * 1e3:>18.3f} {t_flat * 1e3:>18.3f} {t_bool / t_path:>11.1f}x")
+        else:
+            print(f"{n:>6} {'—':>14} {t_path * 1e3:>18.3f} {t_flat * 1e3:>18.3f} {'—':>12}")
+
+
+def random_flange_params(m, seed=0):
+    """Випадкові допустимі рядки (D центр, BCD, d отворів, R кутів)"""
+    rng = np.random.default_rng(seed)
+    return np.column_stack((
+        rng.uniform(60, 100, m), rng.uniform(180, 260, m),
+        rng.uniform(15, 30, m), rng.uniform(30, 50, m),
+    ))
+
+
+def bench_flange_batch():
+    print("Пакетна генерація фланців (деталей/с)")
+    print(f"{'M':>8} {'1 процес':>12} {'пул процесів':>14} {'точок':>10}")
+    for m in (10_000, 100_000):
+        params = random_flange_params(m)
+        start = time.perf_counter()
+        batch = generate_batch(params, workers=1)
+        t_serial = time.perf_counter() - start
+        start = time.perf_counter()
+        generate_batch(params)
+        t_pool = time.perf_counter() - start
+        print(f"{m:>8} {m / t_serial:>12.0f} {m / t_pool:>14.0f} {len(batch.points):>10}")
+
+
+def bench_flange_export():
+    """Пікова RSS - ru_maxrss процесу (кБ у Linux); приріст показує, що документ не тримається в пам'яті"""
+    import os
+    import resource
+    import tempfile
+    from flange_export import FlangeExporter
+
+    print("Потоковий експорт фланців")
+    print(f"{'формат':>7} {'M':>8} {'деталей/с':>10} {'МБ файлу':>9} {'пік RSS, МБ':>12} {'приріст, МБ':>12}")
+    for m in (10_000, 100_000):
+        params = random_flange_params(m)
+        for fmt in ("dxf", "svg"):
+            rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            with tempfile.NamedTemporaryFile("w", suffix="." + fmt, delete=False) as f:
+                exporter = FlangeExporter(params)
+                start = time.perf_counter()
+                exporter.write_dxf(f) if fmt == "dxf" else exporter.write_svg(f)
+                elapsed = time.perf_counter() - start
+            size = os.path.getsize(f.name) / 2 ** 20
+            os.unlink(f.name)
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"{fmt:>7} {m:>8} {m / elapsed:>10.0f} {size:>9.1f} {rss:>12.1f} {rss - rss_before:>12.1f}")
+
+
+def bench_flange_nesting():
+    """Пошук ґратки не залежить від K; перевірка - SAP + точна відстань ядер"""
+    from flange_mass import FlangeMass
+    from flange_nesting import FlangeNesting
+
+    print("Розкрій листа 3000 мм, зазор 5 мм")
+    print(f"{'N':>3} {'K':>6} {'розкладка, с':>13} {'перевірка, с':>13} {'перетинів':>10} {'заповнення':>11}")
+    for n_lobes, params in ((3, (90, 200, 28, 40)), (4, (60, 250, 20, 35)), (5, (50, 150, 20, 30))):
+        area = FlangeMass.properties(FlangeGeometry.build(*params, n_lobes))["area"]
+        for k in (1_000, 5_000):
+            nesting = FlangeNesting(params, n_lobes)
+            start = time.perf_counter()
+            layout = nesting.layout(k, 3000.0)
+            t_layout = time.perf_counter() - start
+            start = time.perf_counter()
+            i, _ = nesting.verify(layout)
+            t_verify = time.perf_counter() - start
+            fill = k * area / (layout.sheet_width * layout.sheet_height)
+            print(f"{n_lobes:>3} {k:>6} {t_layout:>13.2f} {t_verify:>13.3f} {len(i):>10} {fill:>10.1%}")
+
+
+def bench_flange_sdf():
+    """Точна SDF проти білінійної вибірки з кешованої сітки (крок 1 мм)"""
+    from flange_sdf import FlangeSDF
+
+    print("SDF фланця: точок/с та похибка сітки")
+    print(f"{'N':>3} {'точна, млн/с':>13} {'сітка, с':>9} {'з сітки, млн/с':>15} {'макс. похибка':>14}")
+    rng = np.random.default_rng(0)
+    for n_lobes, params in ((3, (90, 200, 28, 40)), (6, (60, 250, 20, 35)), (12, (100, 400, 20, 30))):
+        sdf = FlangeSDF(FlangeGeometry.build(*params, n_lobes))
+        points = rng.uniform(-sdf.extent - 20, sdf.extent + 20, (2_000_000, 2))
+        start = time.perf_counter()
+        exact = sdf.evaluate(points)
+        t_exact = time.perf_counter() - start
+        start = time.perf_counter()
+        sdf.sample_grid()
+        t_grid = time.perf_counter() - start
+        start = time.perf_counter()
+        approx = sdf.lookup(points)
+        t_lookup = time.perf_counter() - start
+        print(f"{n_lobes:>3} {len(points) / t_exact / 1e6:>13.2f} {t_grid:>9.3f} "
+              f"{len(points) / t_lookup / 1e6:>15.2f} {np.abs(approx - exact).max():>14.3f}")
+
+
+def bench_flange_rules():
+    """Відсіювання недопустимих рядків до побудови геометрії"""
+    from flange_math import FlangeRules
+
+    print("Правила конструювання: M рядків за один прохід")
+    print(f"{'M':>9} {'час, мс':>9} {'рядків/с':>12} {'допустимих':>11}")
+    rng = np.random.default_rng(0)
+    for m in (10_000, 1_000_000):
+        params = np.column_stack((
+            rng.uniform(10, 150, m), rng.uniform(50, 300, m),
+            rng.uniform(5, 60, m), rng.uniform(5, 80, m),
+        ))
+        t = timeit(lambda: FlangeRules.feasible(params))
+        ok = FlangeRules.feasible(params)
+        print(f"{m:>9} {t * 1e3:>9.2f} {m / t:>12.0f} {ok.mean():>10.1%}")
+
+
+# ==========================================
+# 2. КАРДІОЇДА (lab2)
+# ==========================================
+def bench_cardioid_path():
+    """Побудова контуру на кожен кадр (як було) проти кешованої одиничної кривої"""
+    from PySide6.QtWidgets import QApplication
+    from lab2 import CardioidMath, CanvasWidget
+
+    app = QApplication.instance() or QApplication([])  # QWidget без нього не створити
+    def rebuild(a):
+        path = QPainterPath()
+        path.moveTo(CardioidMath.get_point(a, 0))
+        for i in range(1, 361):
+            path.lineTo(CardioidMath.get_point(a, math.radians(i)))
+        return path
+
+    canvas = CanvasWidget()
+    frames = [30 + 0.5 * k for k in range(140)]  # як у animate_step
+
+    def cached():
+        for a in frames:
+            canvas.param_a = a
+            canvas.get_unit_path()
+
+    t_old = timeit(lambda: [rebuild(a) for a in frames]) / len(frames)
+    t_new = timeit(cached) / len(frames)
+    canvas.unit_rebuilds = 0
+    cached()
+    print("Кардіоїда: геометрія на кадр анімації")
+    print(f"  361 get_point + lineTo: {t_old * 1e6:>8.1f} мкс")
+    print(f"  кеш одиничної кривої:   {t_new * 1e6:>8.1f} мкс  (перебудов за цикл a = 30..100: {canvas.unit_rebuilds})")
+
+
+def bench_cardioid_arrays():
+    """Точка, дотична, нормаль і радіус кривини: скалярний lab2 проти масивів"""
+    from lab2 import CardioidMath
+    from cardioid_math import CardioidCurve
+
+    def scalar(a, ts):
+        out = []
+        for t in ts:
+            pt = CardioidMath.get_point(a, t)
+            dx, dy = CardioidMath.get_derivatives(a, t)
+            mag = math.sqrt(dx ** 2 + dy ** 2)
+            _, _, r_curv = CardioidMath.calculate_properties(a, t)
+            out.append((pt, dx / mag, dy / mag, -dy / mag, dx / mag, r_curv))
+        return out
+
+    print("Кардіоїда: скалярний шлях проти CardioidCurve.frame")
+    print(f"{'N':>9} {'скалярно, мс':>13} {'масиви, мс':>11} {'прискорення':>12}")
+    for n in (360, 10_000, 1_000_000):
+        ts = np.linspace(0.01, 2 * math.pi - 0.01, n)
+        t_scalar = timeit(lambda: scalar(50.0, ts.tolist()), repeat=1 if n > 10_000 else 5)
+        t_array = timeit(lambda: CardioidCurve.frame(50.0, ts))
+        print(f"{n:>9} {t_scalar * 1e3:>13.2f} {t_array * 1e3:>11.3f} {t_scalar / t_array:>11.0f}x")
+
+
+def bench_cardioid_sampling():
+    """Крок 1° (як було в lab2) проти адаптивної дискретизації з допуском 0.1 px"""
+    from polar_curves import get_curve
+
+    curve = get_curve("cardioid")
+    print("Кардіоїда: вершини та похибка ламаної (пікселі)")
+    print(f"{'a, px':>7} {'1°: вершин':>11} {'похибка':>8} {'адапт.: вершин':>15} {'похибка':>8} {'час, мс':>8}")
+    uniform = np.radians(np.arange(361.0))
+    for size in (16, 64, 256, 1024, 4096):
+        # Одинична крива з допуском 0.1 / a - те саме, що крива a з допуском 0.1 px
+        err_uniform = size * curve.chord_error(uniform[:-1], uniform[1:], probes=15).max()
+        t, err = curve.adaptive_samples(0.1 / size)
+        err *= size
+        elapsed = timeit(lambda: (curve.sample_cache.clear(), curve.adaptive_samples(0.1 / size)))
+        print(f"{size:>7} {len(uniform):>11} {err_uniform:>8.3f} {len(t):>15} {err:>8.3f} {elapsed * 1e3:>8.2f}")
+
+
+def bench_cardioid_curvature():
+    """Еволюта і гребінь: зубець за зубцем (скалярні формули, drawLine) проти кешу й одного drawLines"""
+    from PySide6.QtCore import QLineF
+    from PySide6.QtGui import QGuiApplication, QImage, QPainter
+    from lab2 import CardioidMath, CardioidScene
+
+    app = QGuiApplication.instance() or QGuiApplication([])  # Для QPainter
+    image = QImage(1280, 720, QImage.Format_RGBA8888)
+    a = 50.0
+
+    def per_tooth(scene):
+        painter = QPainter(image)
+        painter.translate(640, 360)
+        for t in np.linspace(0.0, 2 * math.pi, scene.comb_teeth, endpoint=False).tolist():
+            pt = CardioidMath.get_point(a, t)
+            dx, dy = CardioidMath.get_derivatives(a, t)
+            mag = math.hypot(dx, dy)
+            _, _, r_curv = CardioidMath.calculate_properties(a, t)
+            if mag < 1e-12 or r_curv == 0:
+                continue
+            nx, ny = -dy / mag, dx / mag
+            spike = min(scene.comb_length * a * a / abs(r_curv), 2 * scene.comb_length * a)
+            painter.drawLine(QLineF(pt.x(), pt.y(), pt.x() - nx * spike, pt.y() - ny * spike))
+            painter.drawPoint(QPointF(pt.x() + nx * r_curv, pt.y() + ny * r_curv))
+        painter.end()
+
+    def batched(scene):
+        painter = QPainter(image)
+        painter.translate(640, 360)
+        scene.draw_curvature(painter)
+        painter.end()
+
+    print("Кардіоїда: еволюта і гребінь кривини на кадр анімації")
+    for teeth in (500, 2000, 8000):
+        scene = CardioidScene(grid_cache=False)
+        scene.param_a = a
+        scene.comb_teeth = teeth
+        build = timeit(lambda: (scene.curvature_overlays.clear(), scene.get_curvature_overlay()), repeat=3)
+        t_old = timeit(lambda: per_tooth(scene), repeat=3)
+        t_new = timeit(lambda: batched(scene))
+        print(f"  {teeth:>5} зубців: по одному {t_old * 1e3:>7.2f} мс, "
+              f"drawLines {t_new * 1e3:>6.2f} мс (побудова кешу {build * 1e3:.2f} мс)")
+
+
+def bench_cardioid_distance():
+    """Хмара точок проти номінального профілю: потік блоків, пам'ять не залежить від N"""
+    import resource
+    from cardioid_math import CardioidCurve
+
+    a = 50.0
+    transform = (12.0, -7.0, 33.0, 5.0, 9.0)  # dx, dy, кут, cx, cy - як у lab2
+    block = 1_000_000
+
+    def scan(n):
+        """Блоки точок навколо профілю - як читання скану частинами"""
+        rng = np.random.default_rng(0)
+        for first in range(0, n, block):
+            yield rng.uniform(-2.5 * a, 2.5 * a, (min(block, n - first), 2))
+
+    print("Кардіоїда: відстань, бік і t для хмари точок")
+    print(f"{'N':>10} {'млн точок/с':>12} {'всередині, %':>13} {'пік RSS, МБ':>12} {'приріст, МБ':>12}")
+    for n in (100_000, 1_000_000, 10_000_000):
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        inside = 0
+        start = time.perf_counter()
+        for dist, side, t in CardioidCurve.classify_stream(a, scan(n), transform):
+            inside += int((side < 0).sum())
+        elapsed = time.perf_counter() - start
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"{n:>10} {n / elapsed / 1e6:>12.2f} {100 * inside / n:>13.1f} {rss:>12.1f} {rss - rss_before:>12.1f}")
+
+
+# ==========================================
+# 3. РАЦІОНАЛЬНІ КРИВІ БЕЗЬЄ (lab3 / lab4)
+# ==========================================
+# Старий шлях lab3 / lab4 (до BezierContour і базису Бернштейна) - лише як точка порівняння
+class RationalBezierMath:
+    @staticmethod
+    def get_point(t, p0, p1, p2, p3, w0, w1, w2, w3):
+        """
+        Розрахунок точки на раціональній кривій Безьє 3-го порядку.
+        P(t) = Sum(wi * Pi * Bi(t)) / Sum(wi * Bi(t))
+        """
+        mt = 1 - t
+        mt2 = mt * mt
+        mt3 = mt2 * mt
+        t2 = t * t
+        t3 = t2 * t
+
+        b0 = mt3  # (1-t)^3
+        b1 = 3 * mt2 * t  # 3t(1-t)^2
+        b2 = 3 * mt * t2  # 3t^2(1-t)
+        b3 = t3  # t^3
+
+        # Чисельник
+        nx = w0 * p0.x() * b0 + w1 * p1.x() * b1 + w2 * p2.x() * b2 + w3 * p3.x() * b3
+        ny = w0 * p0.y() * b0 + w1 * p1.y() * b1 + w2 * p2.y() * b2 + w3 * p3.y() * b3
+
+        # Знаменник
+        d = w0 * b0 + w1 * b1 + w2 * b2 + w3 * b3
+
+        if abs(d) < 1e-6: return p0
+
+        return QPointF(nx / d, ny / d)
+
+
+class BezierNode:
+    def __init__(self, pos, type='corner'):
+        self.pos = pos  # Вузол
+        self.handle_in = pos  # Вхідний контроль
+        self.handle_out = pos  # Вихідний контроль
+        self.type = type  # 'smooth' або 'corner'
+
+        # ВАГИ (окремо для кожної точки)
+        self.w_pos = 1.0
+        self.w_in = 1.0
+        self.w_out = 1.0
+
+
+def random_bezier_nodes(n, seed=0):
+    """Синтетичний контур: вузли на хвилястому колі, вусики вздовж дотичної, ваги 0.5..5"""
+    rng = np.random.default_rng(seed)
+    angle = np.linspace(0.0, 2 * math.pi, n, endpoint=False)
+    radius = 200 * (1 + 0.2 * np.sin(7 * angle)) + rng.uniform(-5, 5, n)
+    pos = np.column_stack((radius * np.cos(angle), radius * np.sin(angle)))
+    tangent = (np.roll(pos, -1, axis=0) - np.roll(pos, 1, axis=0)) * 0.2
+    weights = rng.uniform(0.5, 5.0, (n, 3))
+    return pos, pos - tangent, pos + tangent, weights
+
+
+def bezier_node_objects(pos, h_in, h_out, weights):
+    """Ті самі вузли як об'єкти BezierNode (для старого шляху)"""
+    nodes = []
+    for k in range(len(pos)):
+        node = BezierNode(QPointF(*pos[k].tolist()), 'smooth')
+        node.handle_in = QPointF(*h_in[k].tolist())
+        node.handle_out = QPointF(*h_out[k].tolist())
+        node.w_pos, node.w_in, node.w_out = weights[k].tolist()
+        nodes.append(node)
+    return nodes
+
+
+def bench_bezier_tessellate():
+    """40 вибірок на сегмент: get_point + lineTo (як було) проти базису Бернштейна і одного многокутника"""
+    from bezier_math import BezierMath
+    from canvas_grid import array_to_polygon
+
+    def per_point(nodes, steps=40):
+        path = QPainterPath()
+        path.moveTo(nodes[0].pos)
+        n = len(nodes)
+        for i in range(n):
+            curr, nxt = nodes[i], nodes[(i + 1) % n]
+            for k in range(1, steps + 1):
+                path.lineTo(RationalBezierMath.get_point(
+                    k / steps, curr.pos, curr.handle_out, nxt.handle_in, nxt.pos,
+                    curr.w_pos, curr.w_out, nxt.w_in, nxt.w_pos))
+        return path
+
+    def batched(arrays):
+        path = QPainterPath()
+        path.addPolygon(array_to_polygon(BezierMath.contour_polyline(*arrays, steps=40)))
+        return path
+
+    print("Безьє: тесселяція замкненого контуру (40 вибірок на сегмент)")
+    print(f"{'сегментів':>10} {'get_point, мс':>14} {'масиви, мс':>11} {'з них numpy, мс':>16} {'прискорення':>12}")
+    for n in (14, 1_000, 100_000):
+        arrays = random_bezier_nodes(n)
+        nodes = bezier_node_objects(*arrays)
+        t_old = timeit(lambda: per_point(nodes))
+        t_new = timeit(lambda: batched(arrays))
+        t_math = timeit(lambda: BezierMath.contour_polyline(*arrays, steps=40))
+        print(f"{n:>10} {t_old * 1e3:>14.2f} {t_new * 1e3:>11.2f} {t_math * 1e3:>16.2f} {t_old / t_new:>11.1f}x")
+
+
+def bench_bezier_drag():
+    """Кадр перетягування вузла: тесселяція всього контуру проти кешу сегментів"""
+    from bezier_math import SegmentCache
+
+    print("Безьє: перетягування одного вузла (тесселяція на кадр)")
+    print(f"{'вузлів':>8} {'весь контур, мс':>16} {'кеш, мс':>8} {'перераховано':>13} {'з кешу':>8}")
+    for n in (14, 1_000, 100_000):
+        nodes = bezier_node_objects(*random_bezier_nodes(n))
+        cache = SegmentCache()
+        cache.refresh(nodes)
+        node = nodes[n // 2]
+
+        def drag():
+            node.pos += QPointF(0.5, 0.0)
+            cache.invalidate_node(n // 2)
+            cache.refresh(nodes)
+
+        t_full = timeit(lambda: cache.invalidate_all() or cache.refresh(nodes))
+        t_cache = timeit(drag)
+        print(f"{n:>8} {t_full * 1e3:>16.2f} {t_cache * 1e3:>8.3f} {cache.last_rebuilt:>13} {cache.last_reused:>8}")
+
+
+def bench_bezier_adaptive():
+    """Вершини і похибка (px): 40 вибірок на сегмент проти адаптивного поділу з допуском 0.25 px"""
+    from PySide6.QtWidgets import QApplication
+    from lab4 import CanvasWidget
+    from bezier_math import BezierMath
+
+    app = QApplication.instance() or QApplication([])  # QWidget без нього не створити
+    yacht = BezierMath.node_arrays(CanvasWidget().nodes)
+    heavy = tuple(a.copy() for a in yacht)
+    heavy[3][:, 1:] = 50.0  # Усі вусики з вагою 50 (максимум spin_weight)
+    contours = [("яхта", yacht), ("яхта, ваги 50", heavy),
+                ("1 000 вузлів", random_bezier_nodes(1_000)), ("100 000 вузлів", random_bezier_nodes(100_000))]
+
+    def fixed_error(points, w, steps=40):
+        t = np.arange(steps + 1) / steps
+        m = len(points)
+        return BezierMath.chord_error(points, w, np.repeat(np.arange(m), steps),
+                                      np.tile(t[:-1], m), np.tile(t[1:], m)).max()
+
+    def adaptive_error(points, w, t, counts):
+        seg = np.repeat(np.arange(len(points)), counts)
+        t0 = np.concatenate(([0.0], t[:-1]))
+        t0[np.cumsum(counts) - counts] = 0.0  # Перша вершина сегмента починається з t = 0
+        return BezierMath.chord_error(points, w, seg, t0, t).max()
+
+    print("Безьє: фіксовані 40 вибірок проти адаптивного поділу (допуск 0.25 px)")
+    print(f"{'контур':>16} {'зум':>5} {'40/сегм.: вершин':>17} {'похибка':>8} "
+          f"{'адапт.: вершин':>15} {'похибка':>8} {'час, мс':>8}")
+    for name, arrays in contours:
+        points, w = BezierMath.segments(*arrays)
+        measure = len(points) <= 1_000  # Похибку перевіряємо щільною вибіркою лише на малих контурах
+        err_fixed = fixed_error(points, w) if measure else float('nan')
+        for zoom in (1.0, 8.0):
+            tolerance = 0.25 / zoom
+            vertices, t, counts = BezierMath.subdivide(points, w, tolerance)
+            elapsed = timeit(lambda: BezierMath.subdivide(points, w, tolerance), repeat=3)
+            err = adaptive_error(points, w, t, counts) * zoom if measure else float('nan')
+            print(f"{name:>16} {zoom:>5.0f} {40 * len(points):>17} {err_fixed * zoom:>8.3f} "
+                  f"{len(vertices):>15} {err:>8.3f} {elapsed * 1e3:>8.2f}")
+
+
+def bench_bezier_hit():
+    """Влучання мишею: перебір manhattanLength (як було) проти сітки GridIndex"""
+    from bezier_math import GridIndex
+
+    print("Безьє: пошук точки під курсором (радіус 15, однакова щільність точок)")
+    print(f"{'точок':>9} {'перебір, мкс':>13} {'сітка, мкс':>11} {'move, мкс':>10} {'побудова, мс':>13}")
+    rng = np.random.default_rng(0)
+    for n in (10, 1_000, 100_000, 1_000_000):
+        side = 20 * math.sqrt(n)
+        xy = rng.uniform(0, side, (n, 2))
+        clicks = rng.uniform(0, side, (64, 2))
+        start = time.perf_counter()
+        index = GridIndex(xy)
+        t_build = time.perf_counter() - start
+
+        def grid():
+            for x, y in clicks.tolist():
+                index.nearest(x, y, 15.0)
+
+        def drag():
+            for x, y in clicks.tolist():
+                index.move([n // 2], (x, y))
+
+        if n <= 100_000:
+            points = [QPointF(x, y) for x, y in xy.tolist()]
+            click = QPointF(*clicks[0].tolist())
+
+            def scan():
+                # Як show_context_menu: найближча з усіх точок у радіусі
+                best, best_dist = -1, 15.0
+                for i, p in enumerate(points):
+                    dist = (p - click).manhattanLength()
+                    if dist < best_dist:
+                        best, best_dist = i, dist
+                return best
+
+            t_scan = f"{timeit(scan) * 1e6:>13.1f}"
+        else:
+            t_scan = f"{'—':>13}"
+        t_grid = timeit(grid) / len(clicks)
+        t_move = timeit(drag) / len(clicks)
+        print(f"{n:>9} {t_scan} {t_grid * 1e6:>11.1f} {t_move * 1e6:>10.1f} {t_build * 1e3:>13.2f}")
+
+
+def bench_bezier_store():
+    """Вузли як об'єкти BezierNode (як було) проти BezierContour: пам'ять і масові операції"""
+    import tracemalloc
+    from PySide6.QtGui import QTransform
+    from bezier_math import BezierContour
+
+    n = 200_000
+    arrays = random_bezier_nodes(n)
+    contour = BezierContour(*arrays, types=np.ones(n, dtype=np.uint8), point_type=QPointF)
+    # tracemalloc бачить об'єкти Python (вузли, їхні __dict__, обгортки QPointF);
+    # самі QPointF у C++ (new, по 16 Б, три на вузол) - поза ним, додаються окремо.
+    # На відміну від RSS, не залежить від того, що пам'ять уже зайняли інші заміри
+    tracemalloc.start()
+    nodes = bezier_node_objects(*arrays)
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Безьє: пам'ять на вузол ({n} вузлів)")
+    print(f"  об'єкти BezierNode: {traced / n + 3 * 16:>7.0f} Б (не менше: tracemalloc + 3 QPointF у C++)")
+    print(f"  BezierContour:      {contour.nbytes() / n:>7.0f} Б (nbytes)")
+
+    matrix = QTransform().rotate(15).translate(10, -5)
+    m = [[matrix.m11(), matrix.m21(), matrix.dx()], [matrix.m12(), matrix.m22(), matrix.dy()]]
+
+    def transform_objects():
+        for node in nodes:
+            node.pos = matrix.map(node.pos)
+            node.handle_in = matrix.map(node.handle_in)
+            node.handle_out = matrix.map(node.handle_out)
+
+    def smooth_objects():
+        # Як auto_calculate_handles
+        for i in range(n):
+            tangent = (nodes[(i + 1) % n].pos - nodes[i - 1].pos) * 0.2
+            nodes[i].handle_in = nodes[i].pos - tangent
+            nodes[i].handle_out = nodes[i].pos + tangent
+
+    def reweight_objects():
+        for node in nodes:
+            node.w_pos, node.w_in, node.w_out = 1.0, 2.0, 2.0
+
+    print(f"{'операція':>10} {'вузли, мс':>12} {'масиви, мс':>11} {'прискорення':>12}")
+    for name, slow, fast in (
+        ("transform", transform_objects, lambda: contour.transform(m)),
+        ("smooth", smooth_objects, lambda: contour.smooth_all(0.2)),
+        ("reweight", reweight_objects, lambda: contour.reweight(1.0, 2.0, 2.0)),
+    ):
+        t_slow = timeit(slow, repeat=3)
+        t_fast = timeit(fast)
+        print(f"{name:>10} {t_slow * 1e3:>12.1f} {t_fast * 1e3:>11.2f} {t_slow / t_fast:>11.0f}x")
+
+
+BENCHMARKS = {
+    "flange_contour": bench_flange_contour,
+    "flange_contour_full": lambda: bench_flange_contour(full=True),
+    "flange_batch": bench_flange_batch,
+    "flange_export": bench_flange_export,
+    "flange_nesting": bench_flange_nesting,
+    "flange_sdf": bench_flange_sdf,
+    "flange_rules": bench_flange_rules,
+    "cardioid_path": bench_cardioid_path,
+    "cardioid_arrays": bench_cardioid_arrays,
+    "cardioid_sampling": bench_cardioid_sampling,
+    "cardioid_curvature": bench_cardioid_curvature,
+    "cardioid_distance": bench_cardioid_distance,
+    "bezier_tessellate": bench_bezier_tessellate,
+    "bezier_drag": bench_bezier_drag,
+    "bezier_adaptive": bench_bezier_adaptive,
+    "bezier_hit": bench_bezier_hit,
+    "bezier_store": bench_bezier_store,
+}
+
+
+if __name__ == "__main__":
+    # Без аргументів - усе, крім довгого повного заміру булевого контуру
+    names = sys.argv[1:] or [name for name in BENCHMARKS if name != "flange_contour_full"]
+    for name in names:
+        BENCHMARKS[name]()
+        print()
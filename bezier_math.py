@@ -0,0 +1,498 @@
+import math
+import numpy as np
+
+
+# ==========================================
+# РАЦІОНАЛЬНІ КРИВІ БЕЗЬЄ 3-ГО ПОРЯДКУ (без Qt)
+# ==========================================
+# Замкнений контур з N вузлів складається з N сегментів; сегмент i:
+#   P0 = pos[i], P1 = out[i], P2 = in[i+1], P3 = pos[i+1],
+#   ваги w_pos[i], w_out[i], w_in[i+1], w_pos[i+1].
+# P(t) = Σ wk Pk Bk(t) / Σ wk Bk(t). В однорідних координатах (w x, w y, w)
+# це звичайна крива Безьє, тож усі вибірки всіх сегментів - одне множення
+# на матрицю базису Бернштейна і ділення на третю координату.
+
+class BezierMath:
+    _basis = {}  # steps -> матриця (steps, 4)
+
+    @staticmethod
+    def basis(steps):
+        """Базис Бернштейна для t = 1/steps ... 1 (t = 0 - кінець попереднього сегмента)"""
+        if steps not in BezierMath._basis:
+            t = np.arange(1, steps + 1) / steps
+            mt = 1 - t
+            BezierMath._basis[steps] = np.column_stack((mt ** 3, 3 * mt * mt * t, 3 * mt * t * t, t ** 3))
+        return BezierMath._basis[steps]
+
+    @staticmethod
+    def node_arrays(nodes, index=None):
+        """
+        (pos, handle_in, handle_out) по (N, 2) і ваги (N, 3): w_pos, w_in, w_out.
+        nodes - BezierContour (зрізи його масивів) або список об'єктів вузлів
+        (pos, handle_in, handle_out - точки з x(), y()); index - лише ці вузли.
+        """
+        if isinstance(nodes, BezierContour):
+            return nodes.arrays(index)
+        if index is not None:
+            nodes = [nodes[k] for k in np.asarray(index).tolist()]
+        coords = np.array([(n.pos.x(), n.pos.y(), n.handle_in.x(), n.handle_in.y(),
+                            n.handle_out.x(), n.handle_out.y(), n.w_pos, n.w_in, n.w_out)
+                           for n in nodes], dtype=np.float64).reshape(-1, 9)
+        return coords[:, 0:2], coords[:, 2:4], coords[:, 4:6], coords[:, 6:9]
+
+    @staticmethod
+    def segments(pos, h_in, h_out, weights, start=None, end=None):
+        """
+        Контрольні точки (M, 4, 2) і ваги (M, 4) сегментів замкненого контуру.
+        start / end - рядки масивів з початковим і кінцевим вузлом сегментів
+        (без них - усі N сегментів, end = start + 1 по колу).
+        """
+        i = np.arange(len(pos)) if start is None else np.asarray(start, dtype=np.intp)
+        j = (i + 1) % len(pos) if end is None else np.asarray(end, dtype=np.intp)
+        points = np.stack((pos[i], h_out[i], h_in[j], pos[j]), axis=1)
+        w = np.column_stack((weights[i, 0], weights[i, 2], weights[j, 1], weights[j, 0]))
+        return points, w
+
+    @staticmethod
+    def homogeneous(points, weights):
+        """(M, 4, 3): (w x, w y, w)"""
+        return np.concatenate((points * weights[..., None], weights[..., None]), axis=-1)
+
+    @staticmethod
+    def project(hom, fallback):
+        """(..., 3) -> (..., 2); де w ≈ 0 - fallback (як у get_point: початок сегмента)"""
+        w = hom[..., 2:]
+        safe = np.abs(w) >= 1e-6
+        return np.where(safe, hom[..., :2] / np.where(safe, w, 1.0), fallback)
+
+    @staticmethod
+    def tessellate(points, weights, steps=40):
+        """Вибірки t = 1/steps ... 1 для кожного сегмента: (M, steps, 2)"""
+        hom = BezierMath.basis(steps) @ BezierMath.homogeneous(points, weights)  # (M, steps, 3)
+        return BezierMath.project(hom, points[:, None, 0, :])
+
+    @staticmethod
+    def contour_polyline(pos, h_in, h_out, weights, steps=40):
+        """Ламана всього контуру: pos[0], далі вибірки всіх сегментів підряд (1 + N * steps, 2)"""
+        if len(pos) == 0:
+            return np.empty((0, 2))
+        points, w = BezierMath.segments(pos, h_in, h_out, weights)
+        return np.concatenate((pos[:1], BezierMath.tessellate(points, w, steps).reshape(-1, 2)))
+
+    @staticmethod
+    def evaluate(points, weights, seg, t):
+        """Точки сегментів seg (K,) у параметрах t (K,): (K, 2)"""
+        t = np.asarray(t, dtype=np.float64)
+        mt = 1 - t
+        basis = np.stack((mt ** 3, 3 * mt * mt * t, 3 * mt * t * t, t ** 3), axis=-1)  # (K, 4)
+        hom = (basis[..., None] * BezierMath.homogeneous(points[seg], weights[seg])).sum(axis=-2)
+        return BezierMath.project(hom, points[seg, 0])
+
+    # --- Адаптивний поділ ---
+    @staticmethod
+    def flatness(proj):
+        """
+        Найбільша відстань внутрішніх контрольних точок (K, 4, 2) до хорди P0 P3.
+        За додатних ваг крива лежить в опуклій оболонці контрольних точок,
+        тож це оцінка зверху відхилення кривої від хорди.
+        """
+        a = proj[:, 0]
+        ab = proj[:, 3] - a
+        denom = np.maximum((ab * ab).sum(-1), 1e-300)[:, None]
+        ap = proj[:, 1:3] - a[:, None, :]
+        u = np.clip((ap * ab[:, None, :]).sum(-1) / denom, 0.0, 1.0)
+        d = ap - u[..., None] * ab[:, None, :]
+        return np.sqrt((d * d).sum(-1)).max(axis=1)
+
+    @staticmethod
+    def subdivide(points, weights, tolerance, max_depth=16):
+        """
+        Поділ де Кастельжо навпіл в однорідних координатах, доки контрольний
+        многокутник не стане пласкішим за tolerance (усі сегменти разом, рівень
+        за рівнем). Повертає вершини без початку сегментів (V, 2), їхні
+        параметри t (V,) і кількість вершин кожного сегмента (M,).
+        """
+        m = len(points)
+        hom = BezierMath.homogeneous(points, weights)  # (K, 4, 3)
+        seg = np.arange(m)
+        t0 = np.zeros(m)
+        leaf_seg, leaf_t, leaf_pt = [], [], []
+        for depth in range(max_depth + 1):
+            proj = BezierMath.project(hom, hom[..., :2])
+            flat = BezierMath.flatness(proj) <= tolerance
+            if depth == max_depth:
+                flat[:] = True
+            half = 0.5 ** depth
+            leaf_seg.append(seg[flat])
+            leaf_t.append(t0[flat] + half)
+            leaf_pt.append(proj[flat, 3])
+            if flat.all():
+                break
+
+            # Половини [P0, q01, r0, m] і [m, r1, q23, P3]
+            h = hom[~flat]
+            q01, q12, q23 = (h[:, 0] + h[:, 1]) / 2, (h[:, 1] + h[:, 2]) / 2, (h[:, 2] + h[:, 3]) / 2
+            r0, r1 = (q01 + q12) / 2, (q12 + q23) / 2
+            mid = (r0 + r1) / 2
+            hom = np.concatenate((np.stack((h[:, 0], q01, r0, mid), axis=1),
+                                  np.stack((mid, r1, q23, h[:, 3]), axis=1)))
+            seg = np.concatenate((seg[~flat], seg[~flat]))
+            t0 = np.concatenate((t0[~flat], t0[~flat] + half / 2))
+
+        seg = np.concatenate(leaf_seg)
+        t = np.concatenate(leaf_t)
+        order = np.lexsort((t, seg))
+        return np.concatenate(leaf_pt)[order], t[order], np.bincount(seg, minlength=m)
+
+    @staticmethod
+    def chord_error(points, weights, seg, t0, t1, probes=15):
+        """Найбільша відстань дуги сегмента seg на [t0, t1] (у probes точках) до хорди: (K,)"""
+        k = np.arange(1, probes + 1) / (probes + 1)
+        seg = np.asarray(seg)
+        p0 = BezierMath.evaluate(points, weights, seg, t0)
+        p1 = BezierMath.evaluate(points, weights, seg, t1)
+        q = BezierMath.evaluate(points, weights, np.repeat(seg, probes),
+                                (t0[:, None] + (t1 - t0)[:, None] * k[None, :]).ravel()).reshape(-1, probes, 2)
+        ab = p1 - p0
+        denom = np.maximum((ab * ab).sum(-1), 1e-300)[:, None]
+        aq = q - p0[:, None, :]
+        u = np.clip((aq * ab[:, None, :]).sum(-1) / denom, 0.0, 1.0)
+        d = aq - u[..., None] * ab[:, None, :]
+        return np.sqrt((d * d).sum(-1)).max(axis=1)
+
+
+# ==========================================
+# КЕШ СЕГМЕНТІВ З ПОЗНАЧКАМИ ЗМІН
+# ==========================================
+class SegmentCache:
+    """
+    Вершини й габарити кожного сегмента замкненого контуру. Перераховуються
+    лише позначені (брудні) сегменти, і вузли читаються тільки для них, тож
+    перетягування вузла коштує однаково для 14 і для 100 000 вузлів.
+    Вузол i належить сегментам i - 1 (вхідний вусик) та i (вихідний).
+    Сегменти діляться адаптивно з допуском tolerance (логічні одиниці), тому
+    кількість вершин у них різна: ламана - один буфер, pos[0] і далі сегмент i
+    в рядках 1 + offsets[i] ... 1 + offsets[i + 1].
+    """
+
+    def __init__(self, tolerance=0.25, max_depth=16):
+        self.tolerance = tolerance
+        self.max_depth = max_depth
+        self.count = 0
+        self.polyline = np.empty((0, 2))
+        self.offsets = np.zeros(1, dtype=np.intp)
+        self.bbox = np.empty((0, 4))  # xmin, ymin, xmax, ymax
+        self.dirty = np.zeros(0, dtype=bool)
+
+        # Статистика останнього оновлення і загальна
+        self.last_rebuilt = 0
+        self.last_reused = 0
+        self.total_rebuilt = 0
+
+    def invalidate_all(self):
+        self.dirty[:] = True
+
+    def invalidate_node(self, i, part='node'):
+        """part: 'node' (позиція чи вага вузла) - обидва сегменти, 'in' - лише i - 1, 'out' - лише i"""
+        n = self.count
+        if n == 0:
+            return
+        if part in ('node', 'in'):
+            self.dirty[(i - 1) % n] = True
+        if part in ('node', 'out'):
+            self.dirty[i % n] = True
+
+    def set_tolerance(self, tolerance):
+        """Новий допуск (інший зум) - перераховується весь контур"""
+        if tolerance != self.tolerance:
+            self.tolerance = tolerance
+            self.invalidate_all()
+
+    def refresh(self, nodes):
+        """Перераховує брудні сегменти; повертає ламану контуру (1 + V, 2)"""
+        n = len(nodes)
+        if n != self.count:
+            self.count = n
+            self.polyline = np.empty((1, 2)) if n else np.empty((0, 2))
+            self.offsets = np.zeros(n + 1, dtype=np.intp)
+            self.bbox = np.empty((n, 4))
+            self.dirty = np.ones(n, dtype=bool)
+
+        index = np.nonzero(self.dirty)[0]
+        self.last_rebuilt = len(index)
+        self.last_reused = n - len(index)
+        if len(index) == 0:
+            return self.polyline
+
+        # Лише вузли, що належать брудним сегментам
+        used = np.unique(np.concatenate((index, (index + 1) % n)))
+        pos, h_in, h_out, weights = BezierMath.node_arrays(nodes, used)
+        points, w = BezierMath.segments(
+            pos, h_in, h_out, weights,
+            np.searchsorted(used, index), np.searchsorted(used, (index + 1) % n)
+        )
+        samples, _, counts = BezierMath.subdivide(points, w, self.tolerance, self.max_depth)
+
+        old_counts = np.diff(self.offsets)
+        if not np.array_equal(counts, old_counts[index]):
+            # Інша кількість вершин - новий буфер; чисті сегменти переносяться одним копіюванням
+            new_counts = old_counts.copy()
+            new_counts[index] = counts
+            offsets = np.concatenate(([0], np.cumsum(new_counts)))
+            polyline = np.empty((1 + offsets[-1], 2))
+            seg = np.repeat(np.arange(n), old_counts)
+            src = np.nonzero(~self.dirty[seg])[0]
+            kept = seg[src]
+            polyline[1 + src - self.offsets[kept] + offsets[kept]] = self.polyline[1 + src]
+            self.offsets = offsets
+            self.polyline = polyline
+
+        starts = np.cumsum(counts) - counts
+        rows = np.repeat(self.offsets[index] - starts, counts) + np.arange(len(samples))
+        self.polyline[1 + rows] = samples
+        self.polyline[0] = self.polyline[-1]  # Кінець останнього сегмента = pos[0]
+        self.bbox[index, :2] = np.minimum(np.minimum.reduceat(samples, starts), points[:, 0])
+        self.bbox[index, 2:] = np.maximum(np.maximum.reduceat(samples, starts), points[:, 0])
+
+        self.dirty[index] = False
+        self.total_rebuilt += len(index)
+        return self.polyline
+
+    def vertex_count(self):
+        return len(self.polyline)
+
+    def bounds(self):
+        """Габарит усього контуру (xmin, ymin, xmax, ymax) з габаритів сегментів"""
+        return np.concatenate((self.bbox[:, :2].min(axis=0), self.bbox[:, 2:].max(axis=0)))
+
+
+# ==========================================
+# ПРОСТОРОВИЙ ІНДЕКС ТОЧОК (рівномірна сітка)
+# ==========================================
+class GridIndex:
+    """
+    Пошук найближчої точки в радіусі для вузлів і вусиків. Точки розкладені
+    по клітинках сітки: номери, відсортовані за ключем клітинки, і межі
+    кожної клітинки (пошук - searchsorted). Запит переглядає лише клітинки
+    навколо курсора, тож час не залежить від загальної кількості точок.
+    Переміщені точки до перебудови лежать в окремому малому списку.
+    Відстань - манхеттенська, як manhattanLength у редакторах.
+    """
+
+    def __init__(self, xy=None, cell=None):
+        self.cell_hint = cell
+        self.xy = np.empty((0, 2))
+        if xy is not None:
+            self.build(xy)
+
+    def build(self, xy):
+        self.xy = np.array(xy, dtype=np.float64).reshape(-1, 2)
+        n = len(self.xy)
+        if self.cell_hint:
+            self.cell = float(self.cell_hint)
+        else:
+            # Кілька точок на клітинку: крок ~ середня відстань між точками
+            # (для точок на одній прямій - уздовж неї)
+            span = np.ptp(self.xy, axis=0) if n else np.ones(2)
+            count = max(n, 1)
+            self.cell = max(2 * math.sqrt(span[0] * span[1] / count), 2 * span.max() / count, 1e-9)
+        keys = self.keys(self.xy)
+        self.order = np.argsort(keys, kind='stable')
+        self.cells, self.starts = np.unique(keys[self.order], return_index=True)
+        self.ends = np.append(self.starts[1:], n)
+        self.stale = np.zeros(n, dtype=bool)
+        self.moved = set()
+        self.rebuilds = getattr(self, "rebuilds", 0) + 1
+
+    def keys(self, xy):
+        """Ключ клітинки: (i, j) -> одне int64"""
+        ij = np.floor(xy / self.cell).astype(np.int64)
+        return ij[:, 0] * (1 << 32) + ij[:, 1]
+
+    def move(self, ids, xy):
+        """Нові координати точок ids; сітка перебудовується, коли переміщених стає багато"""
+        ids = np.atleast_1d(np.asarray(ids, dtype=np.intp))
+        self.xy[ids] = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        self.stale[ids] = True
+        self.moved.update(ids.tolist())
+        if len(self.moved) > max(256, len(self.xy) // 64):
+            self.build(self.xy)
+
+    def nearest(self, x, y, radius, metric=None):
+        """
+        (номер, відстань) найближчої точки з відстанню < radius або (-1, inf).
+        metric - лінійна частина перетворення на екран (2x2, рядкова конвенція Qt):
+        тоді відстань і radius - в екранних пікселях, форма зони не залежить від
+        обертання й нерівномірного масштабу. Клітинки переглядаються з запасом
+        radius / σmin (найменше сингулярне число metric).
+        """
+        if len(self.xy) == 0:
+            return -1, math.inf
+        search = radius
+        if metric is not None:
+            metric = np.asarray(metric, dtype=np.float64)
+            sigma = np.linalg.svd(metric, compute_uv=False).min()
+            search = radius / sigma if sigma > 0 else math.inf
+        x, y = float(x), float(y)
+        if not math.isfinite(search):
+            candidates = self.order
+        else:
+            candidates = self.cell_candidates(x, y, search)
+        candidates = candidates[~self.stale[candidates]]
+        if self.moved:
+            candidates = np.concatenate((candidates, np.fromiter(self.moved, dtype=np.intp)))
+        if len(candidates) == 0:
+            return -1, math.inf
+
+        delta = self.xy[candidates] - (x, y)
+        if metric is not None:
+            delta = delta @ metric
+        dist = np.abs(delta).sum(axis=1)
+        k = int(dist.argmin())
+        if dist[k] >= radius:
+            return -1, math.inf
+        return int(candidates[k]), float(dist[k])
+
+    def cell_candidates(self, x, y, radius):
+        """Номери точок (order) з клітинок, що перетинають квадрат ±radius навколо (x, y)"""
+        i0, i1 = math.floor((x - radius) / self.cell), math.floor((x + radius) / self.cell)
+        j0, j1 = math.floor((y - radius) / self.cell), math.floor((y + radius) / self.cell)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self.cells):
+            candidates = self.order  # Радіус більший за заповнену частину сітки - переглядаємо все
+        else:
+            ii, jj = np.meshgrid(np.arange(i0, i1 + 1, dtype=np.int64), np.arange(j0, j1 + 1, dtype=np.int64))
+            wanted = (ii * (1 << 32) + jj).ravel()
+            pos = np.searchsorted(self.cells, wanted)
+            found = pos < len(self.cells)
+            found[found] = self.cells[pos[found]] == wanted[found]
+            starts, ends = self.starts[pos[found]], self.ends[pos[found]]
+
+            # Діапазони order[start:end] усіх знайдених клітинок одним масивом
+            counts = ends - starts
+            flat = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+            candidates = self.order[flat]
+        return candidates
+
+
+# ==========================================
+# КОНТУР У МАСИВАХ (структура масивів замість об'єктів вузлів)
+# ==========================================
+CORNER, SMOOTH = 0, 1
+NODE_TYPES = ('corner', 'smooth')  # uint8 -> назва, як у lab3 / lab4
+
+
+class NodeView:
+    """
+    Тонкий вигляд вузла i контуру з інтерфейсом колишніх об'єктів вузлів lab3 / lab4:
+    pos, handle_in, handle_out (точки типу contour.point_type), w_pos, w_in, w_out, type.
+    Читання і запис ідуть прямо в масиви контуру.
+    """
+    __slots__ = ('contour', 'index')
+
+    def __init__(self, contour, index):
+        self.contour = contour
+        self.index = index
+
+    def get_point(self, array):
+        x, y = array[self.index].tolist()
+        return self.contour.point_type(x, y)
+
+    def set_point(self, array, value):
+        array[self.index] = (value.x(), value.y()) if hasattr(value, 'x') else value
+
+    pos = property(lambda self: self.get_point(self.contour.pos),
+                   lambda self, v: self.set_point(self.contour.pos, v))
+    handle_in = property(lambda self: self.get_point(self.contour.handle_in),
+                         lambda self, v: self.set_point(self.contour.handle_in, v))
+    handle_out = property(lambda self: self.get_point(self.contour.handle_out),
+                          lambda self, v: self.set_point(self.contour.handle_out, v))
+
+    def get_weight(self, k):
+        return float(self.contour.weights[self.index, k])
+
+    def set_weight(self, k, value):
+        self.contour.weights[self.index, k] = value
+
+    w_pos = property(lambda self: self.get_weight(0), lambda self, v: self.set_weight(0, v))
+    w_in = property(lambda self: self.get_weight(1), lambda self, v: self.set_weight(1, v))
+    w_out = property(lambda self: self.get_weight(2), lambda self, v: self.set_weight(2, v))
+
+    @property
+    def type(self):
+        return NODE_TYPES[self.contour.types[self.index]]
+
+    @type.setter
+    def type(self, value):
+        self.contour.types[self.index] = NODE_TYPES.index(value)
+
+
+class BezierContour:
+    """
+    Замкнений контур з N вузлів у суцільних масивах: pos, handle_in, handle_out
+    (N, 2), weights (N, 3) - w_pos, w_in, w_out, types (N,) uint8 (CORNER / SMOOTH).
+    contour[i] - NodeView, тож код редакторів, що працює з вузлами поштучно,
+    лишається без змін; масові операції - без циклів Python.
+    point_type(x, y) - тип точок, які повертає вигляд (у редакторах - QPointF).
+    """
+
+    def __init__(self, pos, handle_in=None, handle_out=None, weights=None, types=None, point_type=tuple):
+        self.pos = np.array(pos, dtype=np.float64).reshape(-1, 2)
+        n = len(self.pos)
+        self.handle_in = self.pos.copy() if handle_in is None else np.array(handle_in, dtype=np.float64)
+        self.handle_out = self.pos.copy() if handle_out is None else np.array(handle_out, dtype=np.float64)
+        self.weights = np.ones((n, 3)) if weights is None else np.array(weights, dtype=np.float64)
+        if types is None:
+            self.types = np.full(n, CORNER, dtype=np.uint8)
+        else:
+            self.types = np.array([NODE_TYPES.index(t) if isinstance(t, str) else t for t in types], dtype=np.uint8)
+        self.point_type = point_type if point_type is not tuple else (lambda x, y: (x, y))
+
+    def __len__(self):
+        return len(self.pos)
+
+    def __getitem__(self, i):
+        n = len(self.pos)
+        if not -n <= i < n:
+            raise IndexError("Номер вузла поза контуром")
+        return NodeView(self, i % n)
+
+    def __iter__(self):
+        return (NodeView(self, i) for i in range(len(self.pos)))
+
+    def arrays(self, index=None):
+        """(pos, handle_in, handle_out, weights) - усі вузли чи лише index"""
+        if index is None:
+            return self.pos, self.handle_in, self.handle_out, self.weights
+        return self.pos[index], self.handle_in[index], self.handle_out[index], self.weights[index]
+
+    def nbytes(self):
+        return self.pos.nbytes + self.handle_in.nbytes + self.handle_out.nbytes + self.weights.nbytes + self.types.nbytes
+
+    # --- Масові операції ---
+    def transform(self, matrix):
+        """Афінне перетворення всіх точок: matrix (2, 3) - [[a, b, dx], [c, d, dy]]"""
+        m = np.asarray(matrix, dtype=np.float64)
+        for array in (self.pos, self.handle_in, self.handle_out):
+            array[:] = array @ m[:, :2].T + m[:, 2]
+
+    def smooth_all(self, factor=0.2):
+        """
+        Вусики всіх вузлів одразу (як auto_calculate_handles): у гладких -
+        уздовж хорди сусідів, factor * (наступний - попередній); у зламів - у вузлі.
+        """
+        tangent = (np.roll(self.pos, -1, axis=0) - np.roll(self.pos, 1, axis=0)) * factor
+        smooth = (self.types == SMOOTH)[:, None]
+        self.handle_in[:] = np.where(smooth, self.pos - tangent, self.pos)
+        self.handle_out[:] = np.where(smooth, self.pos + tangent, self.pos)
+
+    def reweight(self, w_pos=None, w_in=None, w_out=None):
+        """Нові ваги для всіх вузлів (число або масив (N,)); None - без змін"""
+        for k, value in enumerate((w_pos, w_in, w_out)):
+            if value is not None:
+                self.weights[:, k] = value
+
+    def lerp_to(self, target, k):
+        """Крок k усіх точок і ваг до контуру target (анімація)"""
+        for array, goal in ((self.pos, target.pos), (self.handle_in, target.handle_in),
+                            (self.handle_out, target.handle_out), (self.weights, target.weights)):
+            array += (goal - array) * k
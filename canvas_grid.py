@@ -0,0 +1,154 @@
+import math
+import time
+import ctypes
+import numpy as np
+import shiboken6
+from PySide6.QtCore import Qt, QLineF, QRectF
+from PySide6.QtGui import QPainter, QPen, QColor, QPixmap, QPolygonF
+
+
+# ==========================================
+# ФОНОВА СІТКА ДЛЯ 2D ПОЛОТЕН
+# ==========================================
+class GridLayer:
+    """
+    Координатна сітка, що малює лише лінії у видимій області.
+    Крок подвоюється, поки лінії ближчі за min_spacing_px пікселів.
+    Готовий шар зберігається в QPixmap і перемальовується тільки
+    при зміні камери (зсув, зум, оберт) або розміру вікна.
+    """
+
+    def __init__(self, step=50, color="#e0e0e0", axis_color=Qt.black, min_spacing_px=8, use_cache=True):
+        self.step = step
+        self.color = QColor(color)
+        self.axis_color = QColor(axis_color)
+        self.min_spacing_px = min_spacing_px
+        self.use_cache = use_cache
+
+        self.cache_key = None
+        self.pixmap = None
+
+        # Статистика (окремо від вартості малювання фігури)
+        self.rebuilds = 0
+        self.blits = 0
+        self.last_ms = 0.0
+        self.total_ms = 0.0
+        self.line_count = 0
+
+    def invalidate(self):
+        self.cache_key = None
+
+    def stats(self):
+        return {
+            "rebuilds": self.rebuilds,
+            "blits": self.blits,
+            "lines": self.line_count,
+            "last_ms": self.last_ms,
+            "total_ms": self.total_ms,
+        }
+
+    def pick_step(self, transform):
+        """Крок сітки для поточного зуму (пікселів на одиницю = sqrt|det|)"""
+        px_per_unit = math.sqrt(abs(transform.determinant()))
+        step = self.step
+        if px_per_unit <= 0:
+            return step
+        while step * px_per_unit < self.min_spacing_px:
+            step *= 2
+        return step
+
+    def build_lines(self, transform, width, height):
+        """Лінії сітки та осей, що перетинають екран (логічні координати)"""
+        inv, ok = transform.inverted()
+        if not ok:
+            return [], []
+        rect = inv.mapRect(QRectF(0, 0, width, height))
+        left, right, top, bottom = rect.left(), rect.right(), rect.top(), rect.bottom()
+        step = self.pick_step(transform)
+
+        lines = []
+        x = math.floor(left / step) * step
+        while x <= right:
+            lines.append(QLineF(x, top, x, bottom))
+            x += step
+        y = math.floor(top / step) * step
+        while y <= bottom:
+            lines.append(QLineF(left, y, right, y))
+            y += step
+
+        axes = []
+        if top <= 0 <= bottom:
+            axes.append(QLineF(left, 0, right, 0))
+        if left <= 0 <= right:
+            axes.append(QLineF(0, top, 0, bottom))
+        return lines, axes
+
+    def paint_lines(self, painter, transform, width, height):
+        lines, axes = self.build_lines(transform, width, height)
+        self.line_count = len(lines) + len(axes)
+
+        grid_pen = QPen(self.color)
+        grid_pen.setWidthF(1)
+        grid_pen.setCosmetic(True)
+        painter.setPen(grid_pen)
+        painter.drawLines(lines)
+
+        axis_pen = QPen(self.axis_color)
+        axis_pen.setWidth(2)
+        axis_pen.setCosmetic(True)
+        painter.setPen(axis_pen)
+        painter.drawLines(axes)
+
+    def draw(self, painter):
+        """Малює сітку з поточною трансформацією painter (світ -> екран)"""
+        start = time.perf_counter()
+        transform = painter.transform()
+        device = painter.device()
+        width, height = device.width(), device.height()
+
+        if not self.use_cache:
+            self.paint_lines(painter, transform, width, height)
+            self.rebuilds += 1
+        else:
+            dpr = device.devicePixelRatioF()
+            key = (transform.m11(), transform.m12(), transform.m21(), transform.m22(),
+                   transform.dx(), transform.dy(), width, height, dpr)
+            if key != self.cache_key:
+                pix = QPixmap(max(1, int(width * dpr)), max(1, int(height * dpr)))
+                pix.setDevicePixelRatio(dpr)
+                pix.fill(Qt.transparent)
+                p = QPainter(pix)
+                p.setRenderHints(painter.renderHints())
+                p.setTransform(transform)
+                self.paint_lines(p, transform, width, height)
+                p.end()
+                self.pixmap = pix
+                self.cache_key = key
+                self.rebuilds += 1
+            else:
+                self.blits += 1
+
+            painter.save()
+            painter.resetTransform()
+            painter.drawPixmap(0, 0, self.pixmap)
+            painter.restore()
+
+        self.last_ms = (time.perf_counter() - start) * 1e3
+        self.total_ms += self.last_ms
+
+
+# ==========================================
+# МАСИВ ТОЧОК -> QPolygonF
+# ==========================================
+def array_to_polygon(points):
+    """
+    (K, 2) float64 -> QPolygonF одним копіюванням пам'яті: QPolygonF - суцільний
+    масив QPointF (два qreal = double), тож без K об'єктів QPointF у Python.
+    """
+    points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+    polygon = QPolygonF()
+    if len(points):
+        polygon.resize(len(points))
+        address = shiboken6.getCppPointer(polygon.data())[0]
+        ctypes.memmove(address, points.ctypes.data, points.nbytes)
+    return polygon
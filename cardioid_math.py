@@ -0,0 +1,134 @@
+import math
+import numpy as np
+
+from polar_curves import ArcLengthTable, get_curve
+
+
+# ==========================================
+# КАРДІОЇДА: ВЕКТОРИЗОВАНІ ФОРМУЛИ (без Qt)
+# ==========================================
+# x = a (1 - cos t) cos t,  y = a (1 - cos t) sin t
+# Усі методи приймають масиви t і a (або скаляри) з узгодженою формою
+# (numpy broadcasting) і повертають масиви; точки - (..., 2).
+
+class CardioidCurve:
+    _arc_table = None  # Таблиця довжин одиничної кардіоїди (будується один раз)
+
+    @staticmethod
+    def points(a, t):
+        a, t = np.broadcast_arrays(np.asarray(a, dtype=np.float64), np.asarray(t, dtype=np.float64))
+        r = a * (1 - np.cos(t))
+        return np.stack((r * np.cos(t), r * np.sin(t)), axis=-1)
+
+    @staticmethod
+    def derivatives(a, t):
+        """(dx/dt, dy/dt): (..., 2)"""
+        a, t = np.broadcast_arrays(np.asarray(a, dtype=np.float64), np.asarray(t, dtype=np.float64))
+        return np.stack((a * (np.sin(2 * t) - np.sin(t)), a * (np.cos(t) - np.cos(2 * t))), axis=-1)
+
+    @staticmethod
+    def second_derivatives(a, t):
+        """(d²x/dt², d²y/dt²): (..., 2)"""
+        a, t = np.broadcast_arrays(np.asarray(a, dtype=np.float64), np.asarray(t, dtype=np.float64))
+        return np.stack((a * (2 * np.cos(2 * t) - np.cos(t)), a * (2 * np.sin(2 * t) - np.sin(t))), axis=-1)
+
+    @staticmethod
+    def tangents(t):
+        """
+        Одиничні дотичні. Похідна = 2 a sin(t/2) (cos 3t/2, sin 3t/2), тому
+        напрям не залежить від a і визначений і в точці повернення (t = 0,
+        границя справа) - без ділення на нульову довжину.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        sign = np.where(np.sin(t / 2) < 0, -1.0, 1.0)
+        return np.stack((sign * np.cos(1.5 * t), sign * np.sin(1.5 * t)), axis=-1)
+
+    @staticmethod
+    def normals(t):
+        """Одиничні нормалі - дотична, повернута на +90°"""
+        tan = CardioidCurve.tangents(t)
+        return np.stack((-tan[..., 1], tan[..., 0]), axis=-1)
+
+    @staticmethod
+    def curvature_radius(a, t):
+        """(4a/3) sin(t/2) - зі знаком, як у lab2.CardioidMath.calculate_properties"""
+        return (4 * np.asarray(a, dtype=np.float64) / 3) * np.sin(np.asarray(t, dtype=np.float64) / 2)
+
+    @staticmethod
+    def speed(a, t):
+        """|r'(t)| = 2 a |sin(t/2)|"""
+        return 2 * np.abs(np.asarray(a, dtype=np.float64) * np.sin(np.asarray(t, dtype=np.float64) / 2))
+
+    @staticmethod
+    def frame(a, t):
+        """Точки, дотичні, нормалі (..., 2) та радіуси кривини (...) одним викликом"""
+        tan = CardioidCurve.tangents(t)
+        normal = np.stack((-tan[..., 1], tan[..., 0]), axis=-1)
+        return CardioidCurve.points(a, t), tan, normal, CardioidCurve.curvature_radius(a, t)
+
+    # --- Довжина дуги ---
+    @staticmethod
+    def arc_table():
+        """Таблиця одиничної кардіоїди; для інших a довжини масштабуються в a разів"""
+        if CardioidCurve._arc_table is None:
+            CardioidCurve._arc_table = ArcLengthTable(lambda t: CardioidCurve.speed(1.0, t), 2 * math.pi)
+        return CardioidCurve._arc_table
+
+    @staticmethod
+    def t_from_s(a, s):
+        """Параметр точки на відстані s вздовж кривої від t = 0 (s - масив, по колу замкнено)"""
+        table = CardioidCurve.arc_table()
+        unit = np.mod(np.asarray(s, dtype=np.float64) / a, table.length)
+        return table.t_from_s(unit)
+
+    @staticmethod
+    def s_from_t(a, t):
+        table = CardioidCurve.arc_table()
+        return a * table.s_from_t(np.mod(np.asarray(t, dtype=np.float64), 2 * math.pi))
+
+    # --- Масові запити: відстань і положення точок відносно кривої ---
+    @staticmethod
+    def to_local(points, transform=(0.0, 0.0, 0.0, 0.0, 0.0)):
+        """
+        Точки сцени -> локальні координати кривої. transform = (dx, dy, кут°, cx, cy) -
+        як у set_transform_params lab2: сцена = R(p - c) + c + d, тож p = R⁻¹(q - c - d) + c.
+        """
+        dx, dy, angle, cx, cy = transform
+        q = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if angle == 0 and dx == 0 and dy == 0:
+            return q
+        c, s = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+        ux, uy = q[:, 0] - (cx + dx), q[:, 1] - (cy + dy)
+        return np.column_stack((c * ux + s * uy + cx, c * uy - s * ux + cy))
+
+    @staticmethod
+    def classify_stream(a, blocks, transform=(0.0, 0.0, 0.0, 0.0, 0.0), chunk_size=65536, tolerance=1e-9):
+        """
+        Для кожного блоку точок (K, 2) з ітератора blocks - (відстань (K,),
+        бік (K,) int8: -1 всередині, +1 зовні, 0 на кривій, t основи перпендикуляра (K,)).
+        На кривій - якщо ρ відрізняється від a (1 - cos φ) не більше ніж на tolerance * a;
+        сюди ж належить точка повернення (ρ = 0), де напрям φ не визначений.
+        Блоки обробляються порціями по chunk_size, тож пам'ять не залежить від
+        загальної кількості точок (напр. блоки з np.load(..., mmap_mode="r")).
+        """
+        curve = get_curve("cardioid")  # Пошук найближчої точки - спільний з lab2
+        eps = tolerance * abs(a)
+        for block in blocks:
+            block = np.asarray(block).reshape(-1, 2)
+            dist = np.empty(len(block))
+            side = np.empty(len(block), dtype=np.int8)
+            t = np.empty(len(block))
+            for first in range(0, len(block), chunk_size):
+                part = slice(first, first + chunk_size)
+                q = CardioidCurve.to_local(block[part], transform)
+                t[part], dist[part] = curve.closest_t(a, q)
+                # Кардіоїда зіркова відносно точки повернення: всередині, якщо ρ < a (1 - cos φ)
+                rho = np.hypot(q[:, 0], q[:, 1])
+                gap = rho - a * (1 - q[:, 0] / np.maximum(rho, 1e-300))
+                side[part] = np.where((np.abs(gap) <= eps) | (rho <= eps), 0, np.sign(gap))
+            yield dist, side, t
+
+    @staticmethod
+    def classify(a, points, transform=(0.0, 0.0, 0.0, 0.0, 0.0), chunk_size=65536, tolerance=1e-9):
+        """Те саме для одного масиву (N, 2): (відстань, бік, t)"""
+        return next(CardioidCurve.classify_stream(a, [points], transform, chunk_size, tolerance))
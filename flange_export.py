@@ -0,0 +1,96 @@
+import math
+import numpy as np
+
+from flange_math import FlangeGeometry
+
+
+# ==========================================
+# ЕКСПОРТ ФЛАНЦІВ У DXF / SVG (для CAM)
+# ==========================================
+# Контур пишеться точними примітивами: дуги, відрізки, кола.
+# Деталі генеруються порціями по chunk_size і одразу пишуться у файл,
+# тож пам'ять не залежить від кількості деталей.
+
+class FlangeExporter:
+    def __init__(self, params, n_lobes=3, gap=10.0, chunk_size=1024):
+        self.params = np.asarray(params, dtype=np.float64).reshape(-1, 4)
+        self.n_lobes = n_lobes
+        self.chunk_size = chunk_size
+
+        # Розкладка деталей сіткою: клітинка за найбільшою деталлю
+        extent = self.params[:, 1] / 2 + self.params[:, 3] if len(self.params) else np.zeros(1)
+        self.cell = 2 * float(extent.max()) + gap
+        self.cols = max(1, math.ceil(math.sqrt(len(self.params))))
+        self.rows = max(1, math.ceil(len(self.params) / self.cols))
+
+    def iter_parts(self):
+        """Повертає (зсув x, зсув y, контур) по одній деталі, будуючи їх порціями"""
+        for first in range(0, len(self.params), self.chunk_size):
+            batch = FlangeGeometry.build_batch(self.params[first:first + self.chunk_size], self.n_lobes)
+            centers = batch.centers.tolist()
+            r_corner = batch.r_corner.tolist()
+            start = np.degrees(batch.arc_start).tolist()
+            end = np.degrees(batch.arc_start + batch.arc_sweep).tolist()
+            line_start = batch.line_start.tolist()
+            line_end = batch.line_end.tolist()
+            holes = batch.holes.tolist()
+            for k in range(len(centers)):
+                m = first + k
+                ox = (m % self.cols) * self.cell
+                oy = -(m // self.cols) * self.cell
+                yield ox, oy, (centers[k], r_corner[k], start[k], end[k], line_start[k], line_end[k], holes[k])
+
+    # --- DXF (R12, ASCII) ---
+    def write_dxf(self, f):
+        f.write("0\nSECTION\n2\nENTITIES\n")
+        count = 0
+        for ox, oy, (centers, r, start, end, line_start, line_end, holes) in self.iter_parts():
+            for (cx, cy), a0, a1, (x0, y0), (x1, y1) in zip(centers, start, end, line_start, line_end):
+                f.write("0\nARC\n8\nOUTER\n10\n%.4f\n20\n%.4f\n40\n%.4f\n50\n%.4f\n51\n%.4f\n"
+                        % (cx + ox, cy + oy, r, a0, a1))
+                f.write("0\nLINE\n8\nOUTER\n10\n%.4f\n20\n%.4f\n11\n%.4f\n21\n%.4f\n"
+                        % (x0 + ox, y0 + oy, x1 + ox, y1 + oy))
+            for cx, cy, rh in holes:
+                f.write("0\nCIRCLE\n8\nHOLES\n10\n%.4f\n20\n%.4f\n40\n%.4f\n" % (cx + ox, cy + oy, rh))
+            count += 1
+        f.write("0\nENDSEC\n0\nEOF\n")
+        return count
+
+    # --- SVG ---
+    def write_svg(self, f):
+        """Вісь Y перевертається (SVG - вниз), тому дуги проти год. стрілки мають sweep-flag = 0"""
+        width = self.cols * self.cell
+        height = self.rows * self.cell
+        half = self.cell / 2
+        f.write('<svg xmlns="http://www.w3.org/2000/svg" viewBox="%.4f %.4f %.4f %.4f">\n'
+                % (-half, -half, width, height))
+        f.write('<g fill="none" stroke="black" stroke-width="0.5">\n')
+        count = 0
+        for ox, oy, (centers, r, start, end, line_start, line_end, holes) in self.iter_parts():
+            parts = ["M%.4f %.4f" % (line_end[-1][0] + ox, -(line_end[-1][1] + oy))]
+            for (cx, cy), a0, a1, (x1, y1) in zip(centers, start, end, line_end):
+                # Дугу ділимо навпіл: кожна половина <= 180°, і повне коло (N = 1) теж коректне
+                mid = math.radians((a0 + a1) / 2)
+                parts.append("A%.4f %.4f 0 0 0 %.4f %.4f" % (
+                    r, r, cx + ox + r * math.cos(mid), -(cy + oy + r * math.sin(mid))))
+                end_rad = math.radians(a1)
+                parts.append("A%.4f %.4f 0 0 0 %.4f %.4f" % (
+                    r, r, cx + ox + r * math.cos(end_rad), -(cy + oy + r * math.sin(end_rad))))
+                parts.append("L%.4f %.4f" % (x1 + ox, -(y1 + oy)))
+            parts.append("Z")
+            f.write('<path d="%s"/>\n' % " ".join(parts))
+            for cx, cy, rh in holes:
+                f.write('<circle cx="%.4f" cy="%.4f" r="%.4f"/>\n' % (cx + ox, -(cy + oy), rh))
+            count += 1
+        f.write('</g>\n</svg>\n')
+        return count
+
+
+def export_flanges(path, params, n_lobes=3, gap=10.0):
+    """Формат за розширенням файлу (.dxf або .svg); повертає кількість деталей"""
+    ext = path.lower().rsplit(".", 1)[-1]
+    if ext not in ("dxf", "svg"):
+        raise ValueError(f"Невідомий формат: {path}")
+    exporter = FlangeExporter(params, n_lobes, gap)
+    with open(path, "w", encoding="utf-8") as f:
+        return exporter.write_dxf(f) if ext == "dxf" else exporter.write_svg(f)
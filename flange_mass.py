@@ -0,0 +1,127 @@
+import math
+import numpy as np
+
+from flange_math import FlangeGeometry
+
+
+# ==========================================
+# МАСО-ГЕОМЕТРИЧНІ ХАРАКТЕРИСТИКИ ФЛАНЦЯ
+# ==========================================
+# Моменти збираються у вектор [A, ∫x, ∫y, ∫x², ∫y², ∫xy] (відносно початку координат).
+# Кожне ребро контуру дає внесок трикутника (O, P0, P1) - формула Гріна.
+# Дуга P0 -> P1 з центром C = трикутник (O, P0, C) + сектор + трикутник (O, C, P1),
+# тобто два "допоміжні" ребра P0 -> C, C -> P1 плюс точний сектор.
+
+STEEL_DENSITY = 7.85e-3  # г/мм³
+
+
+class FlangeMass:
+    @staticmethod
+    def edge_moments(p0, p1):
+        """Внески ребер (..., 2) -> (..., 6), сума по замкненому контуру - точна"""
+        x0, y0 = p0[..., 0], p0[..., 1]
+        x1, y1 = p1[..., 0], p1[..., 1]
+        cross = x0 * y1 - x1 * y0
+        return np.stack((
+            cross / 2,
+            (x0 + x1) * cross / 6,
+            (y0 + y1) * cross / 6,
+            (x0 * x0 + x0 * x1 + x1 * x1) * cross / 12,
+            (y0 * y0 + y0 * y1 + y1 * y1) * cross / 12,
+            (x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0) * cross / 24,
+        ), axis=-1)
+
+    @staticmethod
+    def sector_moments(center, r, start, sweep):
+        """
+        Точні моменти кругового сектора (знак = напрям обходу).
+        sweep = ±2pi дає повне коло.
+        """
+        cx, cy = center[..., 0], center[..., 1]
+        r = np.asarray(r, dtype=np.float64)
+        end = start + sweep
+        s0, s1 = np.sin(start), np.sin(end)
+        c0, c1 = np.cos(start), np.cos(end)
+        r3 = r ** 3 / 3
+        r4 = r ** 4 / 4
+
+        # Локальні моменти (центр сектора в початку координат)
+        a = r * r * sweep / 2
+        u = r3 * (s1 - s0)
+        v = r3 * (c0 - c1)
+        dsin2 = (np.sin(2 * end) - np.sin(2 * start)) / 4
+        uu = r4 * (sweep / 2 + dsin2)
+        vv = r4 * (sweep / 2 - dsin2)
+        uv = r4 * (s1 * s1 - s0 * s0) / 2
+
+        # Перенос у глобальні координати
+        return np.stack((
+            a + 0 * cx,
+            u + cx * a,
+            v + cy * a,
+            uu + 2 * cx * u + cx * cx * a,
+            vv + 2 * cy * v + cy * cy * a,
+            uv + cx * v + cy * u + cx * cy * a,
+        ), axis=-1)
+
+    @staticmethod
+    def raw_moments(centers, r_corner, arc_start, arc_sweep, line_start, line_end, holes):
+        """
+        Моменти фланця з масивів контуру. Усі аргументи можуть мати
+        додатковий ведучий вимір (M, ...) для пакетного розрахунку.
+        """
+        r = np.asarray(r_corner, dtype=np.float64)[..., None]
+        arc_end = arc_start + arc_sweep
+        p0 = centers + r[..., None] * np.stack((np.cos(arc_start), np.sin(arc_start)), axis=-1)
+        p1 = centers + r[..., None] * np.stack((np.cos(arc_end), np.sin(arc_end)), axis=-1)
+
+        total = FlangeMass.edge_moments(line_start, line_end).sum(axis=-2)
+        total += FlangeMass.edge_moments(p0, centers).sum(axis=-2)
+        total += FlangeMass.edge_moments(centers, p1).sum(axis=-2)
+        total += FlangeMass.sector_moments(centers, r, arc_start, arc_sweep).sum(axis=-2)
+
+        # Отвори - повні кола з обходом за годинниковою стрілкою
+        zero = np.zeros(holes.shape[:-1])
+        total += FlangeMass.sector_moments(holes[..., :2], holes[..., 2], zero, zero - 2 * math.pi).sum(axis=-2)
+        return total
+
+    @staticmethod
+    def from_moments(m, thickness=10.0, density=STEEL_DENSITY):
+        """Моменти -> площа, центр мас, моменти інерції відносно центру мас, маса"""
+        area = m[..., 0]
+        cx = m[..., 1] / area
+        cy = m[..., 2] / area
+        ix = m[..., 4] - area * cy * cy  # ∫y² dA
+        iy = m[..., 3] - area * cx * cx  # ∫x² dA
+        ixy = m[..., 5] - area * cx * cy
+        return {
+            "area": area,
+            "cx": cx,
+            "cy": cy,
+            "ix": ix,
+            "iy": iy,
+            "ixy": ixy,
+            "j": ix + iy,
+            "mass": area * thickness * density,
+        }
+
+    @staticmethod
+    def properties(contour, thickness=10.0, density=STEEL_DENSITY):
+        """Характеристики одного FlangeContour"""
+        m = FlangeMass.raw_moments(
+            contour.centers, contour.r_corner, contour.arc_start, contour.arc_sweep,
+            contour.line_start, contour.line_end, contour.holes
+        )
+        return {k: float(v) for k, v in FlangeMass.from_moments(m, thickness, density).items()}
+
+    @staticmethod
+    def batch_properties(params, n_lobes=3, thickness=10.0, density=STEEL_DENSITY):
+        """
+        Масив (M, 4) рядків (D центр, BCD, d отворів, R кутів) -> словник масивів (M,).
+        Контури будуються відразу для всіх рядків, без циклу Python.
+        """
+        c = FlangeGeometry.build_batch(params, n_lobes)
+        m = FlangeMass.raw_moments(
+            c.centers, c.r_corner, c.arc_start, c.arc_sweep, c.line_start, c.line_end, c.holes
+        )
+        return FlangeMass.from_moments(m, thickness, density)
@@ -0,0 +1,329 @@
+import math
+import numpy as np
+
+
+# ==========================================
+# 1. АНАЛІТИЧНИЙ КОНТУР ФЛАНЦЯ (без Qt)
+# ==========================================
+class FlangeContour:
+    """
+    Точний контур фланця з N "вухами".
+    Зовнішня межа: дуга навколо центру i -> відрізок i -> дуга i+1 -> ...
+    Отвори: кола (cx, cy, r), перший - центральний.
+    """
+
+    def __init__(self, centers, r_corner, arc_start, arc_sweep, line_start, line_end, holes):
+        self.centers = centers  # (N, 2) центри вух
+        self.r_corner = r_corner  # R заокруглення (однаковий для всіх дуг)
+        self.arc_start = arc_start  # (N,) початковий кут дуги, рад
+        self.arc_sweep = arc_sweep  # (N,) розмах дуги, рад (проти год. стрілки)
+        self.line_start = line_start  # (N, 2) дотичні відрізки
+        self.line_end = line_end  # (N, 2)
+        self.holes = holes  # (N + 1, 3)
+
+    @property
+    def n_lobes(self):
+        return self.centers.shape[-2]
+
+
+class FlangeGeometry:
+    @staticmethod
+    def lobe_centers(r_bcd, n_lobes=3):
+        """Центри вух на колі BCD: перший на 90°, далі через 360/N"""
+        alpha = math.pi / 2 + 2 * math.pi * np.arange(n_lobes) / n_lobes
+        return np.column_stack((r_bcd * np.cos(alpha), r_bcd * np.sin(alpha))), alpha
+
+    @staticmethod
+    def build(center_d, bcd_d, hole_d, corner_r, n_lobes=3):
+        """
+        Опукла оболонка N кіл радіуса R (сума Мінковського правильного
+        N-кутника з кругом) мінус отвори. Усе в замкненій формі, O(N).
+
+        Для правильного N-кутника зовнішня нормаль ребра i має кут
+        alpha_i + pi/N, тому кожна дуга має розмах 2pi/N.
+        Перетин отворів між собою не перевіряється (див. валідатор).
+        """
+        r_bcd = bcd_d / 2.0
+        r_corner = float(corner_r)
+        centers, alpha = FlangeGeometry.lobe_centers(r_bcd, n_lobes)
+
+        half = math.pi / n_lobes
+        arc_start = alpha - half
+        arc_sweep = np.full(n_lobes, 2 * half)
+
+        # Дотична i: від кінця дуги i до початку дуги i+1 (спільна нормаль)
+        phi = alpha + half
+        normal = np.column_stack((np.cos(phi), np.sin(phi))) * r_corner
+        line_start = centers + normal
+        line_end = np.roll(centers, -1, axis=0) + normal
+
+        holes = np.empty((n_lobes + 1, 3))
+        holes[0] = (0.0, 0.0, center_d / 2.0)
+        holes[1:, :2] = centers
+        holes[1:, 2] = hole_d / 2.0
+
+        return FlangeContour(centers, r_corner, arc_start, arc_sweep, line_start, line_end, holes)
+
+    @staticmethod
+    def build_batch(params, n_lobes=3):
+        """
+        Те саме, що build, але відразу для масиву (M, 4) рядків
+        (D центр, BCD, d отворів, R кутів). Масиви FlangeContour
+        отримують ведучий вимір M, r_corner стає масивом (M,).
+        """
+        params = np.asarray(params, dtype=np.float64).reshape(-1, 4)
+        center_d, bcd_d, hole_d, corner_r = params.T
+        m_rows = len(params)
+
+        unit, alpha = FlangeGeometry.lobe_centers(1.0, n_lobes)
+        half = math.pi / n_lobes
+        centers = unit[None, :, :] * (bcd_d / 2)[:, None, None]
+        arc_start = np.broadcast_to(alpha - half, (m_rows, n_lobes))
+        arc_sweep = np.full((m_rows, n_lobes), 2 * half)
+
+        phi = alpha + half
+        normal = np.column_stack((np.cos(phi), np.sin(phi)))[None] * corner_r[:, None, None]
+        line_start = centers + normal
+        line_end = np.roll(centers, -1, axis=1) + normal
+
+        holes = np.zeros((m_rows, n_lobes + 1, 3))
+        holes[:, 0, 2] = center_d / 2
+        holes[:, 1:, :2] = centers
+        holes[:, 1:, 2] = (hole_d / 2)[:, None]
+
+        return FlangeContour(centers, corner_r, arc_start, arc_sweep, line_start, line_end, holes)
+
+    @staticmethod
+    def arc_segments(radius, sweep, tolerance):
+        """Кількість хорд, щоб прогин дуги не перевищував tolerance"""
+        if radius <= 0:
+            return 1
+        ratio = max(-1.0, 1.0 - tolerance / radius)
+        step = 2 * math.acos(ratio)
+        if step <= 0:
+            step = 1e-3
+        return max(1, math.ceil(abs(sweep) / step))
+
+    @staticmethod
+    def circle_points(cx, cy, r, tolerance):
+        """Коло як замкнена полілінія (без повтору першої точки)"""
+        n = max(3, FlangeGeometry.arc_segments(r, 2 * math.pi, tolerance))
+        t = np.linspace(0.0, 2 * math.pi, n, endpoint=False)
+        return np.column_stack((cx + r * np.cos(t), cy + r * np.sin(t)))
+
+    @staticmethod
+    def flatten(contour, tolerance=0.25):
+        """
+        Перетворює точний контур у полілінії з похибкою <= tolerance.
+        Повертає (outer (K, 2), [hole (k, 2), ...]).
+        Відрізки між дугами неявні: кінець дуги i -> початок дуги i+1.
+        """
+        n = FlangeGeometry.arc_segments(contour.r_corner, contour.arc_sweep[0], tolerance)
+        s = np.linspace(0.0, 1.0, n + 1)
+        ang = contour.arc_start[:, None] + contour.arc_sweep[:, None] * s[None, :]
+        outer = np.empty(ang.shape + (2,))
+        outer[..., 0] = contour.centers[:, 0, None] + contour.r_corner * np.cos(ang)
+        outer[..., 1] = contour.centers[:, 1, None] + contour.r_corner * np.sin(ang)
+        outer = outer.reshape(-1, 2)
+
+        cx, cy, r_center = contour.holes[0]
+        holes = [FlangeGeometry.circle_points(cx, cy, r_center, tolerance)]
+
+        # Малі отвори мають однаковий радіус - рахуємо всі разом
+        r_hole = contour.holes[1, 2]
+        m = max(3, FlangeGeometry.arc_segments(r_hole, 2 * math.pi, tolerance))
+        t = np.linspace(0.0, 2 * math.pi, m, endpoint=False)
+        ring = np.column_stack((np.cos(t), np.sin(t))) * r_hole
+        holes.extend(contour.holes[1:, None, :2] + ring[None, :, :])
+        return outer, holes
+
+
+# ==========================================
+# 2. ПАКЕТНА ГЕНЕРАЦІЯ (перебір параметрів)
+# ==========================================
+class FlangeBatch:
+    """
+    Полілінії багатьох фланців в одному суцільному буфері.
+    points[offsets[k]:offsets[k + 1]] - кільце k;
+    кільця деталі m: part_offsets[m] .. part_offsets[m + 1],
+    перше з них - зовнішній контур, решта - отвори.
+    """
+
+    def __init__(self, points, offsets, part_offsets):
+        self.points = points  # (P, 2) float64
+        self.offsets = offsets  # (R + 1,) int64
+        self.part_offsets = part_offsets  # (M + 1,) int64
+
+    def __len__(self):
+        return len(self.part_offsets) - 1
+
+    def ring(self, k):
+        return self.points[self.offsets[k]:self.offsets[k + 1]]
+
+    def part(self, m):
+        """(outer, [holes]) для деталі m - без копіювання"""
+        first, last = self.part_offsets[m], self.part_offsets[m + 1]
+        return self.ring(first), [self.ring(k) for k in range(first + 1, last)]
+
+    @staticmethod
+    def concatenate(batches):
+        """Зшиває кілька пакетів в один зі зсувом індексів"""
+        points = np.concatenate([b.points for b in batches])
+        offsets = [np.zeros(1, dtype=np.int64)]
+        part_offsets = [np.zeros(1, dtype=np.int64)]
+        base_pt = 0
+        base_ring = 0
+        for b in batches:
+            offsets.append(b.offsets[1:] + base_pt)
+            part_offsets.append(b.part_offsets[1:] + base_ring)
+            base_pt += b.offsets[-1]
+            base_ring += b.part_offsets[-1]
+        return FlangeBatch(points, np.concatenate(offsets), np.concatenate(part_offsets))
+
+
+def _generate_chunk(args):
+    """Робота одного процесу: рядки параметрів -> FlangeBatch"""
+    params, n_lobes, tolerance = args
+    rings = []
+    for center_d, bcd_d, hole_d, corner_r in params.tolist():
+        contour = FlangeGeometry.build(center_d, bcd_d, hole_d, corner_r, n_lobes)
+        outer, holes = FlangeGeometry.flatten(contour, tolerance)
+        rings.append(outer)
+        rings.extend(holes)
+
+    lengths = np.fromiter((len(r) for r in rings), dtype=np.int64, count=len(rings))
+    offsets = np.zeros(len(rings) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    part_offsets = np.arange(len(params) + 1, dtype=np.int64) * (n_lobes + 2)
+    points = np.concatenate(rings) if rings else np.empty((0, 2))
+    return FlangeBatch(points, offsets, part_offsets)
+
+
+def generate_batch(params, n_lobes=3, tolerance=0.25, workers=None, chunk_size=2000):
+    """
+    Масив (M, 4) рядків (D центр, BCD, d отворів, R кутів) -> FlangeBatch.
+    Великі пакети розподіляються між процесами (concurrent.futures);
+    workers=1 - рахувати в поточному процесі.
+    """
+    params = np.ascontiguousarray(params, dtype=np.float64).reshape(-1, 4)
+    chunks = [params[i:i + chunk_size] for i in range(0, len(params), chunk_size)]
+    if not chunks:
+        return _generate_chunk((params, n_lobes, tolerance))
+
+    if workers == 1 or len(chunks) == 1:
+        parts = [_generate_chunk((c, n_lobes, tolerance)) for c in chunks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_generate_chunk, [(c, n_lobes, tolerance) for c in chunks]))
+    return FlangeBatch.concatenate(parts)
+
+
+# ==========================================
+# 3. ПРОЕКТИВНІ ПЕРЕТВОРЕННЯ ПОЛІЛІНІЙ
+# ==========================================
+class Homography:
+    """
+    Матриця 3x3 у конвенції QTransform: рядок [x, y, 1] множиться справа,
+    x' = m11 x + m21 y + m31, y' = m12 x + m22 y + m32, w = m13 x + m23 y + m33.
+    """
+
+    @staticmethod
+    def to_homogeneous(points):
+        return np.column_stack((points, np.ones(len(points))))
+
+    @staticmethod
+    def apply(matrix, points_h):
+        """Усі вершини одним множенням: (P, 3) @ (3, 3)"""
+        return points_h @ matrix
+
+    @staticmethod
+    def clip_ring(h, eps=1e-3):
+        """
+        Відсікання замкненого кільця площиною w = eps (Сазерленд-Ходжман)
+        і ділення на w. Вершини з w <= 0 не дають "вивернутих" точок.
+        """
+        w = h[:, 2]
+        inside = w > eps
+        if inside.all():
+            return h[:, :2] / w[:, None]
+        if not inside.any():
+            return np.empty((0, 2))
+
+        nxt = np.roll(h, -1, axis=0)
+        crossing = inside != np.roll(inside, -1)
+        a, b = h[crossing], nxt[crossing]
+        t = (eps - a[:, 2]) / (b[:, 2] - a[:, 2])
+        inter = a + t[:, None] * (b - a)
+
+        # Для вершини i: спочатку сама вершина (якщо видима), потім точка перетину
+        counts = inside.astype(np.int64) + crossing
+        pos = np.cumsum(counts) - counts
+        out = np.empty((counts.sum(), 3))
+        out[pos[inside]] = h[inside]
+        out[(pos + inside)[crossing]] = inter
+        return out[:, :2] / out[:, 2:3]
+
+
+# ==========================================
+# 4. ПРАВИЛА КОНСТРУЮВАННЯ (перевірка параметрів)
+# ==========================================
+MIN_WALL = 3.0  # мм - найтонша допустима стінка / перемичка
+
+# Назва правила -> підпис для інтерфейсу
+FLANGE_RULES = {
+    "lobe_wall": "Стінка вуха навколо отвору",
+    "hole_ligament": "Перемичка між отворами",
+    "center_ligament": "Перемичка центр - отвори",
+    "center_wall": "Стінка навколо центрального отвору",
+}
+
+
+class FlangeRules:
+    """
+    Товщини стінок у замкненій формі, без побудови контуру.
+    Запас правила = товщина - MIN_WALL (>= 0 - правило виконано).
+    """
+
+    @staticmethod
+    def margins(params, n_lobes=3, min_wall=MIN_WALL):
+        """
+        Рядок (4,) або масив (M, 4) (D центр, BCD, d отворів, R кутів)
+        -> словник запасів (скаляри або масиви (M,)), один прохід numpy.
+        """
+        params = np.asarray(params, dtype=np.float64)
+        r_center = params[..., 0] / 2
+        r_bcd = params[..., 1] / 2
+        r_hole = params[..., 2] / 2
+        r_corner = params[..., 3]
+        half = math.pi / n_lobes
+
+        # Отвір концентричний з дугою вуха, а дотичні віддалені від центру вуха на R
+        lobe_wall = r_corner - r_hole
+        # Сусідні отвори на колі BCD: хорда 2 r sin(pi/N)
+        if n_lobes > 1:
+            hole_ligament = 2 * r_bcd * math.sin(half) - 2 * r_hole
+        else:
+            hole_ligament = np.full_like(r_bcd, np.inf)
+        center_ligament = r_bcd - r_hole - r_center
+        # Найближча до центру точка контуру: вписане коло ядра + R (для N = 1, 2 теж вірно)
+        center_wall = r_bcd * math.cos(half) + r_corner - r_center
+
+        return {
+            "lobe_wall": lobe_wall - min_wall,
+            "hole_ligament": hole_ligament - min_wall,
+            "center_ligament": center_ligament - min_wall,
+            "center_wall": center_wall - min_wall,
+        }
+
+    @staticmethod
+    def feasible(params, n_lobes=3, min_wall=MIN_WALL):
+        """Маска допустимих рядків - для відсіювання перед генерацією"""
+        m = FlangeRules.margins(params, n_lobes, min_wall)
+        return np.logical_and.reduce([v >= 0 for v in m.values()])
+
+    @staticmethod
+    def violations(params, n_lobes=3, min_wall=MIN_WALL):
+        """Порушені правила одного набору: [(підпис, запас мм), ...]"""
+        m = FlangeRules.margins(params, n_lobes, min_wall)
+        return [(FLANGE_RULES[k], float(v)) for k, v in m.items() if v < 0]
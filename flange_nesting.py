@@ -0,0 +1,259 @@
+import math
+import numpy as np
+
+from flange_math import FlangeGeometry
+
+
+# ==========================================
+# РОЗКРІЙ ЛИСТА: БАГАТО ОДНАКОВИХ ФЛАНЦІВ
+# ==========================================
+# Зовнішній контур фланця = опуклий N-кутник центрів вух (ядро) ⊕ круг радіуса R.
+# Тому дві деталі перетинаються тоді й лише тоді, коли відстань між їхніми
+# ядрами < 2R (+ зазор): точна перевірка дуг без булевих операцій.
+# Поза (pose) деталі - рядок (x, y, кут у радіанах).
+
+class NestingMath:
+    @staticmethod
+    def core_vertices(core, poses):
+        """Вершини ядра для кожної пози: (K, N, 2)"""
+        c, s = np.cos(poses[:, 2]), np.sin(poses[:, 2])
+        x = core[None, :, 0] * c[:, None] - core[None, :, 1] * s[:, None] + poses[:, 0, None]
+        y = core[None, :, 0] * s[:, None] + core[None, :, 1] * c[:, None] + poses[:, 1, None]
+        return np.stack((x, y), axis=-1)
+
+    @staticmethod
+    def aabb(core, r_corner, poses):
+        """Габарити (K, 4): xmin, ymin, xmax, ymax"""
+        v = NestingMath.core_vertices(core, poses)
+        return np.concatenate((v.min(axis=1) - r_corner, v.max(axis=1) + r_corner), axis=1)
+
+    @staticmethod
+    def point_segment_distance(p, a, b):
+        """Відстані від точок p (P, N, 2) до відрізків a->b (P, M, 2): (P, N, M)"""
+        ab = b - a
+        ap = p[:, :, None, :] - a[:, None, :, :]
+        denom = np.maximum((ab * ab).sum(-1), 1e-12)[:, None, :]
+        t = np.clip((ap * ab[:, None, :, :]).sum(-1) / denom, 0.0, 1.0)
+        closest = a[:, None, :, :] + t[..., None] * ab[:, None, :, :]
+        return np.linalg.norm(p[:, :, None, :] - closest, axis=-1)
+
+    @staticmethod
+    def convex_distance(pa, pb):
+        """
+        Відстань між парами опуклих многокутників (P, N, 2) і (P, M, 2).
+        Перетин (немає роздільної осі за теоремою SAT) дає 0.
+        """
+        def normals(p):
+            e = np.roll(p, -1, axis=1) - p
+            return np.stack((-e[..., 1], e[..., 0]), axis=-1)
+
+        # Вісь між центрами потрібна для вироджених ядер (точка при N = 1)
+        centers = (pb.mean(axis=1) - pa.mean(axis=1))[:, None, :]
+        axes = np.concatenate((normals(pa), normals(pb), centers), axis=1)
+        proj_a = np.einsum('pkd,pnd->pkn', axes, pa)
+        proj_b = np.einsum('pkd,pnd->pkn', axes, pb)
+        separated = (proj_a.max(-1) < proj_b.min(-1)) | (proj_b.max(-1) < proj_a.min(-1))
+        intersect = ~separated.any(axis=1)
+
+        ea, eb = np.roll(pa, -1, axis=1), np.roll(pb, -1, axis=1)
+        d = np.minimum(
+            NestingMath.point_segment_distance(pa, pb, eb).min(axis=(1, 2)),
+            NestingMath.point_segment_distance(pb, pa, ea).min(axis=(1, 2)),
+        )
+        return np.where(intersect, 0.0, d)
+
+    @staticmethod
+    def parts_overlap(core, r_corner, poses_a, poses_b, gap=0.0):
+        """Вузька фаза для пар поз (P, 3): True, якщо деталі ближчі за зазор"""
+        da = NestingMath.core_vertices(core, poses_a)
+        db = NestingMath.core_vertices(core, poses_b)
+        return NestingMath.convex_distance(da, db) < 2 * r_corner + gap
+
+    @staticmethod
+    def sweep_and_prune(boxes):
+        """
+        Широка фаза: пари (i, j) з перетином габаритів.
+        Сортування по xmin, для кожного - діапазон сусідів по searchsorted,
+        потім відсіювання по y. Без циклу Python по деталях.
+        """
+        order = np.argsort(boxes[:, 0], kind='stable')
+        b = boxes[order]
+        hi = np.searchsorted(b[:, 0], b[:, 2], side='right')
+        counts = np.maximum(hi - np.arange(len(b)) - 1, 0)
+        i = np.repeat(np.arange(len(b)), counts)
+        starts = np.cumsum(counts) - counts
+        j = np.arange(counts.sum()) - np.repeat(starts, counts) + i + 1
+        keep = (b[i, 1] <= b[j, 3]) & (b[j, 1] <= b[i, 3])
+        return order[i[keep]], order[j[keep]]
+
+    @staticmethod
+    def find_overlaps(core, r_corner, poses, gap=0.0, chunk=65536):
+        """Усі пари деталей, що перетинаються: широка фаза + точна вузька"""
+        boxes = NestingMath.aabb(core, r_corner, poses)
+        boxes[:, :2] -= gap / 2
+        boxes[:, 2:] += gap / 2
+        i, j = NestingMath.sweep_and_prune(boxes)
+        hits = np.zeros(len(i), dtype=bool)
+        for k in range(0, len(i), chunk):
+            hits[k:k + chunk] = NestingMath.parts_overlap(
+                core, r_corner, poses[i[k:k + chunk]], poses[j[k:k + chunk]], gap * (1 - 1e-6)
+            )
+        return i[hits], j[hits]
+
+
+class NestingLayout:
+    def __init__(self, poses, sheet_width, sheet_height, pitch, row_step):
+        self.poses = poses  # (K, 3)
+        self.sheet_width = sheet_width
+        self.sheet_height = sheet_height
+        self.pitch = pitch  # крок між сусідами в ряду
+        self.row_step = row_step  # крок між рядами
+
+    def __len__(self):
+        return len(self.poses)
+
+
+class FlangeNesting:
+    """
+    Розкладка однакових деталей ґраткою: у ряду орієнтації чергуються
+    (0 і pi/N - "зуб у западину"), наступний ряд зсунутий і опущений
+    до дотику. Параметри ґратки шукаються векторизованим перебором
+    з уточненням бісекцією, тому вартість не залежить від кількості деталей.
+    """
+
+    def __init__(self, params, n_lobes=3, gap=5.0):
+        center_d, bcd_d, hole_d, corner_r = params
+        self.n_lobes = n_lobes
+        self.r_corner = float(corner_r)
+        self.gap = gap
+        self.core, _ = FlangeGeometry.lobe_centers(bcd_d / 2.0, n_lobes)
+        self.radius = bcd_d / 2.0 + self.r_corner  # описане коло деталі
+        self.angles = np.array([0.0, math.pi / n_lobes])
+
+    def overlap(self, poses_a, poses_b):
+        return NestingMath.parts_overlap(self.core, self.r_corner, poses_a, poses_b, self.gap)
+
+    def min_feasible(self, make_pairs, hi, samples=128, iters=24):
+        """
+        Найменше значення параметра d в [0, hi], з якого далі немає перетинів.
+        make_pairs(d (S,)) -> (poses_a, poses_b) з S * k парами.
+        """
+        d = np.linspace(0.0, hi, samples)
+        a, b = make_pairs(d)
+        bad = self.overlap(a, b).reshape(samples, -1).any(axis=1)
+        if not bad.any():
+            return 0.0
+        last_bad = np.nonzero(bad)[0].max()
+        if last_bad == samples - 1:
+            return hi
+        lo, up = d[last_bad], d[last_bad + 1]
+        for _ in range(iters):
+            mid = (lo + up) / 2
+            a, b = make_pairs(np.array([mid]))
+            if self.overlap(a, b).any():
+                lo = mid
+            else:
+                up = mid
+        return up
+
+    def pattern(self, i, shift, y, pitch, h, parity):
+        """
+        Пози деталей з індексами i у ряду: x = shift + i * pitch.
+        Орієнтація чергується; деталі з кутом pi/N підняті на h.
+        """
+        odd = (i + parity) % 2
+        return np.column_stack((shift + i * pitch, y + odd * h, self.angles[odd]))
+
+    @staticmethod
+    def pair_sampler(pa_base, pb_base, axis):
+        """
+        make_pairs для min_feasible: пари (pa_base[k], pb_base[k]), де друга
+        деталь зсунута на d вздовж осі axis (0 - x, 1 - y).
+        """
+        def make_pairs(d):
+            pa = np.tile(pa_base, (len(d), 1))
+            pb = np.tile(pb_base, (len(d), 1))
+            pb[:, axis] += np.repeat(d, len(pb_base))
+            return pa, pb
+
+        return make_pairs
+
+    def solve_pitch(self, h, p_same):
+        """Найменший крок у ряду, якщо деталі з кутом pi/N підняті на h"""
+        a0, a1 = self.angles
+        # Сусід справа (d, h) і, відносно нього, сусід зліва (d, -h)
+        sampler = self.pair_sampler(
+            np.array([[0.0, 0.0, a0], [0.0, 0.0, a1]]),
+            np.array([[0.0, h, a1], [0.0, -h, a0]]), 0
+        )
+        return max(self.min_feasible(sampler, 2 * self.radius + self.gap), p_same)
+
+    def solve(self, n_offsets=9):
+        """
+        Параметри ґратки (pitch, h, v, s, flip) з найменшою площею на деталь pitch * v.
+        Кожне h оцінюється грубо, найкраще - уточнюється.
+        """
+        origin = np.array([[0.0, 0.0, self.angles[0]]])
+        # Деталі однакової орієнтації стоять через одну (i та i + 2)
+        p_same = self.min_feasible(self.pair_sampler(origin, origin.copy(), 0), 2 * self.radius + self.gap) / 2
+
+        best = None
+        for h in np.linspace(-self.radius, self.radius, n_offsets):
+            pitch = self.solve_pitch(h, p_same)
+            v, s, flip = self.solve_rows(pitch, h, n_shifts=8, iters=6)
+            if best is None or pitch * v < best[0]:
+                best = (pitch * v, h, pitch)
+        _, h, pitch = best
+        v, s, flip = self.solve_rows(pitch, h)
+        return pitch, h, v, s, flip
+
+    def solve_rows(self, pitch, h, n_shifts=32, iters=24):
+        """Зсув s і крок v наступного ряду; flip - чи міняється порядок орієнтацій"""
+        hi = 4 * self.radius + self.gap
+        lower = self.pattern(np.arange(-4, 5), 0.0, 0.0, pitch, h, 0)
+        best = None
+        for flip in (0, 1):
+            for s in np.linspace(0.0, 2 * pitch, n_shifts, endpoint=False):
+                upper = self.pattern(np.array([0, 1]), s, 0.0, pitch, h, flip)
+                sampler = self.pair_sampler(
+                    np.tile(lower, (len(upper), 1)), np.repeat(upper, len(lower), axis=0), 1
+                )
+                v = self.min_feasible(sampler, hi, iters=iters)
+                if best is None or v < best[0] - 1e-9:
+                    best = (v, s, flip)
+        return best
+
+    def layout(self, count, sheet_width):
+        """Розкладає count деталей на листі шириною sheet_width (висота - скільки знадобиться)"""
+        if 2 * self.radius > sheet_width:
+            raise ValueError("Деталь ширша за лист")
+        pitch, h, v, s, flip = self.solve()
+
+        # Габарити деталі для кожної орієнтації відносно центру
+        ext = NestingMath.aabb(self.core, self.r_corner, np.column_stack((np.zeros(2), np.zeros(2), self.angles)))
+        y0 = -min(ext[0, 1], ext[1, 1] + h)
+
+        rows = []
+        placed = 0
+        r = 0
+        while placed < count:
+            shift = (r * s) % (2 * pitch)
+            parity = (r * flip) % 2
+            i = np.arange(-2, int(sheet_width / pitch) + 3)
+            row = self.pattern(i, shift, y0 + r * v, pitch, h, parity)
+            odd = (i + parity) % 2
+            inside = (row[:, 0] + ext[odd, 0] >= 0) & (row[:, 0] + ext[odd, 2] <= sheet_width)
+            row = row[inside][:count - placed]
+            if len(row) == 0:
+                raise ValueError("Не вдалося розмістити ряд")
+            rows.append(row)
+            placed += len(row)
+            r += 1
+
+        poses = np.concatenate(rows)
+        boxes = NestingMath.aabb(self.core, self.r_corner, poses)
+        return NestingLayout(poses, sheet_width, float(boxes[:, 3].max()), pitch, v)
+
+    def verify(self, layout):
+        """Пари деталей, що перетинаються (мають бути порожні)"""
+        return NestingMath.find_overlaps(self.core, self.r_corner, layout.poses, self.gap)
@@ -0,0 +1,107 @@
+import math
+import numpy as np
+
+
+# ==========================================
+# ПОЛЕ ВІДСТАНЕЙ (SDF) ФЛАНЦЯ
+# ==========================================
+# Знак: < 0 - у матеріалі, > 0 - поза деталлю (у т.ч. в отворах).
+# Зовнішній контур = опукле ядро (многокутник центрів вух) ⊕ круг R,
+# тому його SDF точна: знакова відстань до ядра мінус R.
+# Отвори віднімаються як max(зовнішній, r - |p - c|): знак точний,
+# величина - точна поза отворами і нижня оцінка між отвором і краєм.
+
+class FlangeSDF:
+    def __init__(self, contour, chunk_size=65536):
+        self.core = np.asarray(contour.centers, dtype=np.float64)  # (N, 2)
+        self.r_corner = float(contour.r_corner)
+        self.holes = np.asarray(contour.holes, dtype=np.float64)  # (H, 3)
+        self.chunk_size = chunk_size
+        self.extent = float(np.abs(self.core).max(initial=0.0)) + self.r_corner
+
+        # Кеш сітки для наближених запитів
+        self.grid = None  # (rows, cols), рядок 0 - ymin
+        self.grid_origin = None  # (xmin, ymin)
+        self.grid_cell = None
+        self.grid_margin = None
+
+    @staticmethod
+    def segment_distance(points, a, b):
+        """Відстані від точок (P, 2) до відрізків a->b (N, 2): (P, N)"""
+        ab = b - a
+        ap = points[:, None, :] - a[None, :, :]
+        denom = np.maximum((ab * ab).sum(-1), 1e-12)
+        t = np.clip((ap * ab[None]).sum(-1) / denom, 0.0, 1.0)
+        d = ap - t[..., None] * ab[None]
+        return np.sqrt((d * d).sum(-1))
+
+    def core_distance(self, points):
+        """Знакова відстань до опуклого ядра (від'ємна всередині)"""
+        a = self.core
+        b = np.roll(a, -1, axis=0)
+        d = FlangeSDF.segment_distance(points, a, b).min(axis=1)
+        if len(a) < 3:
+            return d  # Точка або відрізок - внутрішності немає
+        # Вершини йдуть проти год. стрілки: всередині всі векторні добутки >= 0
+        e = b - a
+        ap = points[:, None, :] - a[None, :, :]
+        inside = (e[None, :, 0] * ap[..., 1] - e[None, :, 1] * ap[..., 0] >= 0).all(axis=1)
+        return np.where(inside, -d, d)
+
+    def evaluate(self, points):
+        """
+        SDF для масиву (P, 2), порціями по chunk_size точок. Знак точний; величина
+        точна поза отворами, а в матеріалі між отвором і краєм - нижня оцінка |d|.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        out = np.empty(len(points))
+        for first in range(0, len(points), self.chunk_size):
+            p = points[first:first + self.chunk_size]
+            d = self.core_distance(p) - self.r_corner
+            dx = p[:, None, 0] - self.holes[None, :, 0]
+            dy = p[:, None, 1] - self.holes[None, :, 1]
+            hole = (self.holes[None, :, 2] - np.sqrt(dx * dx + dy * dy)).max(axis=1)
+            out[first:first + self.chunk_size] = np.maximum(d, hole)
+        return out
+
+    def contains(self, points):
+        """True для точок у матеріалі (на межі - теж)"""
+        return self.evaluate(points) <= 0
+
+    # --- Кешована сітка ---
+    def sample_grid(self, cell=1.0, margin=50.0):
+        """Рахує SDF у вузлах сітки над габаритом деталі (+ margin); повторний виклик - з кешу"""
+        if self.grid is not None and self.grid_cell == cell and self.grid_margin == margin:
+            return self.grid
+        lo = -self.extent - margin
+        n = int(math.ceil(2 * (self.extent + margin) / cell)) + 1
+        axis = lo + cell * np.arange(n)
+        xx, yy = np.meshgrid(axis, axis)
+        self.grid = self.evaluate(np.column_stack((xx.ravel(), yy.ravel()))).reshape(n, n)
+        self.grid_origin = (lo, lo)
+        self.grid_cell = cell
+        self.grid_margin = margin
+        return self.grid
+
+    def lookup(self, points):
+        """
+        Наближена SDF з кешованої сітки: білінійна інтерполяція, O(1) на точку.
+        Поза сіткою - значення на краю плюс відстань до краю (оцінка зверху).
+        """
+        if self.grid is None:
+            self.sample_grid()
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        rows, cols = self.grid.shape
+        u = (points[:, 0] - self.grid_origin[0]) / self.grid_cell
+        v = (points[:, 1] - self.grid_origin[1]) / self.grid_cell
+        uc = np.clip(u, 0.0, cols - 1)
+        vc = np.clip(v, 0.0, rows - 1)
+        i0 = np.minimum(uc.astype(np.intp), cols - 2)
+        j0 = np.minimum(vc.astype(np.intp), rows - 2)
+        fu = uc - i0
+        fv = vc - j0
+        g = self.grid
+        top = g[j0, i0] * (1 - fu) + g[j0, i0 + 1] * fu
+        bottom = g[j0 + 1, i0] * (1 - fu) + g[j0 + 1, i0 + 1] * fu
+        outside = np.hypot(u - uc, v - vc) * self.grid_cell
+        return top * (1 - fv) + bottom * fv + outside
@@ -0,0 +1,61 @@
+from PySide6.QtCore import QTimer
+
+
+# ==========================================
+# ПЛАНУВАЛЬНИК ОНОВЛЕНЬ (один перерахунок на кадр)
+# ==========================================
+class FrameScheduler:
+    """
+    Спінбокси та слайдери лише позначають частину стану "брудною"
+    (shape, transform, projection ...). Перерахунок кожної частини
+    виконується один раз на такт таймера (~60 Гц), скільки б сигналів
+    не прийшло між кадрами.
+    """
+
+    def __init__(self, interval_ms=16):
+        self.handlers = {}  # частина -> функція перерахунку (порядок реєстрації зберігається)
+        self.dirty = set()
+
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.flush)
+
+        # Телеметрія
+        self.requests = 0  # скільки разів позначали
+        self.rebuilds = 0  # скільки разів реально перераховували
+        self.frames = 0
+
+    def register(self, part, handler):
+        self.handlers[part] = handler
+
+    def mark(self, part):
+        self.requests += 1
+        self.dirty.add(part)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def slot(self, part):
+        """Функція для connect(): ігнорує аргументи сигналу"""
+        return lambda *args: self.mark(part)
+
+    def flush(self):
+        """Виконує всі відкладені перерахунки зараз"""
+        self.timer.stop()
+        if not self.dirty:
+            return
+        dirty = self.dirty
+        self.dirty = set()
+        self.frames += 1
+        for part, handler in self.handlers.items():
+            if part in dirty:
+                self.rebuilds += 1
+                handler()
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "rebuilds": self.rebuilds,
+            "collapsed": self.requests - self.rebuilds - len(self.dirty),
+            "frames": self.frames,
+        }
@@ -1,12 +1,70 @@
 import sys
 import math
-from PySide6.QtCore import Qt, QPointF
-from PySide6.QtGui import QPainter, QPen, QColor, QPainterPath, QTransform, QBrush
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PySide6.QtCore import Qt, QPointF, QRectF, Signal
+from PySide6.QtGui import QPainter, QPen, QColor, QPainterPath, QTransform, QBrush, QImage
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
     QHBoxLayout, QGridLayout, QLabel, QDoubleSpinBox,
-    QGroupBox, QTabWidget, QPushButton, QSizePolicy
+    QGroupBox, QTabWidget, QPushButton, QSizePolicy, QSpinBox, QCheckBox
 )
+import numpy as np
+from canvas_grid import GridLayer, array_to_polygon
+from flange_math import FlangeGeometry, FlangeRules, Homography, MIN_WALL
+from flange_mass import FlangeMass
+from flange_nesting import FlangeNesting
+from flange_sdf import FlangeSDF
+from frame_scheduler import FrameScheduler
+
+
+def contour_to_path(contour):
+    """
+    FlangeContour -> QPainterPath з точними дугами.
+    У Qt кут дуги рахується з інвертованою віссю Y, тому знаки кутів міняємо.
+    """
+    path = QPainterPath()
+    r = contour.r_corner
+    # .tolist() - Qt отримує звичайні float замість numpy-скалярів
+    centers = contour.centers.tolist()
+    start = contour.arc_start.tolist()
+    sweep = contour.arc_sweep.tolist()
+    line_end = contour.line_end.tolist()
+    path.moveTo(*line_end[-1])
+    for (cx, cy), a0, da, end in zip(centers, start, sweep, line_end):
+        path.arcTo(cx - r, cy - r, 2 * r, 2 * r, -math.degrees(a0), -math.degrees(da))
+        path.lineTo(*end)
+    path.closeSubpath()
+
+    # Отвори
+    for cx, cy, rh in contour.holes.tolist():
+        path.addEllipse(QPointF(cx, cy), rh, rh)
+
+    # Парно-непарне заповнення робить отвори прозорими
+    path.setFillRule(Qt.FillRule.OddEvenFill)
+    return path
+
+
+def rings_to_path(rings):
+    """Список масивів (k, 2) -> QPainterPath з замкнених полігонів"""
+    path = QPainterPath()
+    for ring in rings:
+        if len(ring) < 3:
+            continue
+        path.addPolygon(array_to_polygon(ring))
+        path.closeSubpath()
+    path.setFillRule(Qt.FillRule.OddEvenFill)
+    return path
+
+
+def transform_to_array(t):
+    """QTransform -> numpy 3x3 (рядкова конвенція Qt)"""
+    return np.array([
+        [t.m11(), t.m12(), t.m13()],
+        [t.m21(), t.m22(), t.m23()],
+        [t.m31(), t.m32(), t.m33()],
+    ])
+
 
 
 # ==========================================
@@ -33,17 +91,99 @@ class CanvasWidget(QWidget):
         self.offset_x = 0  # Зсув сцени по X
         self.offset_y = 0  # Зсув сцени по Y
         self.grid_step = 50  # Крок сітки
+        self.grid = GridLayer(self.grid_step)
 
         # Для мишки
         self.last_mouse_pos = QPointF()
 
+        # Кеш готових контурів (LRU) - ключ: параметри деталі
+        self.path_cache = OrderedDict()
+        self.path_cache_size = 32
+        self.path_cache_hits = 0
+        self.path_cache_misses = 0
+        self.current_path = None  # Контур для поточних параметрів
+
+        # Кеш полілінії для проективних перетворень: вершини в однорідних координатах
+        self.flat_tolerance_px = 0.25  # Допустима похибка хорди на екрані
+        self.flat_key = None
+        self.flat_points = None  # (P, 3)
+        self.flat_offsets = None  # межі кілець у flat_points
+
+        # Зона зазору навколо деталі: зображення з кешованої сітки SDF
+        self.clearance = 0.0  # 0 - не показувати
+        self.sdf = None
+        self.sdf_key = None
+        self.clearance_image = None
+        self.clearance_key = None
+
+        # Розкрій листа: пози (K, 3) копій деталі та розмір листа
+        self.nest_layout = None
+        self.nest_radius = 0.0  # описане коло деталі для відсікання за екраном
+
     def set_shape_params(self, center_d, bcd_d, hole_d, corner_r):
         self.param_center_d = center_d
         self.param_bcd_d = bcd_d
         self.param_hole_d = hole_d
         self.param_corner_r = corner_r
+        self.current_path = None  # Параметри змінились - шукаємо контур заново
+        self.flat_key = None
+        self.nest_layout = None  # Розкладка була для старої деталі
         self.update()  # Перемалювати
 
+    def shape_key(self):
+        return (self.param_center_d, self.param_bcd_d, self.param_hole_d, self.param_corner_r)
+
+    def cache_stats(self):
+        """Лічильники кешу контурів (влучання / промахи / розмір)"""
+        return {
+            "hits": self.path_cache_hits,
+            "misses": self.path_cache_misses,
+            "size": len(self.path_cache),
+        }
+
+    def clear_path_cache(self):
+        self.path_cache.clear()
+        self.current_path = None
+
+    def set_clearance(self, clearance):
+        self.clearance = clearance
+        self.update()
+
+    def get_sdf(self):
+        """SDF поточної деталі (сітка всередині кешується разом з нею)"""
+        key = self.shape_key()
+        if self.sdf_key != key:
+            self.sdf = FlangeSDF(FlangeGeometry.build(*key))
+            self.sdf_key = key
+        return self.sdf
+
+    def get_clearance_image(self):
+        """
+        Смуга 0 < d <= зазор і лінія еквідистанти d = зазор, пофарбовані
+        з сітки SDF. Перераховується лише при зміні деталі чи зазору.
+        """
+        sdf = self.get_sdf()
+        key = (self.sdf_key, self.clearance)
+        if self.clearance_key != key:
+            cell = 1.0
+            grid = sdf.sample_grid(cell, margin=max(50.0, self.clearance + 5 * cell))
+            band = (grid > 0) & (grid <= self.clearance)
+            line = np.abs(grid - self.clearance) <= cell / 2
+            argb = np.zeros(grid.shape, dtype=np.uint32)
+            argb[band] = 0x60F39C12  # напівпрозорий помаранчевий
+            argb[line] = 0xFFD35400
+            h, w = argb.shape
+            self.clearance_image = QImage(argb.tobytes(), w, h, 4 * w, QImage.Format_ARGB32).copy()
+            self.clearance_key = key
+        x0, y0 = sdf.grid_origin
+        size = sdf.grid_cell * (sdf.grid.shape[0] - 1)
+        return self.clearance_image, QRectF(x0, y0, size, size)
+
+    def set_nesting(self, layout, radius):
+        self.nest_layout = layout
+        self.nest_radius = radius
+        self.update()
+
     def set_transform(self, transform):
         self.transform_matrix = transform
         self.update()
@@ -73,78 +213,79 @@ class CanvasWidget(QWidget):
     # --- ЛОГІКА ПОБУДОВИ ФЛАНЦЯ ---
     def get_shape_path(self):
         """
-        Генерує контур деталі.
+        Повертає контур деталі з кешу.
+        Перемальовування без зміни параметрів (pan/zoom, трансформації)
+        не перебудовують геометрію.
         """
-        r_bcd = self.param_bcd_d / 2.0
-        r_corner = self.param_corner_r
-
-        # 1. Знаходимо центри трьох вершин (90°, 210°, 330°)
-        angles_deg = [90, 210, 330]
-        centers = []
-        for ang in angles_deg:
-            rad = math.radians(ang)
-            cx = r_bcd * math.cos(rad)
-            cy = r_bcd * math.sin(rad)
-            centers.append(QPointF(cx, cy))
-
-        # 2. Формуємо ТІЛО (Body)
-        body_path = QPainterPath()
-
-        # А) Додаємо кола на вершинах ("вуха")
-        for c in centers:
-            p = QPainterPath()
-            p.addEllipse(c, r_corner, r_corner)
-            body_path = body_path.united(p)
-
-        # Б) З'єднуємо кола прямокутниками (дотичні)
-        for i in range(3):
-            c1 = centers[i]
-            c2 = centers[(i + 1) % 3]
-
-            vec = c2 - c1
-            length = math.sqrt(vec.x() ** 2 + vec.y() ** 2)
-            if length == 0: continue
-
-            # Нормаль до вектора
-            norm = QPointF(-vec.y(), vec.x()) / length * r_corner
-
-            # Будуємо полігон
-            rect_poly = QPainterPath()
-            rect_poly.moveTo(c1 + norm)
-            rect_poly.lineTo(c2 + norm)
-            rect_poly.lineTo(c2 - norm)
-            rect_poly.lineTo(c1 - norm)
-            rect_poly.closeSubpath()
-
-            body_path = body_path.united(rect_poly)
-
-        # В) Заповнюємо центр
-        tri_path = QPainterPath()
-        tri_path.moveTo(centers[0])
-        tri_path.lineTo(centers[1])
-        tri_path.lineTo(centers[2])
-        tri_path.closeSubpath()
-        body_path = body_path.united(tri_path)
-
-        # 3. Формуємо ОТВОРИ (Holes)
-        holes_path = QPainterPath()
-
-        # Центральний отвір
-        holes_path.addEllipse(QPointF(0, 0), self.param_center_d / 2, self.param_center_d / 2)
-
-        # Малі отвори по кутах
-        r_hole = self.param_hole_d / 2
-        for c in centers:
-            holes_path.addEllipse(c, r_hole, r_hole)
-
-        # 4. Віднімаємо отвори від тіла
-        final_path = body_path.subtracted(holes_path)
+        if self.current_path is not None:
+            self.path_cache_hits += 1
+            return self.current_path
+
+        key = self.shape_key()
+        path = self.path_cache.get(key)
+        if path is not None:
+            self.path_cache_hits += 1
+            self.path_cache.move_to_end(key)
+        else:
+            self.path_cache_misses += 1
+            path = self.build_shape_path()
+            self.path_cache[key] = path
+            if len(self.path_cache) > self.path_cache_size:
+                self.path_cache.popitem(last=False)  # Викидаємо найстаріший
 
-        # === ! ВАЖЛИВО: ВИПРАВЛЕННЯ ДЛЯ ПРОЗОРИХ ОТВОРІВ ! ===
-        final_path.setFillRule(Qt.FillRule.OddEvenFill)
-        # =====================================================
+        self.current_path = path
+        return path
 
-        return final_path
+    def flat_lod(self, matrix=None):
+        """
+        Рівень деталізації: крок 2x по масштабу, щоб зум не перебудовував полілінію щокадру.
+        Для проективної матриці додаємо збільшення 1/w² (w лінійне, тому мінімум - у кутах габариту).
+        """
+        lod = math.floor(math.log2(self.scale_factor))
+        if matrix is not None:
+            ext = self.param_bcd_d / 2.0 + self.param_corner_r
+            corners = np.array([[-ext, -ext, 1.0], [ext, -ext, 1.0], [ext, ext, 1.0], [-ext, ext, 1.0]])
+            w_min = (corners @ matrix)[:, 2].min()
+            if w_min <= 0.125:
+                lod += 6
+            elif w_min < 1.0:
+                lod += math.ceil(-2 * math.log2(w_min))
+        return lod
+
+    def get_flat_rings(self, lod):
+        """Полілінії контуру (однорідні координати), перебудова лише при зміні форми або LOD"""
+        key = (self.shape_key(), lod)
+        if key != self.flat_key:
+            tolerance = self.flat_tolerance_px / 2.0 ** lod
+            contour = FlangeGeometry.build(
+                self.param_center_d, self.param_bcd_d,
+                self.param_hole_d, self.param_corner_r
+            )
+            outer, holes = FlangeGeometry.flatten(contour, tolerance)
+            rings = [outer] + list(holes)
+            self.flat_points = Homography.to_homogeneous(np.concatenate(rings))
+            self.flat_offsets = np.cumsum([0] + [len(r) for r in rings])
+            self.flat_key = key
+        return self.flat_points, self.flat_offsets
+
+    def get_projected_path(self):
+        """Застосовує матрицю до всіх вершин одразу, з відсіканням w <= 0"""
+        matrix = transform_to_array(self.transform_matrix)
+        points, offsets = self.get_flat_rings(self.flat_lod(matrix))
+        h = Homography.apply(matrix, points)
+        rings = [Homography.clip_ring(h[a:b]) for a, b in zip(offsets[:-1], offsets[1:])]
+        return rings_to_path(rings)
+
+    def build_shape_path(self):
+        """
+        Генерує контур деталі з аналітичного опису (дуги + дотичні),
+        без булевих операцій над QPainterPath.
+        """
+        contour = FlangeGeometry.build(
+            self.param_center_d, self.param_bcd_d,
+            self.param_hole_d, self.param_corner_r
+        )
+        return contour_to_path(contour)
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -162,59 +303,169 @@ class CanvasWidget(QWidget):
         self.draw_grid(painter)
 
         # 2. Малюємо Деталь
-        painter.save()
-
-        # Застосовуємо матрицю трансформацій
-        painter.setTransform(self.transform_matrix, True)
-
         # Стиль заливки та ліній
         pen = QPen(QColor("#2c3e50"), 2)
         pen.setCosmetic(True)
         brush = QBrush(QColor("#4a90e2"))  # Синій колір
 
-        painter.setPen(pen)
-        painter.setBrush(brush)
+        if self.transform_matrix.isAffine():
+            painter.save()
+
+            # Застосовуємо матрицю трансформацій
+            painter.setTransform(self.transform_matrix, True)
+
+            painter.setPen(pen)
+            painter.setBrush(brush)
 
-        painter.drawPath(self.get_shape_path())
+            if self.nest_layout is not None:
+                self.draw_nesting(painter)
+            else:
+                if self.clearance > 0:
+                    image, rect = self.get_clearance_image()
+                    painter.drawImage(rect, image)
+                painter.drawPath(self.get_shape_path())
 
-        # Малюємо локальний центр (червона крапка)
-        painter.setPen(QPen(Qt.red, 5))
-        painter.drawPoint(0, 0)
+            # Малюємо локальний центр (червона крапка)
+            painter.setPen(QPen(Qt.red, 5))
+            painter.drawPoint(0, 0)
 
+            painter.restore()
+        else:
+            # Проективна матриця: вершини перетворюємо самі (numpy), Qt малює лише полігони
+            painter.setPen(pen)
+            painter.setBrush(brush)
+            if self.nest_layout is not None:
+                self.draw_projected_nesting(painter)
+            else:
+                if self.clearance > 0:
+                    self.draw_projected_clearance(painter)
+                painter.drawPath(self.get_projected_path())
+
+            origin = Homography.apply(transform_to_array(self.transform_matrix), np.array([0.0, 0.0, 1.0]))
+            if origin[2] > 1e-3:
+                painter.setPen(QPen(Qt.red, 5))
+                painter.drawPoint(QPointF(origin[0] / origin[2], origin[1] / origin[2]))
+
+    def draw_nesting(self, painter):
+        """
+        Лист і копії деталі: один кешований QPainterPath під різними
+        QTransform, лише ті, чиє описане коло потрапляє у вікно.
+        """
+        layout = self.nest_layout
+        painter.save()
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(QRectF(0.0, 0.0, layout.sheet_width, layout.sheet_height))
         painter.restore()
 
-    def draw_grid(self, painter):
-        # Сітка
-        grid_pen = QPen(QColor("#e0e0e0"))
-        grid_pen.setWidthF(1)
-        grid_pen.setCosmetic(True)
-        painter.setPen(grid_pen)
+        base = painter.worldTransform()
+        inverse, _ = base.inverted()
+        view = inverse.mapRect(QRectF(self.rect()))
+        x, y, angle = layout.poses.T
+        r = self.nest_radius
+        visible = ((x + r >= view.left()) & (x - r <= view.right())
+                   & (y + r >= view.top()) & (y - r <= view.bottom()))
+
+        path = self.get_shape_path()
+        poses = layout.poses[visible]
+        for px, py, c, s in zip(poses[:, 0].tolist(), poses[:, 1].tolist(),
+                                np.cos(poses[:, 2]).tolist(), np.sin(poses[:, 2]).tolist()):
+            painter.setTransform(QTransform(c, s, -s, c, px, py) * base)
+            painter.drawPath(path)
+        painter.setTransform(base)
+
+    def draw_projected_clearance(self, painter, tiles=16, eps=1e-3):
+        """
+        Зона зазору під проективною матрицею. Перспективу для зображення дає сам Qt,
+        але без відсікання w <= 0 (як у clip_ring), тому зображення ділиться на
+        tiles x tiles плиток і малюються лише ті, у яких усі кути мають w > eps.
+        """
+        image, rect = self.get_clearance_image()
+        m = transform_to_array(self.transform_matrix)
+        xs = np.linspace(rect.left(), rect.right(), tiles + 1)
+        ys = np.linspace(rect.top(), rect.bottom(), tiles + 1)
+        front = (xs[None, :] * m[0, 2] + ys[:, None] * m[1, 2] + m[2, 2]) > eps
+        visible = front[:-1, :-1] & front[1:, :-1] & front[:-1, 1:] & front[1:, 1:]
 
-        limit = 1000
-        step = self.grid_step
+        painter.save()
+        painter.setTransform(self.transform_matrix, True)
+        if visible.all():
+            painter.drawImage(rect, image)
+        else:
+            sw, sh = image.width() / tiles, image.height() / tiles
+            for i, j in np.argwhere(visible).tolist():
+                painter.drawImage(QRectF(xs[j], ys[i], xs[j + 1] - xs[j], ys[i + 1] - ys[i]),
+                                  image, QRectF(j * sw, i * sh, sw, sh))
+        painter.restore()
+
+    def draw_projected_nesting(self, painter):
+        """
+        Розкрій під проективною матрицею: полілінія деталі переноситься в кожну
+        позу (поза і матриця - одна 3x3), далі та сама гомографія й відсікання w <= 0,
+        що й для однієї деталі. Усі видимі копії - один QPainterPath.
+        """
+        layout = self.nest_layout
+        matrix = transform_to_array(self.transform_matrix)
+        inverse, _ = painter.worldTransform().inverted()
+        view = inverse.mapRect(QRectF(self.rect()))
+
+        sheet = np.array([[0.0, 0.0, 1.0], [layout.sheet_width, 0.0, 1.0],
+                          [layout.sheet_width, layout.sheet_height, 1.0], [0.0, layout.sheet_height, 1.0]])
+        painter.save()
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPath(rings_to_path([Homography.clip_ring(Homography.apply(matrix, sheet))]))
+        painter.restore()
 
-        for i in range(-limit, limit, step):
-            painter.drawLine(i, -limit, i, limit)
-            painter.drawLine(-limit, i, limit, i)
+        # Поза в рядковій конвенції Qt: [x y 1] @ [[c, s, 0], [-s, c, 0], [px, py, 1]]
+        c, s = np.cos(layout.poses[:, 2]), np.sin(layout.poses[:, 2])
+        poses = np.zeros((len(layout.poses), 3, 3))
+        poses[:, 0, 0], poses[:, 0, 1], poses[:, 1, 0], poses[:, 1, 1] = c, s, -s, c
+        poses[:, 2, :2] = layout.poses[:, :2]
+        poses[:, 2, 2] = 1.0
+        combined = poses @ matrix
+
+        points, offsets = self.get_flat_rings(self.flat_lod(matrix))
+        outer_end = offsets[1]
+        rings = []
+        for m in combined:
+            h = Homography.apply(m, points)
+            outer = Homography.clip_ring(h[:outer_end])
+            if len(outer) < 3:
+                continue
+            low, high = outer.min(axis=0), outer.max(axis=0)
+            if (high[0] < view.left() or low[0] > view.right()
+                    or high[1] < view.top() or low[1] > view.bottom()):
+                continue
+            rings.append(outer)
+            rings.extend(Homography.clip_ring(h[a:b]) for a, b in zip(offsets[1:-1], offsets[2:]))
+        painter.drawPath(rings_to_path(rings))
 
-        # Головні осі (X, Y)
-        axis_pen = QPen(Qt.black)
-        axis_pen.setWidth(2)
-        axis_pen.setCosmetic(True)
-        painter.setPen(axis_pen)
-        painter.drawLine(-limit, 0, limit, 0)
-        painter.drawLine(0, -limit, 0, limit)
+    def draw_grid(self, painter):
+        # Лише видимі лінії, з кешованого шару
+        self.grid.draw(painter)
 
 
 # ==========================================
 # 2. ГОЛОВНЕ ВІКНО (UI)
 # ==========================================
 class MainWindow(QMainWindow):
+    # Фонова розкладка завершилась: future (надсилається з робочого потоку)
+    nesting_done = Signal(object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Лабораторна №1 - Варіант 13 (Фланець)")
         self.resize(1100, 750)
 
+        # Сигнали віджетів лише позначають зміни, перерахунок - раз на кадр
+        self.scheduler = FrameScheduler()
+        self.scheduler.register("shape", self.apply_shape)
+        self.scheduler.register("transform", self.apply_transform)
+
+        # Пошук ґратки розкрою триває секунди - окремий потік, щоб вікно не застигало
+        self.nest_pool = ThreadPoolExecutor(max_workers=1)
+        self.nest_job = None
+        self.nesting_done.connect(self.finish_nesting)
+
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QHBoxLayout(central_widget)
@@ -241,8 +492,52 @@ class MainWindow(QMainWindow):
         shape_layout.addWidget(self.spin_hole_d, 2, 1)
         shape_layout.addWidget(QLabel("R кутів:"), 3, 0);
         shape_layout.addWidget(self.spin_corner_r, 3, 1)
+        self.lbl_rules = QLabel("")
+        self.lbl_rules.setWordWrap(True)
+        shape_layout.addWidget(self.lbl_rules, 4, 0, 1, 2)
         shape_group.setLayout(shape_layout)
 
+        # Група 1б: Масо-геометричні характеристики
+        props_group = QGroupBox("Властивості (сталь, 10 мм)")
+        props_layout = QVBoxLayout()
+        self.lbl_area = QLabel("Площа: 0")
+        self.lbl_centroid = QLabel("Центр мас: 0")
+        self.lbl_inertia = QLabel("Ix / Iy: 0")
+        self.lbl_polar = QLabel("J: 0")
+        self.lbl_mass = QLabel("Маса: 0")
+        for lbl in [self.lbl_area, self.lbl_centroid, self.lbl_inertia, self.lbl_polar, self.lbl_mass]:
+            props_layout.addWidget(lbl)
+
+        # Зона зазору (еквідистанта) з поля відстаней
+        self.chk_clearance = QCheckBox("Зазор, мм:")
+        self.spin_clearance = self.create_spin(10, 0.5, 100)
+        clearance_layout = QHBoxLayout()
+        clearance_layout.addWidget(self.chk_clearance)
+        clearance_layout.addWidget(self.spin_clearance)
+        props_layout.addLayout(clearance_layout)
+        props_group.setLayout(props_layout)
+
+        # Група 1в: Розкрій листа копіями поточної деталі
+        nest_group = QGroupBox("Розкрій листа (зазор 5 мм)")
+        nest_layout = QGridLayout()
+        self.spin_nest_count = QSpinBox()
+        self.spin_nest_count.setRange(1, 100000)
+        self.spin_nest_count.setValue(60)
+        self.spin_nest_width = self.create_spin(1500, 100, 20000)
+        self.btn_nest = QPushButton("Розкласти")
+        self.btn_nest.clicked.connect(self.apply_nesting)
+        btn_nest_clear = QPushButton("Одна деталь")
+        btn_nest_clear.clicked.connect(self.clear_nesting)
+        self.lbl_nest = QLabel("")
+        nest_layout.addWidget(QLabel("Кількість:"), 0, 0);
+        nest_layout.addWidget(self.spin_nest_count, 0, 1)
+        nest_layout.addWidget(QLabel("Ширина листа:"), 1, 0);
+        nest_layout.addWidget(self.spin_nest_width, 1, 1)
+        nest_layout.addWidget(self.btn_nest, 2, 0)
+        nest_layout.addWidget(btn_nest_clear, 2, 1)
+        nest_layout.addWidget(self.lbl_nest, 3, 0, 1, 2)
+        nest_group.setLayout(nest_layout)
+
         # Група 2: Вкладки трансформацій
         self.tabs = QTabWidget()
         self.tabs.addTab(self.create_euclidean_tab(), "Евклідові")
@@ -254,6 +549,8 @@ class MainWindow(QMainWindow):
         btn_reset.clicked.connect(self.reset_all)
 
         control_layout.addWidget(shape_group)
+        control_layout.addWidget(props_group)
+        control_layout.addWidget(nest_group)
         control_layout.addWidget(self.tabs)
         control_layout.addStretch()
         control_layout.addWidget(btn_reset)
@@ -270,6 +567,11 @@ class MainWindow(QMainWindow):
         self.spin_hole_d.valueChanged.connect(self.update_shape)
         self.spin_corner_r.valueChanged.connect(self.update_shape)
         self.tabs.currentChanged.connect(self.update_transform)
+        self.chk_clearance.toggled.connect(self.update_clearance)
+        self.spin_clearance.valueChanged.connect(self.update_clearance)
+
+        self.update_properties()
+        self.update_rules()
 
     def create_spin(self, val, mn, mx):
         sb = QDoubleSpinBox()
@@ -363,14 +665,99 @@ class MainWindow(QMainWindow):
 
     # --- Оновлення ---
     def update_shape(self):
+        self.scheduler.mark("shape")
+
+    def update_transform(self):
+        self.scheduler.mark("transform")
+
+    def apply_shape(self):
         self.canvas.set_shape_params(
             self.spin_center_d.value(),
             self.spin_bcd_d.value(),
             self.spin_hole_d.value(),
             self.spin_corner_r.value()
         )
+        self.update_properties()
+        self.update_rules()
+        self.lbl_nest.setText("")
 
-    def update_transform(self):
+    def update_clearance(self):
+        self.canvas.set_clearance(self.spin_clearance.value() if self.chk_clearance.isChecked() else 0.0)
+
+    def apply_nesting(self):
+        """
+        Щільна розкладка K копій у фоновому потоці; час пошуку ґратки не залежить від K.
+        До результату кнопка вимкнена, курсор - "зайнято", вікно лишається чутливим.
+        """
+        self.scheduler.flush()  # Деталь має відповідати спінбоксам
+        self.btn_nest.setEnabled(False)
+        self.lbl_nest.setText("Пошук розкладки...")
+        QApplication.setOverrideCursor(Qt.BusyCursor)
+        self.nest_job = self.nest_pool.submit(
+            self.compute_nesting, self.canvas.shape_key(),
+            self.spin_nest_count.value(), self.spin_nest_width.value()
+        )
+        # Колбек виконується в робочому потоці; сигнал передає future в потік GUI
+        self.nest_job.add_done_callback(self.nesting_done.emit)
+
+    @staticmethod
+    def compute_nesting(params, count, sheet_width):
+        """Робота потоку: (параметри деталі, розкладка, радіус деталі, заповнення листа)"""
+        nesting = FlangeNesting(params)
+        layout = nesting.layout(count, sheet_width)
+        area = FlangeMass.properties(FlangeGeometry.build(*params))["area"]
+        fill = len(layout) * area / (layout.sheet_width * layout.sheet_height)
+        return params, layout, nesting.radius, fill
+
+    def finish_nesting(self, job):
+        QApplication.restoreOverrideCursor()
+        self.btn_nest.setEnabled(True)
+        if job is not self.nest_job:
+            return  # Розкладку скасовано кнопкою "Одна деталь"
+        self.nest_job = None
+        try:
+            params, layout, radius, fill = job.result()
+        except ValueError as e:
+            self.lbl_nest.setText(str(e))
+            return
+        if params != self.canvas.shape_key():
+            return  # Поки йшов пошук, деталь змінили - розкладка вже не для неї
+        self.lbl_nest.setText(
+            f"Лист: {layout.sheet_width:.0f} x {layout.sheet_height:.0f} мм, заповнення {fill:.1%}"
+        )
+        self.canvas.set_nesting(layout, radius)
+
+    def clear_nesting(self):
+        self.nest_job = None
+        self.lbl_nest.setText("")
+        self.canvas.set_nesting(None, 0.0)
+
+    def update_rules(self):
+        """Правила конструювання - замкнені формули, лише при зміні параметрів"""
+        violations = FlangeRules.violations(self.canvas.shape_key())
+        if violations:
+            self.lbl_rules.setStyleSheet("color: #c0392b;")
+            lines = [f"Порушено (мін. стінка {MIN_WALL:g} мм):"]
+            lines += [f"{name}: {margin:+.1f} мм" for name, margin in violations]
+            self.lbl_rules.setText("\n".join(lines))
+        else:
+            self.lbl_rules.setStyleSheet("color: #27ae60;")
+            self.lbl_rules.setText("Стінки та перемички в нормі")
+
+    def update_properties(self):
+        """Аналітичні характеристики - менше мілісекунди, встигає в той самий кадр"""
+        contour = FlangeGeometry.build(
+            self.spin_center_d.value(), self.spin_bcd_d.value(),
+            self.spin_hole_d.value(), self.spin_corner_r.value()
+        )
+        p = FlangeMass.properties(contour)
+        self.lbl_area.setText(f"Площа: {p['area']:.1f} мм²")
+        self.lbl_centroid.setText(f"Центр мас: ({p['cx']:.2f}, {p['cy']:.2f})")
+        self.lbl_inertia.setText(f"Ix / Iy: {p['ix']:.4g} / {p['iy']:.4g} мм⁴")
+        self.lbl_polar.setText(f"J: {p['j']:.4g} мм⁴")
+        self.lbl_mass.setText(f"Маса: {p['mass'] / 1000:.3f} кг")
+
+    def apply_transform(self):
         idx = self.tabs.currentIndex()
         t = QTransform()
 
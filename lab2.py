@@ -1,12 +1,16 @@
 import sys
 import math
-from PySide6.QtCore import Qt, QPointF, QTimer
+from collections import OrderedDict
+from PySide6.QtCore import Qt, QPointF, QTimer, Signal
 from PySide6.QtGui import QPainter, QPen, QColor, QPainterPath, QTransform, QBrush, QFont
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
     QHBoxLayout, QGridLayout, QLabel, QDoubleSpinBox,
-    QGroupBox, QPushButton, QSizePolicy, QSlider
+    QGroupBox, QPushButton, QSizePolicy, QSlider, QComboBox, QCheckBox
 )
+import numpy as np
+from canvas_grid import GridLayer, array_to_polygon
+from polar_curves import CURVES, get_curve
 
 
 # ==========================================
@@ -32,69 +36,74 @@ class CardioidMath:
 
     @staticmethod
     def calculate_properties(a, t):
-        area = 6 * math.pi * (a ** 2)
-        length = 16 * a
-        r_curv = (8 * a / 3) * math.sin(t / 2)
+        """Для r = a (1 - cos t): площа 3/2 pi a², довжина 8a, радіус кривини (4a/3) sin(t/2)"""
+        area = 1.5 * math.pi * (a ** 2)
+        length = 8 * a
+        r_curv = (4 * a / 3) * math.sin(t / 2)
         return area, length, r_curv
 
 
 # ==========================================
 # 2. КЛАС ПОЛОТНА (CANVAS)
 # ==========================================
-class CanvasWidget(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setStyleSheet("background-color: white;")
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+class CardioidScene:
+    """
+    Стан і малювання сцени без QWidget: той самий код малює у вікно
+    (CanvasWidget) і в QImage (експорт кадрів з lab2_export, у потоках).
+    """
 
+    def __init__(self, grid_cache=True):
         self.param_a = 50.0
         self.param_t = 1.0
+        self.curve = get_curve("cardioid")  # Крива з реєстру (одиничний масштаб)
         self.transform_matrix = QTransform()
 
         self.scale_factor = 1.0
         self.offset_x = 0
         self.offset_y = 0
-        self.last_mouse_pos = QPointF()
 
-    def set_params(self, a, t):
-        self.param_a = a
-        self.param_t = t
-        self.update()
+        # QPixmap-кеш сітки можна використовувати лише в потоці інтерфейсу
+        self.grid = GridLayer(50, use_cache=grid_cache)
 
-    def set_transform_params(self, dx, dy, angle, cx, cy):
+        # Контури одиничних кривих (LRU): (крива, рівень деталізації) -> (шлях, вершин, похибка).
+        # Перемикання кривої чи повернення до рівня не перебудовує вже готове
+        self.unit_paths = OrderedDict()
+        self.unit_paths_size = 64
+        self.unit_key = None
+        self.unit_rebuilds = 0
+        self.tolerance_px = 0.1  # Допустиме відхилення ламаної від кривої на екрані
+
+        # Еволюта і гребінь кривини (LRU): (крива, зубців) -> (відрізки гребеня, відрізки еволюти)
+        self.show_curvature = False
+        self.comb_teeth = 2000
+        self.comb_length = 0.3  # Типова довжина зубця в одиницях a
+        self.curvature_overlays = OrderedDict()
+        self.curvature_overlays_size = 16
+
+    @staticmethod
+    def euclidean_transform(dx, dy, angle, cx, cy):
         t = QTransform()
         t.translate(dx, dy)
         t.translate(cx, cy)
         t.rotate(angle)
         t.translate(-cx, -cy)
-        self.transform_matrix = t
-        self.update()
+        return t
 
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.last_mouse_pos = event.position()
+    def world_transform(self, width, height):
+        """Локальні координати кривої -> пікселі (як у paint)"""
+        view = QTransform()
+        view.translate(width / 2 + self.offset_x, height / 2 + self.offset_y)
+        view.scale(self.scale_factor, -self.scale_factor)
+        return self.transform_matrix * view
 
-    def mouseMoveEvent(self, event):
-        if event.buttons() & Qt.MouseButton.LeftButton:
-            delta = event.position() - self.last_mouse_pos
-            self.offset_x += delta.x()
-            self.offset_y += delta.y()
-            self.last_mouse_pos = event.position()
-            self.update()
-
-    def wheelEvent(self, event):
-        if event.angleDelta().y() > 0:
-            self.scale_factor *= 1.1
-        else:
-            self.scale_factor /= 1.1
-        self.update()
+    def sampling_updated(self, count, error):
+        """Нова дискретизація кривої (для вікна - сигнал)"""
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def paint(self, painter, width, height):
         painter.setRenderHint(QPainter.Antialiasing)
 
-        cx = self.width() / 2
-        cy = self.height() / 2
+        cx = width / 2
+        cy = height / 2
         painter.translate(cx + self.offset_x, cy + self.offset_y)
         painter.scale(self.scale_factor, -self.scale_factor)
 
@@ -104,56 +113,128 @@ class CanvasWidget(QWidget):
         painter.setTransform(self.transform_matrix, True)
 
         self.draw_cardioid(painter)
+        if self.show_curvature:
+            self.draw_curvature(painter)
         self.draw_tangent_normal(painter)
 
     def draw_grid(self, painter):
-        pen = QPen(QColor("#e0e0e0"))
-        pen.setWidthF(1)
-        pen.setCosmetic(True)
-        painter.setPen(pen)
-        limit = 2000
-        step = 50
-        for i in range(-limit, limit, step):
-            painter.drawLine(i, -limit, i, limit)
-            painter.drawLine(-limit, i, limit, i)
-
-        pen.setColor(Qt.black)
-        pen.setWidth(2)
-        painter.setPen(pen)
-        painter.drawLine(-limit, 0, limit, 0)
-        painter.drawLine(0, -limit, 0, limit)
+        # Лише видимі лінії, з кешованого шару
+        self.grid.draw(painter)
 
-    def draw_cardioid(self, painter):
-        path = QPainterPath()
-        steps = 360
-        first_pt = CardioidMath.get_point(self.param_a, 0)
-        path.moveTo(first_pt)
-        for i in range(1, steps + 1):
-            t = math.radians(i)
-            pt = CardioidMath.get_point(self.param_a, t)
-            path.lineTo(pt)
+    def get_unit_path(self):
+        """
+        Рівень деталізації - степінь двійки масштабу кривої на екрані
+        (a * зум; перетворення лише обертає і зсуває). Поки рівень той самий,
+        використовується готовий контур. Одинична крива дискретизується
+        адаптивно з допуском tolerance_px / 2^lod - тобто не гірше tolerance_px
+        на екрані для будь-якого масштабу в межах рівня.
+        """
+        size = abs(self.param_a) * self.scale_factor
+        lod = math.ceil(math.log2(max(size, 1.0)))
+        key = (self.curve.key, lod)
+        if key in self.unit_paths:
+            self.unit_paths.move_to_end(key)
+        else:
+            scale = 2.0 ** lod
+            t, error = self.curve.adaptive_samples(self.tolerance_px / scale)
+            points = self.curve.points(1.0, t)
+            path = QPainterPath()
+            path.addPolygon(array_to_polygon(points))
+            self.unit_paths[key] = (path, len(t), error * scale)
+            self.unit_rebuilds += 1
+            if len(self.unit_paths) > self.unit_paths_size:
+                self.unit_paths.popitem(last=False)  # Викидаємо найстаріший
+        path, count, error = self.unit_paths[key]
+        if key != self.unit_key:
+            self.unit_key = key
+            self.sampling_updated(count, error)
+        return path
 
+    def draw_cardioid(self, painter):
         pen = QPen(QColor("#007AFF"), 3)
         pen.setCosmetic(True)
         painter.setPen(pen)
         painter.setBrush(Qt.NoBrush)
-        painter.drawPath(path)
+
+        # Крива параметра a - одинична, масштабована в a разів
+        painter.save()
+        painter.scale(self.param_a, self.param_a)
+        painter.drawPath(self.get_unit_path())
+        painter.restore()
+
+    def get_curvature_overlay(self):
+        """
+        Гребінь і еволюта одиничної кривої - один векторизований прохід, далі з кешу.
+        Центри кривини пропорційні a, а довжина зубця задана в одиницях a,
+        тому для будь-якого a досить масштабувати готові відрізки.
+        """
+        key = (self.curve.key, self.comb_teeth)
+        if key in self.curvature_overlays:
+            self.curvature_overlays.move_to_end(key)
+        else:
+            curve = self.curve
+            # Зубці - рівномірно за довжиною дуги
+            table = curve.arc_table()
+            s = np.linspace(0.0, table.length, self.comb_teeth, endpoint=False)
+            p, normal, kappa, centers = curve.evolute(1.0, table.t_from_s(s))
+
+            # Зубець - проти нормалі (з опуклого боку), довжина ~ кривині;
+            # біля точок повернення (κ -> inf) обмежена
+            finite = np.isfinite(kappa)
+            typical = np.percentile(np.abs(kappa[finite]), 90) if finite.any() else 1.0
+            gain = self.comb_length / max(typical, 1e-12)
+            spike = np.clip(kappa * gain, -2 * self.comb_length, 2 * self.comb_length)
+            tips = p - spike[:, None] * normal
+            comb = np.concatenate((p, tips), axis=1)
+
+            # Еволюта - ламана по центрах; розрив там, де центру немає, де κ змінює
+            # знак (точка перегину - центр іде на нескінченність) або центр дуже далеко
+            nxt = np.roll(np.arange(len(p)), -1)
+            limit = 4 * np.abs(p).max()
+            valid = np.isfinite(centers).all(axis=1) & (np.abs(centers).max(axis=1) < limit)
+            keep = valid & valid[nxt] & (np.sign(kappa) == np.sign(kappa[nxt]))
+            evolute = np.concatenate((centers[keep], centers[nxt][keep]), axis=1)
+
+            # Пари точок (початок, кінець) підряд - drawLines(QPolygonF) малює їх як відрізки
+            self.curvature_overlays[key] = (
+                array_to_polygon(comb.reshape(-1, 2)),
+                array_to_polygon(evolute.reshape(-1, 2)),
+            )
+            if len(self.curvature_overlays) > self.curvature_overlays_size:
+                self.curvature_overlays.popitem(last=False)
+        return self.curvature_overlays[key]
+
+    def draw_curvature(self, painter):
+        comb, evolute = self.get_curvature_overlay()
+        painter.save()
+        painter.scale(self.param_a, self.param_a)
+        painter.setBrush(Qt.NoBrush)
+
+        # Усі зубці - одним викликом drawLines
+        pen_comb = QPen(QColor(255, 140, 0, 140), 1)
+        pen_comb.setCosmetic(True)
+        painter.setPen(pen_comb)
+        painter.drawLines(comb)
+
+        pen_evolute = QPen(QColor("#8E44AD"), 2)
+        pen_evolute.setCosmetic(True)
+        painter.setPen(pen_evolute)
+        painter.drawLines(evolute)
+        painter.restore()
 
     def draw_tangent_normal(self, painter):
-        t_val = self.param_t
-        pt = CardioidMath.get_point(self.param_a, t_val)
+        point, tangent, normal, _ = self.curve.frame(self.param_a, self.param_t)
+        pt = QPointF(*point.tolist())
 
         painter.setPen(Qt.NoPen)
         painter.setBrush(Qt.red)
         painter.drawEllipse(pt, 4, 4)
 
-        dx, dy = CardioidMath.get_derivatives(self.param_a, t_val)
         line_len = 100
-        mag = math.sqrt(dx ** 2 + dy ** 2)
-
-        if mag > 0.001:
-            tx, ty = (dx / mag) * line_len, (dy / mag) * line_len
-            nx, ny = (-dy / mag) * line_len, (dx / mag) * line_len
+        # Одинична дотична визначена і в точках повернення (напрям r'')
+        if np.isfinite(tangent).all():
+            tx, ty = (tangent * line_len).tolist()
+            nx, ny = (normal * line_len).tolist()
 
             pen_tan = QPen(QColor("magenta"), 2)
             pen_tan.setCosmetic(True)
@@ -166,6 +247,84 @@ class CanvasWidget(QWidget):
             painter.drawLine(QPointF(pt.x() - nx, pt.y() - ny), QPointF(pt.x() + nx, pt.y() + ny))
 
 
+class CanvasWidget(QWidget, CardioidScene):
+    # Нова дискретизація: кількість вершин, найбільша похибка (пікселі)
+    sampling_changed = Signal(int, float)
+    # Точку на кривій вибрано мишею: параметр t
+    point_picked = Signal(float)
+
+    def __init__(self, parent=None):
+        QWidget.__init__(self, parent)
+        CardioidScene.__init__(self)
+        self.setStyleSheet("background-color: white;")
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        self.last_mouse_pos = QPointF()
+        self.dragging_point = False  # Тягнемо точку вздовж кривої (інакше - панорама)
+        self.pick_radius_px = 10.0
+
+    def set_params(self, a, t):
+        self.param_a = a
+        self.param_t = t
+        self.update()
+
+    def set_curve(self, curve):
+        self.curve = curve
+        self.update()
+
+    def set_show_curvature(self, show):
+        self.show_curvature = show
+        self.update()
+
+    def set_transform_params(self, dx, dy, angle, cx, cy):
+        self.transform_matrix = self.euclidean_transform(dx, dy, angle, cx, cy)
+        self.update()
+
+    def sampling_updated(self, count, error):
+        self.sampling_changed.emit(count, error)
+
+    def pick(self, pos):
+        """Найближча точка кривої до позиції миші: (t, відстань у пікселях)"""
+        inverse, _ = self.world_transform(self.width(), self.height()).inverted()
+        local = inverse.map(pos)
+        t, dist = self.curve.closest_t(self.param_a, (local.x(), local.y()))
+        return t, dist * self.scale_factor  # Евклідове перетворення не змінює відстаней
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.last_mouse_pos = event.position()
+            t, dist = self.pick(event.position())
+            self.dragging_point = dist <= self.pick_radius_px
+            if self.dragging_point:
+                self.point_picked.emit(t)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.dragging_point = False
+
+    def mouseMoveEvent(self, event):
+        if self.dragging_point:
+            t, _ = self.pick(event.position())
+            self.point_picked.emit(t)
+        elif event.buttons() & Qt.MouseButton.LeftButton:
+            delta = event.position() - self.last_mouse_pos
+            self.offset_x += delta.x()
+            self.offset_y += delta.y()
+            self.last_mouse_pos = event.position()
+            self.update()
+
+    def wheelEvent(self, event):
+        if event.angleDelta().y() > 0:
+            self.scale_factor *= 1.1
+        else:
+            self.scale_factor /= 1.1
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        self.paint(painter, self.width(), self.height())
+
+
 # ==========================================
 # 3. ГОЛОВНЕ ВІКНО
 # ==========================================
@@ -184,19 +343,32 @@ class MainWindow(QMainWindow):
         ctrl_layout = QVBoxLayout(controls)
 
         # 1. Curve Params
-        grp_curve = QGroupBox("Параметри Кардіоїди")
+        grp_curve = QGroupBox("Параметри кривої")
         grid_curve = QGridLayout()
+        self.combo_curve = QComboBox()
+        for name, definition in CURVES.items():
+            self.combo_curve.addItem(definition.title, name)
+        # Параметр форми (b, k ...) - якщо крива його має
+        self.lbl_shape = QLabel("Форма:")
+        self.spin_shape = QDoubleSpinBox()
         self.spin_a = QDoubleSpinBox()
         self.spin_a.setRange(10, 300)
         self.spin_a.setValue(50)
         self.spin_a.setSuffix(" px")
+        # Положення точки - частка довжини кривої (0..1000 ‰), а не параметр t
         self.slider_t = QSlider(Qt.Orientation.Horizontal)
-        self.slider_t.setRange(0, 628)
-        self.slider_t.setValue(100)
-        grid_curve.addWidget(QLabel("Параметр a:"), 0, 0)
-        grid_curve.addWidget(self.spin_a, 0, 1)
-        grid_curve.addWidget(QLabel("Точка t:"), 1, 0)
-        grid_curve.addWidget(self.slider_t, 1, 1)
+        self.slider_t.setRange(0, 1000)
+        self.slider_t.setValue(250)
+        grid_curve.addWidget(QLabel("Крива:"), 0, 0)
+        grid_curve.addWidget(self.combo_curve, 0, 1)
+        grid_curve.addWidget(self.lbl_shape, 1, 0)
+        grid_curve.addWidget(self.spin_shape, 1, 1)
+        grid_curve.addWidget(QLabel("Параметр a:"), 2, 0)
+        grid_curve.addWidget(self.spin_a, 2, 1)
+        grid_curve.addWidget(QLabel("Точка s:"), 3, 0)
+        grid_curve.addWidget(self.slider_t, 3, 1)
+        self.chk_curvature = QCheckBox("Еволюта і гребінь кривини")
+        grid_curve.addWidget(self.chk_curvature, 4, 0, 1, 2)
         grp_curve.setLayout(grid_curve)
         ctrl_layout.addWidget(grp_curve)
 
@@ -236,9 +408,11 @@ class MainWindow(QMainWindow):
         self.lbl_area = QLabel("Площа: 0")
         self.lbl_len = QLabel("Довжина: 0")
         self.lbl_rad = QLabel("Радіус кривини: 0")
+        self.lbl_sampling = QLabel("Вершин: 0")
         res_layout.addWidget(self.lbl_area)
         res_layout.addWidget(self.lbl_len)
         res_layout.addWidget(self.lbl_rad)
+        res_layout.addWidget(self.lbl_sampling)
         grp_res.setLayout(res_layout)
         ctrl_layout.addWidget(grp_res)
 
@@ -248,6 +422,11 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.canvas)
 
         # Signals
+        self.canvas.sampling_changed.connect(self.update_sampling)
+        self.canvas.point_picked.connect(self.pick_point)
+        self.combo_curve.currentIndexChanged.connect(self.select_curve)
+        self.spin_shape.valueChanged.connect(self.update_curve)
+        self.chk_curvature.toggled.connect(self.canvas.set_show_curvature)
         self.spin_a.valueChanged.connect(self.update_all)
         self.slider_t.valueChanged.connect(self.update_all)
         for sb in [self.spin_dx, self.spin_dy, self.spin_angle, self.spin_cx, self.spin_cy]:
@@ -258,8 +437,9 @@ class MainWindow(QMainWindow):
         self.timer.timeout.connect(self.animate_step)
         self.btn_anim.clicked.connect(self.toggle_animation)
         self.anim_direction = 1
+        self.anim_speed = 4.0  # px шляху точки за кадр
 
-        self.update_all()
+        self.select_curve()
 
     def create_spin(self, val, mn, mx):
         sb = QDoubleSpinBox()
@@ -267,15 +447,60 @@ class MainWindow(QMainWindow):
         sb.setValue(val)
         return sb
 
+    def select_curve(self):
+        """Нова крива: поле параметра форми налаштовується під неї"""
+        definition = CURVES[self.combo_curve.currentData()]
+        self.spin_shape.blockSignals(True)
+        if definition.shape:
+            name, (default, mn, mx) = next(iter(definition.shape.items()))
+            self.lbl_shape.setText(f"Форма {name}:")
+            self.spin_shape.setDecimals(0 if isinstance(default, int) else 2)
+            self.spin_shape.setSingleStep(1.0 if isinstance(default, int) else 0.1)
+            self.spin_shape.setRange(mn, mx)
+            self.spin_shape.setValue(default)
+        self.lbl_shape.setVisible(bool(definition.shape))
+        self.spin_shape.setVisible(bool(definition.shape))
+        self.spin_shape.blockSignals(False)
+        self.update_curve()
+
+    def update_curve(self):
+        """Крива з кешу реєстру: таблиці й контури вже побудованих кривих не перераховуються"""
+        definition = CURVES[self.combo_curve.currentData()]
+        shape = {}
+        if definition.shape:
+            name, (default, _, _) = next(iter(definition.shape.items()))
+            value = self.spin_shape.value()
+            shape[name] = int(round(value)) if isinstance(default, int) else value
+        self.canvas.set_curve(get_curve(definition.name, **shape))
+        self.update_all()
+
     def update_all(self):
         a = self.spin_a.value()
-        t_deg = self.slider_t.value() / 100.0
-        self.canvas.set_params(a, t_deg)
-        area, length, r_curv = CardioidMath.calculate_properties(a, t_deg)
-        self.lbl_area.setText(f"Площа: {area:.2f}")
-        self.lbl_len.setText(f"Довжина: {length:.2f}")
+        curve = self.canvas.curve
+        # Відстань уздовж кривої -> t (таблиця довжин, O(log N))
+        s = self.slider_t.value() / 1000.0 * curve.length(a)
+        self.apply_point(a, float(curve.t_from_s(a, s)))
+
+    def apply_point(self, a, t):
+        self.canvas.set_params(a, t)
+        curve = self.canvas.curve
+        r_curv = float(curve.curvature_radius(a, t))
+        self.lbl_area.setText(f"Площа: {curve.area(a):.2f}")
+        self.lbl_len.setText(f"Довжина: {curve.length(a):.2f}")
         self.lbl_rad.setText(f"Радіус кривини (у т. t): {abs(r_curv):.2f}")
 
+    def pick_point(self, t):
+        """Точка, вибрана мишею: повзунок лише слідує за нею (без округлення t)"""
+        a = self.spin_a.value()
+        curve = self.canvas.curve
+        self.slider_t.blockSignals(True)
+        self.slider_t.setValue(round(float(curve.s_from_t(a, t)) / curve.length(a) * 1000) % 1000)
+        self.slider_t.blockSignals(False)
+        self.apply_point(a, t)
+
+    def update_sampling(self, count, error):
+        self.lbl_sampling.setText(f"Вершин: {count}, похибка ≤ {error:.3f} px")
+
     def update_transform(self):
         self.canvas.set_transform_params(
             self.spin_dx.value(), self.spin_dy.value(),
@@ -289,32 +514,44 @@ class MainWindow(QMainWindow):
             self.timer.stop()
 
     def animate_step(self):
-        # 1. Дихання (параметр a)
-        curr_a = self.spin_a.value()
-        if curr_a >= 100:
-            self.anim_direction = -1
-        elif curr_a <= 30:
-            self.anim_direction = 1
-
-        # 2. Обертання (кут)
-        curr_angle = self.spin_angle.value()
-        new_angle = (curr_angle + 1) % 360
+        a, angle, pos, self.anim_direction = animation_step(
+            self.spin_a.value(), self.spin_angle.value(), self.slider_t.value(),
+            self.anim_direction, self.anim_speed, self.canvas.curve.length(1.0)
+        )
 
         # Блокуємо сигнали, щоб не викликати подвійне перемальовування
         self.spin_a.blockSignals(True)
         self.spin_angle.blockSignals(True)
+        self.slider_t.blockSignals(True)
 
-        self.spin_a.setValue(curr_a + 0.5 * self.anim_direction)
-        self.spin_angle.setValue(new_angle)
+        self.spin_a.setValue(a)
+        self.spin_angle.setValue(angle)
+        self.slider_t.setValue(pos)
 
         self.spin_a.blockSignals(False)
         self.spin_angle.blockSignals(False)
+        self.slider_t.blockSignals(False)
 
         # Оновлюємо все вручну
         self.update_all()
         self.update_transform()
 
 
+def animation_step(a, angle, pos, direction, speed=4.0, unit_length=8.0):
+    """
+    Один кадр анімації: (a, кут, положення точки в ‰ довжини, напрям) -> наступний.
+    1. Дихання (параметр a), 2. обертання, 3. рух точки з постійною швидкістю
+    speed px за кадр вздовж кривої (unit_length - довжина кривої при a = 1).
+    Без віджетів - для вікна і для експорту кадрів.
+    """
+    if a >= 100:
+        direction = -1
+    elif a <= 30:
+        direction = 1
+    step = max(1, round(1000 * speed / (unit_length * a)))
+    return a + 0.5 * direction, (angle + 1) % 360, (pos + step) % 1000, direction
+
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = MainWindow()
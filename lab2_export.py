@@ -0,0 +1,126 @@
+"""
+Експорт анімації lab2 ("дихання та обертання" кривої) у кадри без вікна.
+Кадри малюються в QImage на платформі offscreen пулом потоків
+(QPainter на QImage безпечний у своєму потоці), у кожному потоці - своя сцена.
+
+Запуск:
+    python lab2_export.py --frames 300 --out frames            (frame_00000.png ...)
+    python lab2_export.py --frames 300 --raw | ffmpeg -f rawvideo -pix_fmt rgba \\
+        -s 1280x720 -r 33 -i - clip.mp4
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QGuiApplication, QImage, QPainter
+
+from polar_curves import CURVES, get_curve
+from lab2 import CardioidScene, animation_step
+
+
+def animation_states(frames, a=50.0, angle=0.0, pos=250, direction=1, speed=4.0, curve=None):
+    """Послідовність станів (a, кут, t) - та сама, що дає таймер lab2"""
+    curve = curve or get_curve("cardioid")
+    unit_length = curve.length(1.0)
+    states = []
+    for _ in range(frames):
+        a, angle, pos, direction = animation_step(a, angle, pos, direction, speed, unit_length)
+        t = float(curve.t_from_s(a, pos / 1000.0 * unit_length * a))
+        states.append((a, angle, t))
+    return states
+
+
+class FrameRenderer:
+    def __init__(self, width=1280, height=720, scale=1.0, curve=None):
+        self.width = width
+        self.height = height
+        self.scale = scale
+        self.curve = curve or get_curve("cardioid")
+        self.local = threading.local()  # Сцена (і кеш контуру) окремо для кожного потоку
+
+    def scene(self):
+        scene = getattr(self.local, "scene", None)
+        if scene is None:
+            scene = CardioidScene(grid_cache=False)
+            scene.scale_factor = self.scale
+            scene.curve = self.curve
+            self.local.scene = scene
+        return scene
+
+    def render(self, state):
+        a, angle, t = state
+        scene = self.scene()
+        scene.param_a = a
+        scene.param_t = t
+        scene.transform_matrix = CardioidScene.euclidean_transform(0, 0, angle, 0, 0)
+
+        image = QImage(self.width, self.height, QImage.Format_RGBA8888)
+        image.fill(Qt.white)
+        painter = QPainter(image)
+        scene.paint(painter, self.width, self.height)
+        painter.end()
+        return image
+
+
+def export_frames(states, renderer, out_dir=None, stream=None, workers=None):
+    """
+    Малює кадри в пулі потоків. out_dir - PNG-послідовність (зберігають самі потоки),
+    stream - сирі RGBA-кадри по порядку. У роботі одночасно не більше 2 * workers кадрів.
+    Повертає кількість кадрів за секунду.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    def job(index):
+        image = renderer.render(states[index])
+        if out_dir is not None:
+            image.save(os.path.join(out_dir, f"frame_{index:05d}.png"))
+            return None
+        return image
+
+    start = time.perf_counter()
+    window = 2 * workers
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for first in range(0, len(states), window):
+            # map зберігає порядок кадрів
+            for image in pool.map(job, range(first, min(first + window, len(states)))):
+                if stream is not None:
+                    stream.write(image.constBits().tobytes())
+    elapsed = time.perf_counter() - start
+    return len(states) / elapsed if elapsed > 0 else float("inf")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Експорт анімації lab2 у кадри")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--curve", choices=list(CURVES), default="cardioid")
+    parser.add_argument("--size", default="1280x720", help="ШИРИНАxВИСОТА")
+    parser.add_argument("--scale", type=float, default=1.0, help="зум камери")
+    parser.add_argument("--workers", type=int, default=None)
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--out", help="тека для PNG-послідовності")
+    output.add_argument("--raw", action="store_true", help="сирі RGBA-кадри в stdout")
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv)  # Для QPainter/шрифтів
+
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+    curve = get_curve(args.curve)
+    renderer = FrameRenderer(width, height, args.scale, curve)
+    states = animation_states(args.frames, curve=curve)
+    fps = export_frames(
+        states, renderer,
+        out_dir=args.out, stream=sys.stdout.buffer if args.raw else None, workers=args.workers
+    )
+    print(f"{len(states)} кадрів {width}x{height}: {fps:.1f} кадрів/с", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
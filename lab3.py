@@ -1,5 +1,6 @@
 import sys
 import math
+import numpy as np
 from PySide6.QtCore import Qt, QPointF, QTimer
 from PySide6.QtGui import QPainter, QPen, QColor, QPainterPath, QTransform, QAction
 from PySide6.QtWidgets import (
@@ -7,55 +8,11 @@ from PySide6.QtWidgets import (
     QHBoxLayout, QGridLayout, QLabel, QDoubleSpinBox,
     QGroupBox, QPushButton, QSizePolicy, QCheckBox, QMenu
 )
+from canvas_grid import GridLayer, array_to_polygon
+from bezier_math import BezierMath, SegmentCache, GridIndex, BezierContour, SMOOTH
 
 
-# 1. МАТЕМАТИЧНЕ ЯДРО (Formula 1.2: Engineering Form)
-
-class EngineeringMath:
-    @staticmethod
-    def get_point(u, rA, rB, rC, rD, wA, wB, wC, wD):
-        """
-        Реалізація формули (1.2) з методички (Раціональні криві Безьє 3-го порядку).
-        Враховує координати 4 точок і 4 ваги.
-        """
-        mu = 1 - u
-        mu2 = mu * mu
-        mu3 = mu2 * mu
-        u2 = u * u
-        u3 = u2 * u
-
-        b0 = mu3  # (1-u)^3
-        b1 = 3 * u * mu2  # 3u(1-u)^2
-        b2 = 3 * u2 * mu  # 3u^2(1-u)
-        b3 = u3  # u^3
-
-        # Чисельник
-        nx = (rA.x() * wA * b0) + (rB.x() * wB * b1) + (rC.x() * wC * b2) + (rD.x() * wD * b3)
-        ny = (rA.y() * wA * b0) + (rB.y() * wB * b1) + (rC.y() * wC * b2) + (rD.y() * wD * b3)
-
-        # Знаменник
-        denom = (wA * b0) + (wB * b1) + (wC * b2) + (wD * b3)
-
-        if abs(denom) < 1e-6: return rA
-        return QPointF(nx / denom, ny / denom)
-
-
-# 2. КЛАС ТОЧКИ (Node) - (виправлений)
-
-class Node:
-    def __init__(self, pos, type='corner'):
-        self.pos = pos  # Основна точка (A або D)
-        self.handle_in = pos  # Вхідний вусик (C)
-        self.handle_out = pos  # Вихідний вусик (B)
-        self.type = type
-
-        # Зберігаємо ваги окремо для кожної частини вузла
-        self.w_pos = 1.0  # Вага червоної точки
-        self.w_in = 1.0  # Вага зеленого вхідного вусика
-        self.w_out = 1.0  # Вага зеленого вихідного вусика
-
-
-# 3. КЛАС ПОЛОТНА (CANVAS)
+# 1. КЛАС ПОЛОТНА (CANVAS)
 
 class CanvasWidget(QWidget):
     def __init__(self, parent=None):
@@ -75,34 +32,38 @@ class CanvasWidget(QWidget):
             (-70, 50, 'corner'), (-35, 140, 'smooth')
         ]
 
-        self.nodes = []
-        for x, y, t in raw_points:
-            self.nodes.append(Node(QPointF(x, y), t))
+        # Вузли - у суцільних масивах; self.nodes[i] - вигляд вузла (pos, handle_in, handle_out, ваги, type)
+        self.nodes = BezierContour(
+            [(x, y) for x, y, _ in raw_points], types=[t for _, _, t in raw_points], point_type=QPointF
+        )
 
         self.auto_calculate_handles()
 
-        # Цільові точки для анімації
-        self.target_nodes = []
+        # Цільові точки для анімації: гладкі вузли на колі, вусики у вузлах, ваги 1
         radius = 160
-        for i in range(len(self.nodes)):
-            angle = 2 * math.pi * i / len(self.nodes) + math.pi / 2
-            pos = QPointF(radius * math.cos(angle), radius * math.sin(angle))
-            node = Node(pos, 'smooth')
-            node.handle_in = pos
-            node.handle_out = pos
-            # Ваги за замовчуванням
-            node.w_pos = 1.0;
-            node.w_in = 1.0;
-            node.w_out = 1.0
-            self.target_nodes.append(node)
+        angles = 2 * np.pi * np.arange(len(self.nodes)) / len(self.nodes) + np.pi / 2
+        self.target_nodes = BezierContour(
+            radius * np.column_stack((np.cos(angles), np.sin(angles))), types=['smooth'] * len(self.nodes),
+            point_type=QPointF
+        )
 
         self.show_skeleton = True
+        # Вершини сегментів контуру; після зміни вузла позначаються лише його сегменти
+        self.tolerance_px = 0.25  # Допустиме відхилення ламаної від кривої на екрані
+        self.segments = SegmentCache()
+
+        # Просторові індекси для влучання мишею (будуються при першому запиті)
+        self.node_index = GridIndex()
+        self.handle_index = GridIndex()
+        self.index_dirty = True
+
         self.transform_matrix = QTransform()
+        self.grid = GridLayer(50, color="#505050")
 
         # Інтерактив
         self.selected_node_idx = -1
         self.selected_handle_type = None  # 'node', 'in', 'out'
-        self.drag_radius = 10
+        self.drag_radius = 10  # Радіус влучання мишею, екранні пікселі
         self.last_mouse_pos = QPointF()
         self.last_node_pos_drag = QPointF()
 
@@ -117,18 +78,7 @@ class CanvasWidget(QWidget):
         self.main_window_ref = None
 
     def auto_calculate_handles(self):
-        n = len(self.nodes)
-        for i in range(n):
-            if self.nodes[i].type == 'corner':
-                self.nodes[i].handle_in = self.nodes[i].pos
-                self.nodes[i].handle_out = self.nodes[i].pos
-                continue
-            prev = self.nodes[(i - 1) % n].pos
-            curr = self.nodes[i].pos
-            next_p = self.nodes[(i + 1) % n].pos
-            tangent = (next_p - prev) * 0.2
-            self.nodes[i].handle_in = curr - tangent
-            self.nodes[i].handle_out = curr + tangent
+        self.nodes.smooth_all(0.2)
 
     def update_handles_smoothness(self, idx, changed_handle_type):
         node = self.nodes[idx]
@@ -141,18 +91,29 @@ class CanvasWidget(QWidget):
             vec = pos - node.handle_out
             node.handle_in = pos + vec
 
+    def hit_indexes(self):
+        """Індекси вузлів і вусиків; після анімації перебудовуються цілком"""
+        if self.index_dirty:
+            pos, h_in, h_out, _ = BezierMath.node_arrays(self.nodes)
+            self.node_index.build(pos)
+            self.handle_index.build(np.stack((h_in, h_out), axis=1).reshape(-1, 2))
+            self.index_dirty = False
+        return self.node_index, self.handle_index
+
+    def reindex_node(self, idx):
+        """Вузол idx змінився: в індексах переміщуються лише його три точки"""
+        if self.index_dirty:
+            return
+        node = self.nodes[idx]
+        self.node_index.move([idx], (node.pos.x(), node.pos.y()))
+        self.handle_index.move([2 * idx, 2 * idx + 1], (node.handle_in.x(), node.handle_in.y(),
+                                                        node.handle_out.x(), node.handle_out.y()))
+
     def show_context_menu(self, pos):
         if self.is_animating: return
-        target_idx = -1
-        min_dist = float('inf')
-        screen_hit_radius = 20
-        # Шукаємо тільки основні точки для меню типу
-        for i, node in enumerate(self.nodes):
-            screen_node_pos = self.transform_matrix.map(node.pos)
-            dist = (screen_node_pos - QPointF(pos)).manhattanLength()
-            if dist < screen_hit_radius and dist < min_dist:
-                min_dist = dist
-                target_idx = i
+        # Той самий вузол, що взяло б перетягування з цієї точки
+        node_index, _ = self.hit_indexes()
+        target_idx, _ = self.pick(node_index, QPointF(pos), self.drag_radius * 1.5)
 
         if target_idx != -1:
             menu = QMenu(self)
@@ -172,27 +133,35 @@ class CanvasWidget(QWidget):
     def set_node_type(self, idx, type_):
         self.nodes[idx].type = type_
         if type_ == 'smooth': self.update_handles_smoothness(idx, 'out')
+        self.segments.invalidate_node(idx)
+        self.reindex_node(idx)
         self.update()
 
+    def pick(self, index, screen_pos, radius_px):
+        """
+        Найближча точка індексу до курсора: (номер, відстань) або (-1, inf).
+        Радіус і відстань - в екранних пікселях за поточною матрицею, тож зона
+        влучання на екрані однакова за будь-якого обертання й масштабу.
+        """
+        pos = self.get_logical_pos(screen_pos)
+        m = self.transform_matrix
+        return index.nearest(pos.x(), pos.y(), radius_px, metric=((m.m11(), m.m12()), (m.m21(), m.m22())))
+
     def mousePressEvent(self, event):
-        pos = self.get_logical_pos(event.position())
         if event.button() == Qt.MouseButton.LeftButton:
             if not self.is_animating:
-                # 1. Перевіряємо вусики
+                node_index, handle_index = self.hit_indexes()
+                # Спершу вусики (точка 2i - вхідний, 2i + 1 - вихідний), потім вузли
                 if self.show_skeleton:
-                    for i, node in enumerate(self.nodes):
-                        if (node.handle_in - pos).manhattanLength() < self.drag_radius:
-                            self.set_selection(i, 'in');
-                            return
-                        if (node.handle_out - pos).manhattanLength() < self.drag_radius:
-                            self.set_selection(i, 'out');
-                            return
-                # 2. Перевіряємо вузли
-                for i, node in enumerate(self.nodes):
-                    if (node.pos - pos).manhattanLength() < self.drag_radius * 1.5:
-                        self.set_selection(i, 'node');
-                        self.last_node_pos_drag = node.pos
+                    hit, _ = self.pick(handle_index, event.position(), self.drag_radius)
+                    if hit >= 0:
+                        self.set_selection(hit // 2, 'in' if hit % 2 == 0 else 'out')
                         return
+                hit, _ = self.pick(node_index, event.position(), self.drag_radius * 1.5)
+                if hit >= 0:
+                    self.set_selection(hit, 'node')
+                    self.last_node_pos_drag = self.nodes[hit].pos
+                    return
 
             self.last_mouse_pos = event.position()
             self.set_selection(-1, None)
@@ -236,6 +205,10 @@ class CanvasWidget(QWidget):
             elif self.selected_handle_type == 'out':
                 node.handle_out = pos
                 self.update_handles_smoothness(self.selected_node_idx, 'out')
+            # Гладкий вузол дзеркалить вусики - змінюються обидва його сегменти
+            part = self.selected_handle_type if node.type == 'corner' else 'node'
+            self.segments.invalidate_node(self.selected_node_idx, part)
+            self.reindex_node(self.selected_node_idx)
             self.update()
         elif event.buttons() & Qt.MouseButton.LeftButton:
             delta = event.position() - self.last_mouse_pos
@@ -254,27 +227,31 @@ class CanvasWidget(QWidget):
         self.transform_matrix = t
         self.update()
 
+    def wheelEvent(self, event):
+        factor = 1.1 if event.angleDelta().y() > 0 else 1 / 1.1
+        self.tr_sx *= factor
+        self.tr_sy *= factor
+        self.update_transform()
+
+    def curve_tolerance(self):
+        """
+        Допуск поділу в логічних одиницях. Рівень - степінь двійки зуму, тож контур
+        перераховується лише при переході через рівень і не гірше tolerance_px на екрані.
+        """
+        scale = max(abs(self.tr_sx), abs(self.tr_sy))
+        return self.tolerance_px / 2.0 ** math.ceil(math.log2(max(scale, 1e-9)))
+
     def get_logical_pos(self, screen_pos):
         t_inv, ok = self.transform_matrix.inverted()
         return t_inv.map(screen_pos) if ok else screen_pos
 
     def update_animation_state(self, progress):
         self.anim_progress = progress
-        for i in range(len(self.nodes)):
-            n_curr = self.nodes[i]
-            n_targ = self.target_nodes[i]
-            n_curr.pos = self.lerp(n_curr.pos, n_targ.pos, progress)
-            n_curr.handle_in = self.lerp(n_curr.handle_in, n_targ.handle_in, progress)
-            n_curr.handle_out = self.lerp(n_curr.handle_out, n_targ.handle_out, progress)
-            # Інтерполяція ваг для всіх точок
-            n_curr.w_pos = n_curr.w_pos + (n_targ.w_pos - n_curr.w_pos) * 0.05
-            n_curr.w_in = n_curr.w_in + (n_targ.w_in - n_curr.w_in) * 0.05
-            n_curr.w_out = n_curr.w_out + (n_targ.w_out - n_curr.w_out) * 0.05
+        self.nodes.lerp_to(self.target_nodes, 0.05)  # Точки й ваги - за один крок
+        self.segments.invalidate_all()
+        self.index_dirty = True
         self.update()
 
-    def lerp(self, p1, p2, t):
-        return p1 + (p2 - p1) * 0.05
-
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
@@ -282,34 +259,15 @@ class CanvasWidget(QWidget):
         painter.setTransform(self.transform_matrix)
         self.draw_grid(painter)
 
+        # Перераховуються лише змінені сегменти, у Qt - один многокутник
         path = QPainterPath()
-        n = len(self.nodes)
-        steps = 40
-
-        if n > 0:
-            path.moveTo(self.nodes[0].pos)
-            for i in range(n):
-                # Сегмент i: від nodes[i] до nodes[i+1]
-                curr = self.nodes[i]
-                next_node = self.nodes[(i + 1) % n]
-
-                # Точки A, B, C, D
-                rA = curr.pos
-                rB = curr.handle_out
-                rC = next_node.handle_in
-                rD = next_node.pos
-
-                # Ваги A, B, C, D (Тепер беремо реальні ваги!)
-                wA = curr.w_pos
-                wB = curr.w_out  # Вага вихідного вусика
-                wC = next_node.w_in  # Вага вхідного вусика наступного вузла
-                wD = next_node.w_pos
-
-                # Малювання сегмента
-                for s in range(1, steps + 1):
-                    u = s / steps
-                    pt = EngineeringMath.get_point(u, rA, rB, rC, rD, wA, wB, wC, wD)
-                    path.lineTo(pt)
+        self.segments.set_tolerance(self.curve_tolerance())
+        if self.nodes:
+            path.addPolygon(array_to_polygon(self.segments.refresh(self.nodes)))
+        if self.main_window_ref:
+            self.main_window_ref.lbl_segments.setText(
+                f"Сегменти: перераховано {self.segments.last_rebuilt}, з кешу {self.segments.last_reused}\n"
+                f"Вершин: {self.segments.vertex_count()} (допуск {self.tolerance_px} px)")
 
         pen = QPen(QColor("#0099FF"), 2)
         pen.setCosmetic(True)
@@ -317,66 +275,43 @@ class CanvasWidget(QWidget):
         painter.setBrush(QColor(26, 58, 90, 150))
         painter.drawPath(path)
 
+        # Кістяк і маркери - прямо з масивів контуру, кожен шар одним викликом
+        pos, h_in, h_out, _ = self.nodes.arrays()
         if self.show_skeleton:
             pen_skel = QPen(QColor("#808080"), 1, Qt.DashLine)
             pen_skel.setCosmetic(True)
             painter.setPen(pen_skel)
-            for node in self.nodes:
-                painter.drawLine(node.pos, node.handle_in)
-                painter.drawLine(node.pos, node.handle_out)
-
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor("#00FF00"))  # Зелені - B і C
-            r = 4 / self.tr_sx
-            for node in self.nodes:
-                painter.drawEllipse(node.handle_in, r, r)
-                painter.drawEllipse(node.handle_out, r, r)
-
-        for i, node in enumerate(self.nodes):
-            painter.setPen(Qt.NoPen)
-            # Підсвітка вибору
-            if i == self.selected_node_idx:
-                if self.selected_handle_type == 'node':
-                    painter.setBrush(QColor("#FFFF00"))
-                else:
-                    painter.setBrush(QColor("#FF0000")) if node.type == 'smooth' else painter.setBrush(
-                        QColor("#FF3333"))
-            else:
-                if node.type == 'smooth':
-                    painter.setBrush(QColor("#FF0000"))
-                else:
-                    painter.setBrush(QColor("#FF3333"))
-
-            r = (6 if node.type == 'smooth' else 5) / self.tr_sx
-            if node.type == 'smooth':
-                painter.drawEllipse(node.pos, r, r)
-            else:
-                painter.drawRect(node.pos.x() - r, node.pos.y() - r, r * 2, r * 2)
-
-            # Якщо вибрано вусик, підсвітимо його жовтим
-            if i == self.selected_node_idx:
-                if self.selected_handle_type == 'in':
-                    painter.setBrush(QColor("#FFFF00"))
-                    painter.drawEllipse(node.handle_in, 4 / self.tr_sx, 4 / self.tr_sx)
-                elif self.selected_handle_type == 'out':
-                    painter.setBrush(QColor("#FFFF00"))
-                    painter.drawEllipse(node.handle_out, 4 / self.tr_sx, 4 / self.tr_sx)
+            # Пари точок (вузол, вусик) - відрізки drawLines
+            painter.drawLines(array_to_polygon(np.stack((pos, h_in, pos, h_out), axis=1)))
+            self.draw_markers(painter, np.concatenate((h_in, h_out)), QColor("#00FF00"), 8, Qt.RoundCap)
 
-    def draw_grid(self, painter):
-        pen = QPen(QColor("#505050"), 0);
-        pen.setCosmetic(True);
-        painter.setPen(pen)
-        for i in range(-2000, 2000, 50):
-            painter.drawLine(i, -2000, i, 2000);
-            painter.drawLine(-2000, i, 2000, i)
-        pen.setColor(Qt.black);
-        pen.setWidth(2);
+        smooth = self.nodes.types == SMOOTH
+        self.draw_markers(painter, pos[smooth], QColor("#FF0000"), 12, Qt.RoundCap)
+        self.draw_markers(painter, pos[~smooth], QColor("#FF3333"), 10, Qt.SquareCap)
+
+        # Підсвітка обраного вузла чи вусика
+        i = self.selected_node_idx
+        if 0 <= i < len(self.nodes):
+            if self.selected_handle_type == 'node':
+                self.draw_markers(painter, pos[i:i + 1], QColor("#FFFF00"),
+                                  12 if smooth[i] else 10, Qt.RoundCap if smooth[i] else Qt.SquareCap)
+            elif self.selected_handle_type in ('in', 'out'):
+                handle = h_in if self.selected_handle_type == 'in' else h_out
+                self.draw_markers(painter, handle[i:i + 1], QColor("#FFFF00"), 8, Qt.RoundCap)
+
+    def draw_markers(self, painter, points, color, size_px, cap):
+        """Маркери точок (K, 2) одним drawPoints: косметичне перо діаметром size_px пікселів"""
+        pen = QPen(color, size_px, Qt.SolidLine, cap)
+        pen.setCosmetic(True)
         painter.setPen(pen)
-        painter.drawLine(-2000, 0, 2000, 0);
-        painter.drawLine(0, -2000, 0, 2000)
+        painter.drawPoints(array_to_polygon(points))
+
+    def draw_grid(self, painter):
+        # Лише видимі лінії, з кешованого шару
+        self.grid.draw(painter)
 
 
-# 4. ГОЛОВНЕ ВІКНО
+# 2. ГОЛОВНЕ ВІКНО
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -410,6 +345,8 @@ class MainWindow(QMainWindow):
 
         vbox.addWidget(self.spin_weight)
         vbox.addWidget(self.chk_skel)
+        self.lbl_segments = QLabel("Сегменти: -")
+        vbox.addWidget(self.lbl_segments)
         vbox.addWidget(QLabel("<b>ПКМ по точці:</b> Тип"))
         vbox.addWidget(QLabel("<b>ЛКМ:</b> Виділити/Перетягнути"))
         grp_opts.setLayout(vbox)
@@ -449,6 +386,7 @@ class MainWindow(QMainWindow):
                 self.canvas.nodes[idx].w_in = val
             elif type_ == 'out':
                 self.canvas.nodes[idx].w_out = val
+            self.canvas.segments.invalidate_node(idx, type_)
             self.canvas.update()
 
     def toggle_anim(self):
@@ -21,6 +21,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout, QGridLayout, QLabel, QDoubleSpinBox,
     QGroupBox, QPushButton, QSizePolicy, QCheckBox
 )
+from frame_scheduler import FrameScheduler
 
 
 # 1. МАТЕМАТИКА ТРАНСФОРМАЦІЙ
@@ -272,6 +273,12 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Лабораторна №6: Триточкова перспектива")
         self.resize(1200, 750)
 
+        # Слайдери позначають брудну частину стану, перерахунок - раз на кадр
+        self.scheduler = FrameScheduler()
+        self.scheduler.register("shape", self.apply_shape)
+        self.scheduler.register("transform", self.apply_transform)
+        self.scheduler.register("projection", self.apply_projection)
+
         central = QWidget()
         self.setCentralWidget(central)
         layout = QHBoxLayout(central)
@@ -289,8 +296,8 @@ class MainWindow(QMainWindow):
         # 1. Параметри Поверхні
         grp_surf = QGroupBox("1. Параметри Поверхні")
         l_surf = QVBoxLayout()
-        self.spin_R = self.add_slider(l_surf, "Радіус (R):", 100, 10, 200)
-        self.spin_stretch = self.add_slider(l_surf, "Витяг (Stretch %):", 150, 10, 300)
+        self.spin_R = self.add_slider(l_surf, "Радіус (R):", 100, 10, 200, "shape")
+        self.spin_stretch = self.add_slider(l_surf, "Витяг (Stretch %):", 150, 10, 300, "shape")
 
         self.btn_anim = QPushButton("Старт/Стоп Анімація")
         self.btn_anim.setCheckable(True)
@@ -309,7 +316,7 @@ class MainWindow(QMainWindow):
         self.spin_scale = self.add_slider(l_world, "Масштаб (%):", 100, 10, 300)
         self.spin_dx = self.add_slider(l_world, "Зсув X:", 0, -200, 200)
         self.spin_dy = self.add_slider(l_world, "Зсув Y:", 0, -200, 200)
-        self.spin_dist = self.add_slider(l_world, "Проекція (d):", 600, 200, 2000)
+        self.spin_dist = self.add_slider(l_world, "Проекція (d):", 600, 200, 2000, "projection")
         grp_world.setLayout(l_world)
         ctrl_layout.addWidget(grp_world)
 
@@ -317,10 +324,10 @@ class MainWindow(QMainWindow):
         grp_uv = QGroupBox("3. Трансформація Контуру (на поверхні)")
         l_uv = QVBoxLayout()
         # Слайдери для UV дають плавний рух
-        self.spin_u = self.add_slider(l_uv, "Зсув U (широта):", 20, -150, 150)  # * 0.01
-        self.spin_v = self.add_slider(l_uv, "Зсув V (довгота):", 0, -314, 314)  # * 0.01
-        self.spin_uv_rot = self.add_slider(l_uv, "Обертання Контуру:", 0, -180, 180)
-        self.spin_uv_scale = self.add_slider(l_uv, "Масштаб Контуру (%):", 100, 10, 200)
+        self.spin_u = self.add_slider(l_uv, "Зсув U (широта):", 20, -150, 150, "shape")  # * 0.01
+        self.spin_v = self.add_slider(l_uv, "Зсув V (довгота):", 0, -314, 314, "shape")  # * 0.01
+        self.spin_uv_rot = self.add_slider(l_uv, "Обертання Контуру:", 0, -180, 180, "shape")
+        self.spin_uv_scale = self.add_slider(l_uv, "Масштаб Контуру (%):", 100, 10, 200, "shape")
         grp_uv.setLayout(l_uv)
         ctrl_layout.addWidget(grp_uv)
 
@@ -332,7 +339,7 @@ class MainWindow(QMainWindow):
         self.timer.timeout.connect(self.anim_tick)
         self.anim_phase = 0
 
-    def add_slider(self, layout, label_text, val, min_v, max_v):
+    def add_slider(self, layout, label_text, val, min_v, max_v, part="transform"):
         lbl = QLabel(f"{label_text} {val}")
 
         # Горизонтальний лейаут для слайдера
@@ -340,30 +347,36 @@ class MainWindow(QMainWindow):
         sl = QSliderWithLabel(Qt.Horizontal, lbl, label_text)
         sl.setRange(min_v, max_v)
         sl.setValue(val)
-        sl.valueChanged.connect(self.update_params)
+        sl.valueChanged.connect(self.scheduler.slot(part))
 
         layout.addWidget(lbl)
         layout.addWidget(sl)
         return sl
 
-    def update_params(self):
+    def apply_shape(self):
         c = self.canvas
         c.surf_R = self.spin_R.value()
         c.surf_stretch = self.spin_stretch.value() / 100.0
 
+        c.uv_u = self.spin_u.value() * 0.01
+        c.uv_v = self.spin_v.value() * 0.01
+        c.uv_rot = self.spin_uv_rot.value()
+        c.uv_scale_pct = self.spin_uv_scale.value()
+        c.update()
+
+    def apply_transform(self):
+        c = self.canvas
         c.model_rot_x = self.spin_rot_x.value()
         c.model_rot_y = self.spin_rot_y.value()
         c.model_rot_z = self.spin_rot_z.value()
         c.model_scale = self.spin_scale.value()
         c.model_dx = self.spin_dx.value()
         c.model_dy = self.spin_dy.value()
-        c.view_dist = self.spin_dist.value()
-
-        c.uv_u = self.spin_u.value() * 0.01
-        c.uv_v = self.spin_v.value() * 0.01
-        c.uv_rot = self.spin_uv_rot.value()
-        c.uv_scale_pct = self.spin_uv_scale.value()
+        c.update()
 
+    def apply_projection(self):
+        c = self.canvas
+        c.view_dist = self.spin_dist.value()
         c.update()
 
     def toggle_anim(self):
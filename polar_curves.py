@@ -0,0 +1,494 @@
+import ast
+import math
+from collections import OrderedDict
+import numpy as np
+
+
+# ==========================================
+# РЕЄСТР КРИВИХ (полярні та параметричні, без Qt)
+# ==========================================
+# Крива описується в одиничному масштабі (a = 1): полярно r(t) або
+# параметрично x(t), y(t) - рядком-виразом або функцією numpy.
+# Вираз компілюється один раз; похідні виводяться символьно (диференціювання
+# дерева ast), для функцій - чисельно. Параметр a лише масштабує всі координати,
+# тому таблиці одиничної кривої (вибірки, довжини, площа) придатні для будь-якого a.
+
+FUNCTIONS = {"sin": np.sin, "cos": np.cos, "tan": np.tan, "exp": np.exp, "log": np.log, "sqrt": np.sqrt}
+CONSTANTS = {"pi": math.pi, "e": math.e}
+
+
+# ==========================================
+# 1. СИМВОЛЬНЕ ДИФЕРЕНЦІЮВАННЯ ВИРАЗІВ
+# ==========================================
+class ExprDiff:
+    """d/dt над деревом ast: +, -, *, /, **, унарний мінус і функції з FUNCTIONS"""
+
+    @staticmethod
+    def num(value):
+        return ast.Constant(value=value)
+
+    @staticmethod
+    def is_num(node, value=None):
+        return isinstance(node, ast.Constant) and (value is None or node.value == value)
+
+    @staticmethod
+    def add(a, b):
+        if ExprDiff.is_num(a, 0):
+            return b
+        if ExprDiff.is_num(b, 0):
+            return a
+        return ast.BinOp(left=a, op=ast.Add(), right=b)
+
+    @staticmethod
+    def sub(a, b):
+        if ExprDiff.is_num(b, 0):
+            return a
+        return ast.BinOp(left=a, op=ast.Sub(), right=b)
+
+    @staticmethod
+    def mul(a, b):
+        if ExprDiff.is_num(a, 0) or ExprDiff.is_num(b, 0):
+            return ExprDiff.num(0)
+        if ExprDiff.is_num(a, 1):
+            return b
+        if ExprDiff.is_num(b, 1):
+            return a
+        return ast.BinOp(left=a, op=ast.Mult(), right=b)
+
+    @staticmethod
+    def div(a, b):
+        if ExprDiff.is_num(a, 0):
+            return ExprDiff.num(0)
+        return ast.BinOp(left=a, op=ast.Div(), right=b)
+
+    @staticmethod
+    def neg(a):
+        if ExprDiff.is_num(a, 0):
+            return a
+        return ast.UnaryOp(op=ast.USub(), operand=a)
+
+    @staticmethod
+    def call(name, arg):
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=[arg], keywords=[])
+
+    @staticmethod
+    def depends(node):
+        return any(isinstance(n, ast.Name) and n.id == "t" for n in ast.walk(node))
+
+    @staticmethod
+    def diff(node):
+        D = ExprDiff
+        if isinstance(node, ast.Constant):
+            return D.num(0)
+        if isinstance(node, ast.Name):
+            return D.num(1 if node.id == "t" else 0)
+        if isinstance(node, ast.UnaryOp):
+            d = D.diff(node.operand)
+            return D.neg(d) if isinstance(node.op, ast.USub) else d
+        if isinstance(node, ast.BinOp):
+            u, v = node.left, node.right
+            du, dv = D.diff(u), D.diff(v)
+            if isinstance(node.op, ast.Add):
+                return D.add(du, dv)
+            if isinstance(node.op, ast.Sub):
+                return D.sub(du, dv) if not D.is_num(du, 0) else D.neg(dv)
+            if isinstance(node.op, ast.Mult):
+                return D.add(D.mul(du, v), D.mul(u, dv))
+            if isinstance(node.op, ast.Div):
+                return D.div(D.sub(D.mul(du, v), D.mul(u, dv)), ast.BinOp(left=v, op=ast.Pow(), right=D.num(2)))
+            if isinstance(node.op, ast.Pow):
+                if not D.depends(v):
+                    # (u^n)' = n u^(n-1) u'
+                    power = ast.BinOp(left=u, op=ast.Pow(), right=D.sub(v, D.num(1)))
+                    return D.mul(D.mul(v, power), du)
+                # (u^v)' = u^v (v' ln u + v u' / u)
+                return D.mul(node, D.add(D.mul(dv, D.call("log", u)), D.div(D.mul(v, du), u)))
+        if isinstance(node, ast.Call):
+            u = node.args[0]
+            du = D.diff(u)
+            name = node.func.id
+            if name == "sin":
+                outer = D.call("cos", u)
+            elif name == "cos":
+                outer = D.neg(D.call("sin", u))
+            elif name == "tan":
+                outer = D.div(D.num(1), ast.BinOp(left=D.call("cos", u), op=ast.Pow(), right=D.num(2)))
+            elif name == "exp":
+                outer = node
+            elif name == "log":
+                outer = D.div(D.num(1), u)
+            else:  # sqrt
+                outer = D.div(D.num(1), D.mul(D.num(2), node))
+            return D.mul(outer, du)
+        raise ValueError(f"Непідтримуваний вираз: {ast.dump(node)}")
+
+    @staticmethod
+    def parse(text, names):
+        """Рядок -> дерево ast; дозволені лише t, параметри форми, FUNCTIONS і CONSTANTS"""
+        tree = ast.parse(text, mode="eval").body
+        allowed = set(names) | set(FUNCTIONS) | set(CONSTANTS) | {"t"}
+        ops = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd)
+        for n in ast.walk(tree):
+            if isinstance(n, ast.Name) and n.id not in allowed:
+                raise ValueError(f"Невідоме ім'я у виразі: {n.id}")
+            if isinstance(n, ast.Call) and not (isinstance(n.func, ast.Name) and n.func.id in FUNCTIONS
+                                                and len(n.args) == 1 and not n.keywords):
+                raise ValueError(f"Непідтримуваний виклик у виразі: {text}")
+            if isinstance(n, (ast.operator, ast.unaryop)) and not isinstance(n, ops):
+                raise ValueError(f"Непідтримувана операція у виразі: {text}")
+            if isinstance(n, (ast.Attribute, ast.Subscript, ast.Lambda, ast.Compare, ast.BoolOp, ast.IfExp)):
+                raise ValueError(f"Непідтримуваний вираз: {text}")
+        return tree
+
+    @staticmethod
+    def compile(node, label):
+        """Дерево -> векторизована функція f(t, shape) (t - масив numpy)"""
+        code = compile(ast.fix_missing_locations(ast.Expression(body=node)), f"<{label}>", "eval")
+        base = {**FUNCTIONS, **CONSTANTS}
+
+        def evaluate(t, shape):
+            value = eval(code, {"__builtins__": {}}, {**base, **shape, "t": t})
+            return np.broadcast_to(np.asarray(value, dtype=np.float64), np.shape(t))
+
+        return evaluate
+
+
+# ==========================================
+# 2. ОПИС КРИВОЇ ТА КОМПІЛЯЦІЯ
+# ==========================================
+class CurveDef:
+    """
+    r - полярний радіус, або x і y - параметричні координати (рядки чи функції
+    f(t, **shape)). shape - параметри форми: назва -> (типове, мін, макс);
+    тип типового значення (int / float) визначає тип поля в інтерфейсі.
+    t_end - кінець параметра: число або функція від словника параметрів форми.
+    """
+
+    def __init__(self, name, title, r=None, x=None, y=None, shape=None, t_end=2 * math.pi):
+        if (r is None) == (x is None or y is None):
+            raise ValueError("Потрібен або r, або пара x, y")
+        self.name = name
+        self.title = title
+        self.r = r
+        self.x = x
+        self.y = y
+        self.shape = shape or {}
+        self.t_end = t_end
+        self.evaluators = None  # Компілюються при першому використанні, один раз
+
+    def defaults(self):
+        return {k: v[0] for k, v in self.shape.items()}
+
+    def compiled(self):
+        """(x, y, x', y', x'', y''), кожна - f(t, shape)"""
+        if self.evaluators is None:
+            if isinstance(self.r if self.r is not None else self.x, str):
+                self.evaluators = self.compile_expressions()
+            else:
+                self.evaluators = self.compile_callables()
+        return self.evaluators
+
+    def compile_expressions(self):
+        names = list(self.shape)
+        if self.r is not None:
+            r = ExprDiff.parse(self.r, names)
+            t = ast.Name(id="t", ctx=ast.Load())
+            x = ExprDiff.mul(r, ExprDiff.call("cos", t))
+            y = ExprDiff.mul(r, ExprDiff.call("sin", t))
+        else:
+            x = ExprDiff.parse(self.x, names)
+            y = ExprDiff.parse(self.y, names)
+        dx, dy = ExprDiff.diff(x), ExprDiff.diff(y)
+        ddx, ddy = ExprDiff.diff(dx), ExprDiff.diff(dy)
+        return tuple(ExprDiff.compile(node, f"{self.name}:{k}")
+                     for k, node in zip(("x", "y", "dx", "dy", "ddx", "ddy"), (x, y, dx, dy, ddx, ddy)))
+
+    def compile_callables(self):
+        """Похідні функцій - центральні різниці 4-го порядку"""
+        if self.r is not None:
+            fx = lambda t, shape: self.r(t, **shape) * np.cos(t)
+            fy = lambda t, shape: self.r(t, **shape) * np.sin(t)
+        else:
+            fx = lambda t, shape: self.x(t, **shape)
+            fy = lambda t, shape: self.y(t, **shape)
+
+        def first(f, h=1e-3):
+            return lambda t, shape: (8 * (f(t + h, shape) - f(t - h, shape))
+                                     - (f(t + 2 * h, shape) - f(t - 2 * h, shape))) / (12 * h)
+
+        def second(f, h=1e-2):
+            return lambda t, shape: (16 * (f(t + h, shape) + f(t - h, shape)) - 30 * f(t, shape)
+                                     - (f(t + 2 * h, shape) + f(t - 2 * h, shape))) / (12 * h * h)
+
+        return fx, fy, first(fx), first(fy), second(fx), second(fy)
+
+
+class ArcLengthTable:
+    """
+    Накопичена довжина s(t) кривої з відомою швидкістю |r'(t)|.
+    Кожен інтервал таблиці інтегрується квадратурою Гаусса (5 вузлів),
+    обернення t(s) - двійковий пошук з лінійною інтерполяцією (np.interp), O(log N).
+    """
+
+    def __init__(self, speed, t_end, samples=4096, t_start=0.0):
+        t = np.linspace(t_start, t_end, samples + 1)
+        x, w = np.polynomial.legendre.leggauss(5)
+        half = np.diff(t) / 2
+        nodes = (t[:-1] + half)[:, None] + half[:, None] * x[None, :]
+        segment = (speed(nodes) * w[None, :]).sum(axis=1) * half
+        self.t = t
+        self.s = np.concatenate(([0.0], np.cumsum(segment)))
+        self.length = float(self.s[-1])
+
+    def s_from_t(self, t):
+        return np.interp(t, self.t, self.s)
+
+    def t_from_s(self, s):
+        return np.interp(s, self.s, self.t)
+
+
+# ==========================================
+# 3. КРИВА З ФІКСОВАНОЮ ФОРМОЮ (кешовані таблиці)
+# ==========================================
+class Curve:
+    """
+    Крива з конкретними параметрами форми. Таблиці (адаптивні вибірки,
+    довжина дуги, площа, точки для пошуку) рахуються для одиничної кривої
+    при першому запиті й лишаються в об'єкті; самі об'єкти кешує get_curve.
+    """
+
+    def __init__(self, definition, shape):
+        self.definition = definition
+        self.shape = dict(shape)
+        self.key = (definition.name,) + tuple(sorted(self.shape.items()))
+        self.fx, self.fy, self.fdx, self.fdy, self.fddx, self.fddy = definition.compiled()
+        t_end = definition.t_end
+        self.t_end = float(t_end(self.shape) if callable(t_end) else t_end)
+
+        self.sample_cache = {}  # допуск -> (t, похибка)
+        self.arc = None
+        self.unit_area = None
+        self.pick_samples = {}  # кількість -> (t, точки одиничної кривої) для пошуку найближчої точки
+
+    @staticmethod
+    def pair(fx, fy, t, shape):
+        return np.stack((fx(t, shape), fy(t, shape)), axis=-1)
+
+    def points(self, a, t):
+        t = np.asarray(t, dtype=np.float64)
+        return a * self.pair(self.fx, self.fy, t, self.shape)
+
+    def derivatives(self, a, t):
+        t = np.asarray(t, dtype=np.float64)
+        return a * self.pair(self.fdx, self.fdy, t, self.shape)
+
+    def second_derivatives(self, a, t):
+        t = np.asarray(t, dtype=np.float64)
+        return a * self.pair(self.fddx, self.fddy, t, self.shape)
+
+    def speed(self, a, t):
+        return np.linalg.norm(self.derivatives(a, t), axis=-1)
+
+    def tangents(self, t):
+        """Одиничні дотичні; де швидкість нульова (точка повернення) - напрям r''"""
+        d1 = self.derivatives(1.0, t)
+        d2 = self.second_derivatives(1.0, t)
+        n1 = np.linalg.norm(d1, axis=-1, keepdims=True)
+        n2 = np.linalg.norm(d2, axis=-1, keepdims=True)
+        use_first = n1 > 1e-9
+        return np.where(use_first, d1 / np.where(use_first, n1, 1.0), d2 / np.maximum(n2, 1e-300))
+
+    def normals(self, t):
+        tan = self.tangents(t)
+        return np.stack((-tan[..., 1], tan[..., 0]), axis=-1)
+
+    def curvature_radius(self, a, t):
+        """|r'|³ / (x' y'' - y' x''), зі знаком; нескінченність на прямих ділянках"""
+        d1 = self.derivatives(a, t)
+        d2 = self.second_derivatives(a, t)
+        cross = d1[..., 0] * d2[..., 1] - d1[..., 1] * d2[..., 0]
+        speed3 = np.linalg.norm(d1, axis=-1) ** 3
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(cross != 0, speed3 / np.where(cross != 0, cross, 1.0), np.inf)
+
+    def frame(self, a, t):
+        tan = self.tangents(t)
+        normal = np.stack((-tan[..., 1], tan[..., 0]), axis=-1)
+        return self.points(a, t), tan, normal, self.curvature_radius(a, t)
+
+    def evolute(self, a, t):
+        """
+        Точки, одиничні нормалі, знакова кривина κ і центри кривини p + n / κ
+        одним проходом (r' і r'' рахуються один раз). На прямих ділянках κ = 0
+        і центру немає (nan); у точках повернення κ = inf, центр - сама точка.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        p = self.points(a, t)
+        d1 = self.derivatives(a, t)
+        d2 = self.second_derivatives(a, t)
+        speed2 = (d1 * d1).sum(-1)
+        cross = d1[..., 0] * d2[..., 1] - d1[..., 1] * d2[..., 0]
+        moving = speed2 > 1e-18 * a * a
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kappa = np.where(moving, cross / (speed2 * np.sqrt(speed2)), np.inf)
+            # n / κ = (-y', x') |r'|² / (x' y'' - y' x'')
+            lever = np.where(cross != 0, speed2 / cross, np.nan)
+        centers = p + lever[..., None] * np.stack((-d1[..., 1], d1[..., 0]), axis=-1)
+        centers = np.where(moving[..., None], centers, p)
+        return p, self.normals(t), kappa, centers
+
+    # --- Адаптивна дискретизація одиничної кривої ---
+    def chord_error(self, t0, t1, probes=7):
+        """Найбільша відстань від дуги [t0, t1] (у probes внутрішніх точках) до хорди: (S,)"""
+        p0 = self.points(1.0, t0)
+        p1 = self.points(1.0, t1)
+        k = np.arange(1, probes + 1) / (probes + 1)
+        q = self.points(1.0, t0[:, None] + (t1 - t0)[:, None] * k[None, :])
+        ab = p1 - p0
+        denom = np.maximum((ab * ab).sum(-1), 1e-300)[:, None]
+        aq = q - p0[:, None, :]
+        u = np.clip((aq * ab[:, None, :]).sum(-1) / denom, 0.0, 1.0)
+        d = aq - u[..., None] * ab[:, None, :]
+        return np.sqrt((d * d).sum(-1)).max(axis=1)
+
+    def adaptive_samples(self, tolerance, initial=16, max_depth=24):
+        """
+        Значення t, за яких ламана одиничної кривої відходить від неї не більше tolerance.
+        Ділимо навпіл лише ті інтервали, де похибка хорди більша (усі разом,
+        рівень за рівнем) - там, де крива пряміша, вершин менше.
+        Повертає (t, досягнута найбільша похибка); результат кешується по допуску.
+        """
+        if tolerance not in self.sample_cache:
+            t = np.linspace(0.0, self.t_end, initial + 1)
+            for _ in range(max_depth):
+                err = self.chord_error(t[:-1], t[1:])
+                bad = err > tolerance
+                if not bad.any():
+                    break
+                t = np.sort(np.concatenate((t, (t[:-1][bad] + t[1:][bad]) / 2)))
+            # Остаточна оцінка - щільніше, ніж під час поділу
+            self.sample_cache[tolerance] = (t, float(self.chord_error(t[:-1], t[1:], probes=15).max()))
+        return self.sample_cache[tolerance]
+
+    # --- Довжина, площа ---
+    def arc_table(self):
+        if self.arc is None:
+            self.arc = ArcLengthTable(lambda t: self.speed(1.0, t), self.t_end)
+        return self.arc
+
+    def length(self, a):
+        return abs(a) * self.arc_table().length
+
+    def t_from_s(self, a, s):
+        table = self.arc_table()
+        return table.t_from_s(np.mod(np.asarray(s, dtype=np.float64) / a, table.length))
+
+    def s_from_t(self, a, t):
+        return a * self.arc_table().s_from_t(np.mod(np.asarray(t, dtype=np.float64), self.t_end))
+
+    def area(self, a):
+        """Інтеграл Гріна (x y' - y x') / 2 - квадратура Гаусса на 4096 інтервалах"""
+        if self.unit_area is None:
+            t = np.linspace(0.0, self.t_end, 4097)
+            x, w = np.polynomial.legendre.leggauss(5)
+            half = np.diff(t) / 2
+            nodes = (t[:-1] + half)[:, None] + half[:, None] * x[None, :]
+            p = self.points(1.0, nodes)
+            d = self.derivatives(1.0, nodes)
+            green = (p[..., 0] * d[..., 1] - p[..., 1] * d[..., 0]) / 2
+            self.unit_area = abs(float(((green * w[None, :]).sum(axis=1) * half).sum()))
+        return a * a * self.unit_area
+
+    # --- Найближча точка ---
+    def closest_t(self, a, points, samples=512, iterations=6, chunk_size=4096):
+        """
+        Параметри t найближчих точок кривої для точок (M, 2) (або однієї (2,)).
+        Грубий пошук по samples готових точках дає інтервал, далі - кілька кроків
+        Ньютона для f(t) = |r(t) - q|² / 2, не виходячи за інтервал. Повертає (t, відстань).
+        """
+        if samples not in self.pick_samples:
+            grid_t = np.linspace(0.0, self.t_end, samples, endpoint=False)
+            self.pick_samples[samples] = (grid_t, self.points(1.0, grid_t))
+        grid_t, unit = self.pick_samples[samples]
+        step = self.t_end / samples
+
+        q = np.asarray(points, dtype=np.float64)
+        single = q.ndim == 1
+        q = q.reshape(-1, 2)
+        # |q - p|² = |q|² - 2 q·p + |p|²: |q|² не впливає на argmin, решта - одне множення
+        # матриць (x, y, 1) @ (-2 p, |p|²) без проміжних масивів (M, S)
+        p = a * unit
+        basis = np.vstack((-2 * p.T, (p * p).sum(-1)))
+        best = np.empty(len(q), dtype=np.intp)
+        for first in range(0, len(q), chunk_size):
+            part = q[first:first + chunk_size]
+            best[first:first + chunk_size] = (np.column_stack((part, np.ones(len(part)))) @ basis).argmin(axis=1)
+
+        t0 = grid_t[best]
+        t = t0.copy()
+        # Ньютон лише для точок, що ще не зійшлися: після 2-3 кроків їх мало
+        active = np.arange(len(q))
+        for _ in range(iterations):
+            ta, qa = t[active], q[active]
+            r = self.points(a, ta) - qa
+            d1 = self.derivatives(a, ta)
+            d2 = self.second_derivatives(a, ta)
+            grad = (r * d1).sum(-1)
+            hess = (d1 * d1).sum(-1) + (r * d2).sum(-1)
+            # Там, де f'' <= 0 (або біля точки повернення), Ньютон ненадійний - крок градієнта
+            ok = hess > 1e-12
+            delta = np.where(ok, grad / np.where(ok, hess, 1.0), np.sign(grad) * step / 2)
+            t[active] = np.clip(ta - delta, t0[active] - step, t0[active] + step)
+            active = active[np.abs(delta) >= 1e-12]
+            if not len(active):
+                break
+
+        # Ньютон не має погіршувати грубий результат
+        dist = np.linalg.norm(self.points(a, t) - q, axis=-1)
+        coarse = np.linalg.norm(p[best] - q, axis=-1)
+        worse = coarse < dist
+        t = np.mod(np.where(worse, t0, t), self.t_end)
+        dist = np.where(worse, coarse, dist)
+        if single:
+            return float(t[0]), float(dist[0])
+        return t, dist
+
+
+# ==========================================
+# 4. РЕЄСТР
+# ==========================================
+CURVES = {}
+# (назва, параметри форми) -> Curve, LRU: параметр форми неперервний,
+# тож повзунок чи анімація інакше додавали б запис на кожне значення
+_instances = OrderedDict()
+INSTANCE_CACHE_SIZE = 32
+
+
+def register(definition):
+    CURVES[definition.name] = definition
+    return definition
+
+
+def get_curve(name, **shape):
+    """Крива з реєстру; параметри форми, яких не передали, - типові. Об'єкти кешуються"""
+    definition = CURVES[name]
+    values = {**definition.defaults(), **shape}
+    key = (name,) + tuple(sorted(values.items()))
+    curve = _instances.get(key)
+    if curve is not None:
+        _instances.move_to_end(key)
+    else:
+        curve = _instances[key] = Curve(definition, values)
+        if len(_instances) > INSTANCE_CACHE_SIZE:
+            _instances.popitem(last=False)  # Викидаємо найстаріший
+    return curve
+
+
+register(CurveDef("cardioid", "Кардіоїда", r="1 - cos(t)"))
+register(CurveDef("limacon", "Равлик Паскаля", r="b + cos(t)", shape={"b": (0.5, 0.0, 3.0)}))
+# Для непарного k троянда проходиться двічі за 2pi - досить півоберту
+register(CurveDef("rose", "Троянда", r="cos(k * t)", shape={"k": (3, 1, 12)},
+                  t_end=lambda s: math.pi if int(s["k"]) % 2 else 2 * math.pi))
+register(CurveDef("epicycloid", "Епіциклоїда",
+                  x="(k + 1) * cos(t) - cos((k + 1) * t)", y="(k + 1) * sin(t) - sin((k + 1) * t)",
+                  shape={"k": (3, 1, 12)}))
@@ -0,0 +1,119 @@
+import math
+
+import numpy as np
+import pytest
+
+from bezier_math import BezierContour, GridIndex, SegmentCache
+
+
+# ==========================================
+# ПРОСТОРОВИЙ ІНДЕКС ПРОТИ ПОВНОГО ПЕРЕБОРУ
+# ==========================================
+def brute_nearest(xy, x, y, radius, metric=None):
+    """Найменша манхеттенська відстань перебором усіх точок: (відстань або inf, номери з нею)"""
+    delta = xy - (x, y)
+    if metric is not None:
+        delta = delta @ metric
+    dist = np.abs(delta).sum(axis=1)
+    best = dist.min()
+    if best >= radius:
+        return math.inf, set()
+    return best, set(np.nonzero(dist == best)[0].tolist())
+
+
+def random_metric(rng):
+    """Поворот, нерівномірний масштаб і зсув - як лінійна частина QTransform"""
+    angle = rng.uniform(0, 2 * math.pi)
+    rot = np.array([[math.cos(angle), math.sin(angle)], [-math.sin(angle), math.cos(angle)]])
+    shear = np.array([[1.0, 0.0], [rng.uniform(-0.5, 0.5), 1.0]])
+    return shear @ np.diag(rng.uniform(0.2, 5.0, 2)) @ rot
+
+
+@pytest.mark.parametrize("use_metric", [False, True])
+def test_grid_nearest_matches_brute_force(use_metric):
+    rng = np.random.default_rng(24)
+    for _ in range(20):
+        # Рівномірні точки і щільні скупчення (вузол поряд зі своїми вусиками)
+        n = int(rng.integers(1, 400))
+        xy = rng.uniform(-300, 300, (n, 2))
+        clustered = rng.random(n) < 0.3
+        xy[clustered] = xy[rng.integers(0, n, clustered.sum())] + rng.normal(0, 2, (clustered.sum(), 2))
+        index = GridIndex(xy)
+        metric = random_metric(rng) if use_metric else None
+
+        for _ in range(50):
+            # Зрідка - переміщення точок (окремий список до перебудови сітки)
+            if rng.random() < 0.2:
+                ids = rng.integers(0, n, int(rng.integers(1, 4)))
+                index.move(ids, rng.uniform(-300, 300, (len(ids), 2)))
+            x, y = rng.uniform(-350, 350, 2)
+            radius = rng.choice([1.0, 10.0, 60.0, 1000.0])
+            k, dist = index.nearest(x, y, radius, metric)
+            expected, ids = brute_nearest(index.xy, x, y, radius, metric)
+            if ids:
+                assert k in ids
+                assert dist == pytest.approx(expected, rel=1e-12, abs=1e-12)
+            else:
+                assert (k, dist) == (-1, math.inf)
+
+
+# ==========================================
+# КЕШ СЕГМЕНТІВ ПРОТИ ПОВНОЇ ТЕСЕЛЯЦІЇ
+# ==========================================
+def random_contour(rng, n):
+    angle = np.sort(rng.uniform(0, 2 * math.pi, n))
+    pos = np.column_stack((np.cos(angle), np.sin(angle))) * rng.uniform(80, 200, (n, 1))
+    return BezierContour(pos, pos + rng.normal(0, 30, (n, 2)), pos + rng.normal(0, 30, (n, 2)),
+                         rng.uniform(0.5, 3.0, (n, 3)), rng.integers(0, 2, n))
+
+
+def test_segment_cache_matches_full_rebuild():
+    rng = np.random.default_rng(22)
+    contour = random_contour(rng, 24)
+    n = len(contour)
+    cache = SegmentCache()
+    cache.refresh(contour)
+    in_place = moved = 0
+
+    for _ in range(200):
+        # 1-3 правки між оновленнями; кожна позначає лише свої сегменти
+        for _ in range(int(rng.integers(1, 4))):
+            i = int(rng.integers(0, n))
+            # Зсув на 1e-9 майже завжди лишає кількість вершин сегмента, великий - змінює
+            step = rng.normal(0, 1e-9 if rng.random() < 0.5 else 20, 2)
+            edit = rng.integers(0, 5)
+            if edit == 0:  # Вузол з вусиками
+                for array in (contour.pos, contour.handle_in, contour.handle_out):
+                    array[i] += step
+                cache.invalidate_node(i)
+            elif edit == 1:
+                contour.handle_in[i] += step
+                cache.invalidate_node(i, 'in')
+            elif edit == 2:
+                contour.handle_out[i] += step
+                cache.invalidate_node(i, 'out')
+            elif edit == 3:  # Вага: w_pos - обидва сегменти, w_in / w_out - один
+                k = int(rng.integers(0, 3))
+                contour.weights[i, k] = rng.uniform(0.5, 3.0)
+                cache.invalidate_node(i, ('node', 'in', 'out')[k])
+            else:  # Зміна типу вузла вирівнює вусики (як smooth_all для одного вузла)
+                contour.types[i] ^= 1
+                tangent = (contour.pos[(i + 1) % n] - contour.pos[i - 1]) * 0.2
+                smooth = contour.types[i] == 1
+                contour.handle_in[i] = contour.pos[i] - tangent if smooth else contour.pos[i]
+                contour.handle_out[i] = contour.pos[i] + tangent if smooth else contour.pos[i]
+                cache.invalidate_node(i)
+
+        before = cache.vertex_count()
+        polyline = cache.refresh(contour)
+        in_place += cache.vertex_count() == before
+        moved += cache.vertex_count() != before
+
+        full = SegmentCache()
+        np.testing.assert_array_equal(polyline, full.refresh(contour))
+        np.testing.assert_array_equal(cache.offsets, full.offsets)
+        np.testing.assert_array_equal(cache.bbox, full.bbox)
+        assert cache.last_rebuilt < n
+
+    # Обидві гілки refresh: запис на місці і перенесення в новий буфер
+    assert in_place > 20 and moved > 20
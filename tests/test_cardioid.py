@@ -0,0 +1,79 @@
+import math
+
+import numpy as np
+import pytest
+
+from lab2 import CardioidMath
+
+
+# ==========================================
+# ВЛАСТИВОСТІ КАРДІОЇДИ r = a (1 - cos t)
+# ==========================================
+def dense_cardioid(a, n=200_001):
+    """Точки і похідні кривої напряму з параметричних формул (без CardioidMath)"""
+    t = np.linspace(0.0, 2 * math.pi, n)
+    x, y = a * (1 - np.cos(t)) * np.cos(t), a * (1 - np.cos(t)) * np.sin(t)
+    dx, dy = np.gradient(x, t), np.gradient(y, t)
+    return t, x, y, dx, dy
+
+
+@pytest.mark.parametrize("a", [1.0, 50.0])
+def test_area_and_length(a):
+    t, x, y, dx, dy = dense_cardioid(a)
+    area = abs(np.trapezoid(x * dy - y * dx, t)) / 2
+    length = np.hypot(np.diff(x), np.diff(y)).sum()
+    got_area, got_length, _ = CardioidMath.calculate_properties(a, 1.0)
+    assert got_area == pytest.approx(area, rel=1e-6)
+    assert got_length == pytest.approx(length, rel=1e-6)
+    # Сталі саме для r = a (1 - cos t), а не для r = 2a (1 - cos t)
+    assert got_area == pytest.approx(1.5 * math.pi * a * a)
+    assert got_length == pytest.approx(8 * a)
+
+
+@pytest.mark.parametrize("t", [0.5, 1.0, 2.0, math.pi, 4.0, 5.5])
+def test_curvature_radius(t):
+    a = 50.0
+    dx, dy = CardioidMath.get_derivatives(a, t)
+    ddx = a * (2 * math.cos(2 * t) - math.cos(t))
+    ddy = a * (2 * math.sin(2 * t) - math.sin(t))
+    expected = (dx * dx + dy * dy) ** 1.5 / (dx * ddy - dy * ddx)
+    _, _, r_curv = CardioidMath.calculate_properties(a, t)
+    assert r_curv == pytest.approx(expected, rel=1e-9)
+
+
+# ==========================================
+# ПОЛОЖЕННЯ ТОЧОК ВІДНОСНО КРИВОЇ (CardioidCurve.classify)
+# ==========================================
+def test_classify_cusp_is_on_curve():
+    from cardioid_math import CardioidCurve
+
+    dist, side, t = CardioidCurve.classify(50.0, np.array([[0.0, 0.0]]))
+    assert side.tolist() == [0]
+    assert dist[0] == pytest.approx(0.0, abs=1e-9)
+
+
+def test_classify_sides():
+    from cardioid_math import CardioidCurve
+
+    a = 50.0
+    t = np.array([0.7, 2.0, math.pi, 4.5])
+    on = CardioidCurve.points(a, t)
+    normal = CardioidCurve.normals(t)
+    # Точки на кривій і зміщені на 1 по обидва боки; бік - за напрямом до центру (-a, 0)
+    towards = np.sign(((np.array([-a, 0.0]) - on) * normal).sum(-1))[:, None]
+    inside, outside = on + towards * normal, on - towards * normal
+    _, side, _ = CardioidCurve.classify(a, np.concatenate((on, inside, outside)))
+    assert side.tolist() == [0] * 4 + [-1] * 4 + [1] * 4
+
+
+def test_classify_transform():
+    from cardioid_math import CardioidCurve
+
+    transform = (12.0, -7.0, 33.0, 5.0, 9.0)  # dx, dy, кут, cx, cy - як у lab2
+    a = 50.0
+    c, s = math.cos(math.radians(33.0)), math.sin(math.radians(33.0))
+    local = np.array([[0.0, 0.0], [-30.0, 5.0], [40.0, 40.0]])
+    # Сцена = R(p - c) + c + d
+    scene = (local - [5.0, 9.0]) @ np.array([[c, s], [-s, c]]) + [5.0 + 12.0, 9.0 - 7.0]
+    _, side, _ = CardioidCurve.classify(a, scene, transform)
+    assert side.tolist() == [0, -1, 1]
@@ -0,0 +1,74 @@
+import math
+
+import numpy as np
+import pytest
+
+from flange_math import MIN_WALL, FlangeGeometry, FlangeRules
+
+
+# ==========================================
+# ЗАПАСИ ПРАВИЛ ПРОТИ ВІДСТАНЕЙ НА ПОБУДОВАНОМУ КОНТУРІ
+# ==========================================
+def outer_distance(contour, p):
+    """Точна відстань від точки p до зовнішньої межі: дуги вух і дотичні відрізки"""
+    best = math.inf
+    for c, start, sweep in zip(contour.centers, contour.arc_start, contour.arc_sweep):
+        d = p - c
+        if (math.atan2(d[1], d[0]) - start) % (2 * math.pi) <= sweep:
+            best = min(best, abs(math.hypot(*d) - contour.r_corner))
+        else:
+            for angle in (start, start + sweep):
+                end = c + contour.r_corner * np.array([math.cos(angle), math.sin(angle)])
+                best = min(best, math.hypot(*(p - end)))
+    for a, b in zip(contour.line_start, contour.line_end):
+        ab = b - a
+        u = np.clip((p - a) @ ab / max(ab @ ab, 1e-300), 0.0, 1.0)
+        best = min(best, math.hypot(*(p - a - u * ab)))
+    return best
+
+
+def measured_margins(params, n_lobes):
+    contour = FlangeGeometry.build(*params, n_lobes=n_lobes)
+    centers = contour.centers
+    r_center, r_hole = contour.holes[0, 2], contour.holes[1, 2]
+    lobe = min(outer_distance(contour, c) for c in centers) - r_hole
+    if n_lobes > 1:
+        ligament = min(math.hypot(*(centers[i] - centers[(i + 1) % n_lobes])) for i in range(n_lobes)) - 2 * r_hole
+    else:
+        ligament = math.inf
+    return {
+        "lobe_wall": lobe - MIN_WALL,
+        "hole_ligament": ligament - MIN_WALL,
+        "center_ligament": np.hypot(*centers.T).min() - r_hole - r_center - MIN_WALL,
+        "center_wall": outer_distance(contour, np.zeros(2)) - r_center - MIN_WALL,
+    }
+
+
+def random_params(rng, n_lobes, count=20):
+    """(D, BCD, d, R); для N = 1 центр мусить лежати в колі вуха: R > BCD / 2"""
+    params = np.column_stack((rng.uniform(10, 60, count), rng.uniform(60, 200, count),
+                              rng.uniform(5, 30, count), rng.uniform(10, 50, count)))
+    if n_lobes == 1:
+        params[:, 3] = params[:, 1] / 2 + rng.uniform(5, 40, count)
+    return params
+
+
+@pytest.mark.parametrize("n_lobes", [1, 2, 3, 4, 6, 12])
+def test_margins_match_built_contour(n_lobes):
+    rng = np.random.default_rng(11 + n_lobes)
+    params = random_params(rng, n_lobes)
+    batch = FlangeRules.margins(params, n_lobes)
+    for m, row in enumerate(params):
+        single = FlangeRules.margins(row, n_lobes)
+        for name, value in measured_margins(row, n_lobes).items():
+            assert single[name] == pytest.approx(value, rel=1e-13, abs=1e-13), name
+            assert batch[name][m] == single[name]
+
+
+def test_violations_follow_margins():
+    params = (90, 160, 28, 40)
+    assert FlangeRules.violations(params) == []
+    assert FlangeRules.feasible(np.array([params]))[0]
+    # Отвори майже на краю вуха: порушене лише правило стінки вуха
+    failed = FlangeRules.violations((30, 160, 76, 40))
+    assert len(failed) == 1 and failed[0][1] == pytest.approx(40 - 38 - MIN_WALL)